@@ -1,12 +1,13 @@
-"""Ein Agent CLI commands - entrypoint."""
+"""Ein Agent CLI commands - entrypoint.
+
+The Temporal client, pydantic models and rich rendering are imported
+inside the commands, so parsing arguments and --help stay fast.
+"""
 
 import asyncio
 
 import typer
 
-from ein_agent_cli.hitl_orchestrator import connect_hitl_workflow, run_hitl_workflow
-from ein_agent_cli.models import HITLWorkflowConfig
-
 app = typer.Typer(help='Ein Agent CLI - Interactive investigation')
 
 
@@ -47,6 +48,9 @@ def connect(
       # Connect with custom Temporal settings
       ein-agent-cli connect -w hitl-123 --temporal-host localhost:7233
     """
+    from ein_agent_cli.hitl_orchestrator import connect_hitl_workflow
+    from ein_agent_cli.models import HITLWorkflowConfig
+
     config = HITLWorkflowConfig.from_cli_args(
         temporal_host=temporal_host,
         temporal_namespace=temporal_namespace,
@@ -111,6 +115,9 @@ def investigate(
       /status           - Show workflow status
       /history          - Show conversation history
     """
+    from ein_agent_cli.hitl_orchestrator import run_hitl_workflow
+    from ein_agent_cli.models import HITLWorkflowConfig
+
     config = HITLWorkflowConfig.from_cli_args(
         temporal_host=temporal_host,
         temporal_namespace=temporal_namespace,
@@ -0,0 +1,74 @@
+"""Fail if CLI startup regresses.
+
+Measures `python -m ein_agent_cli --help` over several fresh processes
+(median) against a budget. With --profile, or when over budget, also
+prints the slowest imports from `python -X importtime`.
+
+Usage:
+    python scripts/startup_benchmark.py --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Budget in seconds, with headroom for slower CI machines
+HELP_BUDGET = 1.0
+
+HELP_COMMAND = [sys.executable, '-m', 'ein_agent_cli', '--help']
+
+
+def time_help(runs: int) -> float:
+    """Return the median wall time of `--help` in a fresh process."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(HELP_COMMAND, check=True, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def print_slowest_imports(top: int) -> None:
+    """Print the modules with the most cumulative import time during `--help`."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *HELP_COMMAND[1:]],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    records = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line.removeprefix('import time:').split('|', 2)
+        # Top-level imports only: nested ones are included in their parent
+        if not name.startswith('  ', 1):
+            records.append((int(cumulative_us) / 1e6, name.strip()))
+
+    print(f'\nSlowest top-level imports (cumulative, top {top}):')
+    for seconds, name in sorted(records, reverse=True)[:top]:
+        print(f'  {seconds:8.3f}s  {name}')
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=HELP_BUDGET)
+    parser.add_argument('--profile', action='store_true', help='Print the slowest imports')
+    parser.add_argument('--top', type=int, default=15, help='Imports to print')
+    args = parser.parse_args()
+
+    seconds = time_help(args.runs)
+    failed = seconds > args.budget
+    status = 'FAIL' if failed else 'ok'
+    print(f'--help: {seconds:6.3f}s (budget {args.budget:.3f}s) {status}')
+    if args.profile or failed:
+        print_slowest_imports(args.top)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,6 +11,7 @@ from temporalio import activity
 
 from ein_agent_worker.models.hitl import DEFAULT_MODEL
 from ein_agent_worker.utcp.config import UTCPConfig
+from ein_agent_worker.utcp.reload import get_reloader
 
 
 @activity.defn
@@ -59,3 +60,18 @@ async def load_worker_model() -> str:  # noqa: RUF029
     model = os.getenv('EIN_AGENT_MODEL', DEFAULT_MODEL)
     activity.logger.info('Loaded worker model configuration: %s', model)
     return model
+
+
+@activity.defn(name='utcp-reload-services')
+async def reload_utcp_services() -> dict[str, list[str]]:
+    """Reload UTCP services whose configuration changed on this worker.
+
+    Returns:
+        Service names by outcome: added, changed, removed, unchanged, failed.
+    """
+    reloader = get_reloader()
+    if reloader is None:
+        raise RuntimeError('UTCP service reload is not available outside the worker')
+    result = await reloader.reload()
+    activity.logger.info('Reloaded UTCP services: %s', result.to_dict())
+    return result.to_dict()
@@ -0,0 +1,75 @@
+"""LiteLLM model with Gemini compatibility fixes.
+
+Kept apart from the provider (gemini_litellm_provider.py) because importing
+LiteLLM takes seconds: the provider only imports this module when the first
+model is requested, so the worker does not pay for it at startup.
+"""
+
+from typing import Any
+
+from agents.extensions.models.litellm_model import LitellmModel
+
+
+class GeminiCompatibleLitellmModel(LitellmModel):
+    """LiteLLM model with Gemini-specific message handling.
+
+    This model intercepts the message list before sending to the API and ensures
+    that conversations always end with a user message to satisfy Gemini's API
+    requirements. This fix is only applied for Gemini models.
+    """
+
+    async def _fetch_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[Any],  # noqa: A002
+        model_settings: Any,
+        tools: list[Any],
+        output_schema: Any | None,
+        handoffs: list[Any],
+        span: Any,
+        tracing: Any,
+        stream: bool = False,
+        prompt: Any | None = None,
+    ) -> Any:
+        """Override to fix message ordering for Gemini.
+
+        Gemini requires that conversations end with a user message. During agent
+        handoffs, the OpenAI Agents SDK sends conversation history as an assistant
+        message, which violates this requirement.
+
+        This method detects when the input ends with an assistant message and
+        appends a synthetic user message to allow the conversation to proceed.
+        """
+        # Only apply the fix for Gemini models (e.g., "gemini/gemini-2.0-flash")
+        is_gemini = self.model.startswith('gemini/') or self.model.startswith('gemini-')
+
+        if is_gemini and isinstance(input, list) and input:
+            # Get the last message in the conversation
+            last_message = input[-1]
+
+            # Check if it's an assistant message (could be a dict or Pydantic model)
+            # Use hasattr to safely handle both dict and object-like messages
+            if hasattr(last_message, 'get') and last_message.get('role') == 'assistant':
+                # Append a synthetic user message to satisfy Gemini's requirements
+                # This message prompts the model to continue based on the handoff context
+                input = [  # noqa: A001
+                    *input,
+                    {
+                        'role': 'user',
+                        'content': 'Please continue with the task based on the context above.',
+                    },
+                ]
+
+        # Call the parent implementation with the (possibly modified) input
+        return await super()._fetch_response(
+            system_instructions=system_instructions,
+            input=input,
+            model_settings=model_settings,
+            tools=tools,
+            output_schema=output_schema,
+            handoffs=handoffs,
+            span=span,
+            tracing=tracing,
+            stream=stream,
+            prompt=prompt,
+        )
@@ -11,8 +11,15 @@ Architecture:
   - get_{service}_operation_details: Get parameter schema for an operation
   - call_{service}_operation: Execute an API operation
 - This keeps agent context small while enabling dynamic API discovery
+
+The workflow tools and activities (temporal_utcp) are imported on first
+access: they pull in the OpenAI Agents SDK, which takes seconds to import
+and is not needed to initialize the UTCP clients.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from ein_agent_worker.utcp import registry
 from ein_agent_worker.utcp.config import (
     DEFAULT_VERSIONS,
@@ -27,9 +34,7 @@ from ein_agent_worker.utcp.config import (
 from ein_agent_worker.utcp.loader import ToolLoader, create_utcp_tools
 from ein_agent_worker.utcp.local_file_protocol import (
     LocalFileHttpProtocol,
-    get_api_base_url,
     register_local_file_protocol,
-    set_api_base_url,
 )
 from ein_agent_worker.utcp.openapi_handlers import (
     DEFAULT_OPENAPI_HANDLERS,
@@ -39,6 +44,7 @@ from ein_agent_worker.utcp.openapi_handlers import (
     KubernetesOpenApiHandler,
     OpenApiHandler,
 )
+from ein_agent_worker.utcp.service_context import get_api_base_url, set_api_base_url
 from ein_agent_worker.utcp.spec import (
     LiveURLStrategy,
     LocalFileStrategy,
@@ -46,10 +52,20 @@ from ein_agent_worker.utcp.spec import (
     SpecSourceStrategy,
 )
 from ein_agent_worker.utcp.ssl_config import SSLConfigManager
-from ein_agent_worker.utcp.temporal_utcp import (
-    create_utcp_workflow_tools,
-    get_utcp_activities,
-)
+
+if TYPE_CHECKING:
+    from ein_agent_worker.utcp.temporal_utcp import (
+        create_unified_search_tool,
+        create_utcp_workflow_tools,
+        get_utcp_activities,
+    )
+
+# Maps exported name -> module it is imported from on first access
+_LAZY_EXPORTS = {
+    'create_unified_search_tool': 'ein_agent_worker.utcp.temporal_utcp',
+    'create_utcp_workflow_tools': 'ein_agent_worker.utcp.temporal_utcp',
+    'get_utcp_activities': 'ein_agent_worker.utcp.temporal_utcp',
+}
 
 __all__ = [
     'DEFAULT_OPENAPI_HANDLERS',
@@ -73,6 +89,7 @@ __all__ = [
     'ToolLoader',
     'UTCPConfig',
     'UTCPServiceConfig',
+    'create_unified_search_tool',
     'create_utcp_tools',
     'create_utcp_workflow_tools',
     'get_api_base_url',
@@ -81,3 +98,11 @@ __all__ = [
     'registry',
     'set_api_base_url',
 ]
+
+
+def __getattr__(name: str):
+    """Import the lazily exported names on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module), name)
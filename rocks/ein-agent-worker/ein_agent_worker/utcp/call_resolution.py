@@ -0,0 +1,245 @@
+"""Near-miss correction of UTCP operation calls.
+
+Models often call an operation by a slightly wrong name: in the wrong case,
+without the service prefix, with list and read confused, or as
+'list_labels' instead of 'list-labels'. Arguments can be off in the same
+way: '10' for an integer, 'LabelSelector' for 'labelSelector'. Each failure
+costs more turns re-searching. Instead, call_{service}_operation corrects
+what it can resolve with confidence and reports the corrections.
+
+Names are resolved in order:
+
+    1. exact name
+    2. with the service prefix added, fixed or replaced
+    3. exact normalized name: lower-cased, punctuation dropped
+       (kubernetes.ListCoreV1NamespacedPod, loki.list_labels)
+    4. verb swapped between list, read and get, when the arguments then
+       fill the operation's path variables (listCoreV1NamespacedPod with a
+       'name' argument -> readCoreV1NamespacedPod)
+    5. closest normalized name by edit distance, if similar enough
+       (FUZZY_CUTOFF) and clearly closer than the runner-up (FUZZY_MARGIN)
+
+A correction never changes whether the call needs approval: approval is
+decided on the requested name, before the call (see approval.py), so the
+resolved operation must have the same method as the requested one, or
+both must be reads.
+
+Arguments are checked against the operation's input schema: unknown names
+are mapped to the parameter they differ from only in case or separators,
+and scalars are converted to the parameter's type when that is lossless
+('10' -> 10, 3 -> '3', 'x' -> ['x']), as are enum values in the wrong
+case. Booleans are query or path parameters, which the HTTP client only
+takes as strings, so they are always passed as 'true' or 'false', even
+for operations without a parameter schema (True -> 'true', and for a
+boolean parameter 'False' -> 'false').
+"""
+
+import difflib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ein_agent_worker.utcp.approval import READ_HTTP_METHODS, extract_http_method_from_operation
+from utcp.data.tool import Tool
+
+if TYPE_CHECKING:
+    from ein_agent_worker.utcp.catalog import OperationCatalog
+
+# Minimum similarity (difflib ratio of normalized names) of a fuzzy match
+FUZZY_CUTOFF = 0.85
+
+# Minimum lead of the best fuzzy match over the runner-up
+FUZZY_MARGIN = 0.03
+
+# Verbs models confuse with each other
+_INTERCHANGEABLE_VERBS = ('list', 'read', 'get')
+
+_PATH_VARIABLE_RE = re.compile(r'{([^{}]+)}')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_BOOLEANS = ('true', 'false')
+
+
+@dataclass
+class Resolution:
+    """The result of resolving an operation name.
+
+    Attributes:
+        tool: The resolved operation, or None
+        corrections: What was corrected, for the response
+        candidates: Close names, when none could be chosen with confidence
+    """
+
+    tool: Tool | None = None
+    corrections: list[str] = field(default_factory=list)
+    candidates: list[str] = field(default_factory=list)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an operation name (without service prefix) for near-miss lookups."""
+    return _NON_ALNUM_RE.sub('', name.lower())
+
+
+def _path_variables(tool: Tool) -> set[str]:
+    return set(_PATH_VARIABLE_RE.findall(getattr(tool.tool_call_template, 'url', '') or ''))
+
+
+def _same_approval(requested: str, resolved: str) -> bool:
+    requested_method = extract_http_method_from_operation(requested)
+    resolved_method = extract_http_method_from_operation(resolved)
+    if requested_method == resolved_method:
+        return True
+    return requested_method in READ_HTTP_METHODS and resolved_method in READ_HTTP_METHODS
+
+
+def resolve_operation(
+    catalog: 'OperationCatalog', tool_name: str, arguments: dict[str, Any]
+) -> Resolution:
+    """Resolve a possibly mistyped operation name.
+
+    Args:
+        catalog: The service's catalog
+        tool_name: The name the model requested
+        arguments: The call's arguments (to tell list from read)
+
+    Returns:
+        The resolution; its tool is None if no operation was found with
+        confidence
+    """
+    tool = catalog.get(tool_name)
+    if tool is not None:
+        return Resolution(tool)
+
+    # Whatever the prefix, resolve within this service (the caller rejects
+    # names of other registered services)
+    prefix = f'{catalog.service_name}.'
+    operation = tool_name.partition('.')[2] or tool_name
+
+    def resolved(name: str) -> Resolution:
+        if not _same_approval(tool_name, name):
+            return Resolution(candidates=[name])
+        return Resolution(catalog.get(name), [f"tool_name '{tool_name}' -> '{name}'"])
+
+    if catalog.get(prefix + operation) is not None:
+        return resolved(prefix + operation)
+
+    key = normalize_name(operation)
+    names = catalog.normalized_names.get(key, [])
+    if len(names) == 1:
+        return resolved(names[0])
+    if names:
+        return Resolution(candidates=names)
+
+    # list <-> read <-> get, if the arguments fit the operation's path
+    verb = next((verb for verb in _INTERCHANGEABLE_VERBS if key.startswith(verb)), '')
+    if verb:
+        fitting = [
+            name
+            for other in _INTERCHANGEABLE_VERBS
+            if other != verb
+            for name in catalog.normalized_names.get(other + key[len(verb) :], [])
+            if _path_variables(catalog.get(name)) <= arguments.keys()
+        ]
+        if len(fitting) == 1:
+            return resolved(fitting[0])
+
+    # Closest by edit distance, if clearly closest
+    matcher = difflib.SequenceMatcher(b=key, autojunk=False)
+    scored = []
+    for other in catalog.normalized_names:
+        matcher.set_seq1(other)
+        if (
+            matcher.real_quick_ratio() >= FUZZY_CUTOFF
+            and matcher.quick_ratio() >= FUZZY_CUTOFF
+            and (ratio := matcher.ratio()) >= FUZZY_CUTOFF
+        ):
+            scored.append((ratio, other))
+    scored.sort(reverse=True)
+    candidates = [name for _, other in scored[:5] for name in catalog.normalized_names[other]]
+    clear_lead = len(scored) == 1 or (
+        len(scored) > 1 and scored[0][0] - scored[1][0] >= FUZZY_MARGIN
+    )
+    if clear_lead and len(catalog.normalized_names[scored[0][1]]) == 1:
+        return resolved(candidates[0])
+    return Resolution(candidates=candidates)
+
+
+def _coerce_value(value: Any, schema: dict) -> Any:
+    """Convert a value to a schema's type, if lossless; otherwise return it unchanged."""
+    schema_type = schema.get('type')
+    if isinstance(value, str):
+        text = value.strip()
+        if schema_type == 'integer' and re.fullmatch(r'[+-]?\d+', text):
+            return int(text)
+        if schema_type == 'number':
+            try:
+                return float(text) if any(c in text for c in '.eE') else int(text)
+            except ValueError:
+                return value
+        if schema_type == 'boolean' and text.lower() in _BOOLEANS:
+            return text.lower()
+        enum = schema.get('enum')
+        if enum and value not in enum:
+            matches = [option for option in enum if str(option).lower() == text.lower()]
+            if len(matches) == 1:
+                return matches[0]
+    elif isinstance(value, bool):
+        if schema_type in ('string', 'boolean'):
+            return 'true' if value else 'false'
+    elif isinstance(value, float):
+        if schema_type == 'integer' and value.is_integer():
+            return int(value)
+        if schema_type == 'string':
+            return str(int(value)) if value.is_integer() else str(value)
+    elif isinstance(value, int):
+        if schema_type == 'string':
+            return str(value)
+    if schema_type == 'array' and not isinstance(value, list):
+        return [_coerce_value(value, schema.get('items') or {})]
+    return value
+
+
+def _as_query_value(value: Any) -> Any:
+    """Pass a boolean, or a list's booleans, as 'true' or 'false'."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return [_as_query_value(item) for item in value]
+    return value
+
+
+def coerce_arguments(arguments: dict[str, Any], schema: dict) -> tuple[dict[str, Any], list[str]]:
+    """Fix argument names and types against an operation's input schema.
+
+    Args:
+        arguments: The call's arguments
+        schema: The operation's serialized input schema
+
+    Returns:
+        The corrected arguments and the corrections made
+    """
+    arguments = {name: _as_query_value(value) for name, value in arguments.items()}
+    properties = schema.get('properties') or {}
+    if not properties:
+        return arguments, []
+
+    by_key: dict[str, list[str]] = {}
+    for name in properties:
+        by_key.setdefault(normalize_name(name), []).append(name)
+
+    corrected: dict[str, Any] = {}
+    corrections = []
+    for name, value in arguments.items():
+        if name not in properties:
+            names = by_key.get(normalize_name(name), [])
+            if len(names) == 1 and names[0] not in arguments:
+                corrections.append(f"argument '{name}' -> '{names[0]}'")
+                name = names[0]
+        prop = properties.get(name)
+        if isinstance(prop, dict):
+            coerced = _coerce_value(value, prop)
+            if coerced != value or type(coerced) is not type(value):
+                corrections.append(f'{name}: {json.dumps(value)} -> {json.dumps(coerced)}')
+                value = coerced
+        corrected[name] = value
+    return corrected, corrections
@@ -0,0 +1,365 @@
+"""Process-wide, versioned catalog of each UTCP service's operations.
+
+UtcpClient hands out deep copies of its tools (search_tools, get_tools),
+so listing or searching through it re-materializes every operation and
+schema on each call, and the copies no longer share schemas between
+clusters. Instead, the protocol stages the registered manual (the tool
+objects the client's repository keeps) and its indexes in the client's
+service context (see service_context.py). prepare() builds the catalog
+from them in a worker thread, and registry.register_client publishes it
+as the service's catalog, applying the rest of the context at the same
+time. Every activity reads that one catalog; it is replaced
+only when the service's client is.
+
+Each published catalog gets a process-wide unique version, so anything
+derived from a catalog can be keyed by (service, version). Catalogs look
+operations up by name in constant time and serialize each operation's
+parameter schema, and its compact summary, once. Searches rank
+operations by keyword (BM25, see search.py) boosted by TF-IDF similarity
+to the query (see semantic.py), so natural-language queries find
+operations sharing few of their words.
+
+Serialized parameter schemas and summaries are kept for the most
+recently requested operations only: a catalog of thousands of operations
+would otherwise end up holding every schema twice, as objects and as
+dicts.
+
+Catalog tools are shared with the client: treat them as read-only.
+
+Configuration:
+    UTCP_CATALOG_CACHE_SIZE: Serialized parameter schemas, and summaries,
+        kept per catalog (default: 256)
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import weakref
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from ein_agent_worker.utcp import service_context
+from ein_agent_worker.utcp.call_resolution import normalize_name
+from ein_agent_worker.utcp.facets import operation_resources
+from ein_agent_worker.utcp.kubernetes_operations import KubernetesOperationIndex
+from ein_agent_worker.utcp.lazy_schema import resolve_inputs
+from ein_agent_worker.utcp.lru import LRUCache
+from ein_agent_worker.utcp.parameter_summary import summarize_parameters
+from ein_agent_worker.utcp.search import SearchIndex
+from utcp.data.tool import Tool
+from utcp.utcp_client import UtcpClient
+
+if TYPE_CHECKING:
+    from ein_agent_worker.utcp.semantic import SemanticIndex
+
+logger = logging.getLogger(__name__)
+
+# Weight of the semantic similarity (0..1) in search scores, relative to a
+# keyword match on a term found in a single operation
+SEMANTIC_WEIGHT = 1.0
+
+DEFAULT_CATALOG_CACHE_SIZE = 256
+
+# Source of catalog versions
+_versions = itertools.count(1)
+
+# Maps service_name -> catalog of its registered client
+_catalogs: dict[str, 'OperationCatalog'] = {}
+
+# Maps client -> service_name -> (service context, catalog) built by
+# prepare(), until the client is registered for the service
+_prepared: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Maps client -> catalog built from its tools, for clients that staged none
+_built: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _catalog_cache_size_from_env() -> int:
+    value = os.getenv('UTCP_CATALOG_CACHE_SIZE', str(DEFAULT_CATALOG_CACHE_SIZE))
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            'Invalid UTCP_CATALOG_CACHE_SIZE %r, using default %d',
+            value,
+            DEFAULT_CATALOG_CACHE_SIZE,
+        )
+        return DEFAULT_CATALOG_CACHE_SIZE
+
+
+def _new_cache() -> LRUCache:
+    return LRUCache(_catalog_cache_size_from_env())
+
+
+@dataclass(frozen=True)
+class OperationCatalog:
+    """The operations of one registered client.
+
+    Attributes:
+        service_name: The service name
+        version: Process-wide unique catalog version
+        client: The client the operations belong to
+        tools: Registered tools, in registration order (shared, read-only)
+        index: Search index whose positions are tool positions
+        semantic: Semantic index whose positions are tool positions
+        kubernetes: Kubernetes operation index shared with other services
+            loading the same spec, if any (see kubernetes_operations)
+        by_name: Maps full tool name -> tool
+    """
+
+    service_name: str
+    version: int
+    client: UtcpClient
+    tools: list[Tool]
+    index: SearchIndex
+    semantic: 'SemanticIndex'
+    kubernetes: KubernetesOperationIndex | None = field(default=None, repr=False)
+    by_name: dict[str, Tool] = field(init=False, repr=False)
+    # Maps tool name -> serialized parameter schema, for recently requested tools
+    _parameters: LRUCache = field(default_factory=_new_cache, init=False, repr=False)
+    # Maps tool name -> parameter summaries, for recently requested tools
+    _summaries: LRUCache = field(default_factory=_new_cache, init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'by_name', {tool.name: tool for tool in self.tools})
+
+    def get(self, tool_name: str) -> Tool | None:
+        """Look up an operation by its full name."""
+        return self.by_name.get(tool_name)
+
+    @cached_property
+    def resources(self) -> list[str]:
+        """The resource of each operation, in tool order (see facets.py)."""
+        return operation_resources(self.tools)
+
+    @cached_property
+    def normalized_names(self) -> dict[str, list[str]]:
+        """Maps normalized operation name (see call_resolution.py) -> full tool names."""
+        names: dict[str, list[str]] = {}
+        prefix = f'{self.service_name}.'
+        for tool in self.tools:
+            names.setdefault(normalize_name(tool.name.removeprefix(prefix)), []).append(tool.name)
+        return names
+
+    @cached_property
+    def kubernetes_operations(self) -> KubernetesOperationIndex:
+        """Group/version/kind index of the operations (of a Kubernetes service)."""
+        if self.kubernetes is not None:
+            return self.kubernetes
+        return KubernetesOperationIndex.from_tools(self.tools, f'{self.service_name}.')
+
+    async def parameters(self, tool: Tool) -> dict:
+        """Get an operation's serialized parameter schema.
+
+        Serialized on first request, and again if it was evicted since; in
+        lazy mode, the schema is resolved on the first request.
+
+        Args:
+            tool: An operation of this catalog
+
+        Returns:
+            The input schema as a dict (shared: do not modify)
+        """
+        parameters = self._parameters.get(tool.name)
+        if parameters is None:
+            inputs = await resolve_inputs(self.service_name, tool)
+            parameters = serialize_schema(inputs)
+            self._parameters.put(tool.name, parameters)
+        return parameters
+
+    async def parameter_summaries(self, tool: Tool) -> list[dict]:
+        """Get compact summaries of an operation's parameters (see parameter_summary.py).
+
+        Computed on first request, and again if it was evicted since.
+
+        Args:
+            tool: An operation of this catalog
+
+        Returns:
+            One summary per parameter, required first (shared: do not modify)
+        """
+        summaries = self._summaries.get(tool.name)
+        if summaries is None:
+            parameters = await self.parameters(tool)
+            summaries = summarize_parameters(tool, parameters)
+            self._summaries.put(tool.name, summaries)
+        return summaries
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[float, Tool]]:
+        """Rank the operations against a query.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results (default: all matches)
+
+        Returns:
+            (score, tool) pairs, best first
+        """
+        ranked = self.index.rank(query, limit, self._boosts(query))
+        return [(score, self.tools[position]) for score, position in ranked]
+
+    def match(self, query: str, limit: int | None = None) -> list[tuple[int, float, Tool]]:
+        """Rank the operations for merging with other catalogs' (see SearchIndex.match).
+
+        Args:
+            query: The search query
+            limit: Maximum number of results (default: all matches)
+
+        Returns:
+            (matched query terms, scaled score, tool) triples, best first
+        """
+        return [
+            (matched, score, self.tools[position])
+            for matched, score, position in self.index.match(query, limit, self._boosts(query))
+        ]
+
+    def _boosts(self, query: str) -> dict[int, float]:
+        return {
+            position: SEMANTIC_WEIGHT * similarity
+            for position, similarity in self.semantic.scores(query).items()
+        }
+
+
+def serialize_schema(obj: Any) -> Any:
+    """Recursively serialize JsonSchema objects to dicts, dropping None values."""
+    if hasattr(obj, 'model_dump'):
+        return serialize_schema(obj.model_dump())
+    if isinstance(obj, dict):
+        return {k: serialize_schema(v) for k, v in obj.items() if v is not None}
+    if isinstance(obj, list):
+        return [serialize_schema(item) for item in obj]
+    return obj
+
+
+def _build(
+    service_name: str,
+    client: UtcpClient,
+    tools: list[Tool],
+    index: SearchIndex | None,
+    semantic: 'SemanticIndex | None',
+    kubernetes: KubernetesOperationIndex | None = None,
+) -> OperationCatalog:
+    from ein_agent_worker.utcp.semantic import SemanticIndex
+
+    # The indexes must list exactly the registered tools, in order
+    names = [tool.name for tool in tools]
+    if index is None or index.names != names:
+        index = SearchIndex.from_tools(tools, f'{service_name}.')
+        kubernetes = None
+    if semantic is None or semantic.names != names:
+        semantic = SemanticIndex.from_tools(tools, f'{service_name}.')
+    return OperationCatalog(
+        service_name, next(_versions), client, tools, index, semantic, kubernetes
+    )
+
+
+def _build_from_context(
+    service_name: str, client: UtcpClient, context: service_context.ServiceContext | None
+) -> OperationCatalog | None:
+    if context is None or context.manual is None:
+        return None
+    return _build(
+        service_name,
+        client,
+        context.manual.tools,
+        context.index,
+        context.semantic,
+        context.kubernetes,
+    )
+
+
+async def prepare(service_name: str, client: UtcpClient) -> None:
+    """Build the catalog a newly created client will publish, off the event loop.
+
+    The catalog re-indexes the operations when the client registered
+    other tools than the protocol indexed, so it is built in a worker
+    thread before the client is registered, not by publish().
+
+    Args:
+        service_name: The service name
+        client: The client about to be registered for the service
+    """
+    context = service_context.take(client, service_name)
+    catalog = await asyncio.to_thread(_build_from_context, service_name, client, context)
+    _prepared.setdefault(client, {})[service_name] = (context, catalog)
+
+
+def publish(service_name: str, client: UtcpClient) -> OperationCatalog | None:
+    """Replace a service's catalog with the one prepared for its newly registered client.
+
+    Also applies the client's service context, so the service's pool,
+    settings and schema resolver change together with its operations.
+    A client registered without prepare() has its catalog built here,
+    on the caller's thread.
+
+    Args:
+        service_name: The service name
+        client: The client being registered for the service
+
+    Returns:
+        The new catalog, or None if the client staged no manual for the
+        service (the catalog is then built on first use)
+    """
+    context = service_context.take(client, service_name)
+    if context is not None:
+        logger.debug('[%s] Building the catalog of a client registered unprepared', service_name)
+        catalog = _build_from_context(service_name, client, context)
+        _prepared.setdefault(client, {})[service_name] = (context, catalog)
+    context, catalog = _prepared.get(client, {}).pop(service_name, (None, None))
+
+    # Nothing the new client built is visible before this point
+    if context is not None:
+        context.apply()
+    if catalog is None:
+        _catalogs.pop(service_name, None)
+        return None
+    _catalogs[service_name] = catalog
+    logger.info(
+        '[%s] Published operation catalog v%d (%d operations)',
+        service_name,
+        catalog.version,
+        len(catalog.tools),
+    )
+    return catalog
+
+
+def discard(client: UtcpClient) -> None:
+    """Drop what a client built and prepared, when it will not be registered."""
+    _prepared.pop(client, None)
+    service_context.discard(client)
+
+
+def drop(service_name: str) -> None:
+    """Drop a service's catalog (when its client is unregistered)."""
+    _catalogs.pop(service_name, None)
+
+
+async def get_catalog(service_name: str, client: UtcpClient) -> OperationCatalog:
+    """Get the catalog of a service's client.
+
+    Args:
+        service_name: The service name
+        client: The client looked up for the service
+
+    Returns:
+        The published catalog, or for a client registered without one, a
+        catalog built once from its tools
+    """
+    for catalog in (_catalogs.get(service_name), _built.get(client)):
+        if catalog is not None and catalog.client is client:
+            return catalog
+
+    # Copies the tools, but only once per client
+    tools = await client.config.tool_repository.get_tools_by_manual(service_name) or []
+    catalog = _built[client] = await asyncio.to_thread(
+        _build, service_name, client, tools, None, None
+    )
+    logger.info(
+        '[%s] Built operation catalog v%d from the client (%d operations)',
+        service_name,
+        catalog.version,
+        len(tools),
+    )
+    return catalog
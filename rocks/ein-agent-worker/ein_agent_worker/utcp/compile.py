@@ -0,0 +1,113 @@
+"""Compile raw OpenAPI specs into bundles the worker loads at startup.
+
+For every raw spec under specs/<service>/, writes
+specs/<service>/<version>.bundle.json next to it (see spec/bundle.py).
+find_spec_file() prefers bundles, so a worker shipping them does no spec
+parsing, filtering or conversion at startup.
+
+Usage:
+    python -m ein_agent_worker.utcp.compile [--specs-dir DIR] [SERVICE ...]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from ein_agent_worker.utcp.loader import DEFAULT_SPECS_DIR
+from ein_agent_worker.utcp.openapi_handlers import DEFAULT_OPENAPI_HANDLERS
+from ein_agent_worker.utcp.openapi_handlers.default import DefaultOpenApiHandler
+from ein_agent_worker.utcp.spec.bundle import (
+    BundleError,
+    bundle_path_for,
+    compile_bundle,
+    is_bundle,
+    write_bundle,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def compile_service(specs_dir: Path, service_name: str) -> int:
+    """Compile every raw spec of a service.
+
+    Args:
+        specs_dir: Directory containing spec files organized by service.
+        service_name: Service name (e.g., 'kubernetes').
+
+    Returns:
+        Number of bundles written.
+    """
+    handler = DEFAULT_OPENAPI_HANDLERS.get(service_name, DefaultOpenApiHandler(service_name))
+    written = 0
+
+    for spec_path in sorted((specs_dir / service_name).iterdir()):
+        if spec_path.suffix not in ['.json', '.yaml', '.yml'] or is_bundle(spec_path):
+            continue
+
+        start = time.perf_counter()
+        try:
+            bundle = compile_bundle(spec_path, service_name, handler)
+        except BundleError as e:
+            logger.warning('[%s] Skipping %s: %s', service_name, spec_path.name, e)
+            continue
+
+        bundle_path = bundle_path_for(spec_path)
+        write_bundle(bundle, bundle_path)
+        written += 1
+        logger.info(
+            '[%s] Compiled %s -> %s: %d operations, %d schemas, %d -> %d bytes in %.2fs',
+            service_name,
+            spec_path.name,
+            bundle_path.name,
+            len(bundle['operations']),
+            len(bundle['schemas']),
+            spec_path.stat().st_size,
+            bundle_path.stat().st_size,
+            time.perf_counter() - start,
+        )
+
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compile spec bundles.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m ein_agent_worker.utcp.compile',
+        description='Compile OpenAPI specs into pre-indexed UTCP tool bundles.',
+    )
+    parser.add_argument(
+        '--specs-dir',
+        type=Path,
+        default=DEFAULT_SPECS_DIR,
+        help='Directory containing specs/<service>/<version> files',
+    )
+    parser.add_argument('services', nargs='*', help='Services to compile (default: all)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # Per-operation filtering logs are noise here
+    logging.getLogger('ein_agent_worker.utcp.openapi_handlers').setLevel(logging.WARNING)
+
+    services = args.services or sorted(p.name for p in args.specs_dir.iterdir() if p.is_dir())
+    written = 0
+    for service_name in services:
+        if not (args.specs_dir / service_name).is_dir():
+            logger.error('No spec directory for %s in %s', service_name, args.specs_dir)
+            return 1
+        written += compile_service(args.specs_dir, service_name)
+
+    logger.info('Wrote %d bundle(s)', written)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,14 @@ Configuration Format:
     UTCP_{SERVICE}_ENABLED: Enable/disable the service (default: true)
     UTCP_{SERVICE}_VERSION: Version of the spec to use (default: latest supported)
     UTCP_{SERVICE}_SPEC_SOURCE: Where to load OpenAPI spec - 'local' or 'live' (default: local)
+    UTCP_{SERVICE}_INIT_TIMEOUT: Seconds allowed for client initialization (default: 120)
+    UTCP_{SERVICE}_CRITICAL: Wait for this service before polling tasks (default: true)
+    UTCP_{SERVICE}_LAZY_SCHEMAS: Resolve operation schemas on first use (default: false)
+    UTCP_{SERVICE}_TYPE: Service type whose specs, handler and auth rules to use
+        (default: the service name)
+    UTCP_CONFIG_FILE: Optional KEY=VALUE file of UTCP_* settings overlaying the
+        environment; re-read on every load, so services can be reloaded from it
+        (see reload.py)
 
 Example (Kubernetes with kubeconfig):
     export UTCP_SERVICES="kubernetes,grafana"
@@ -19,6 +27,14 @@ Example (Kubernetes with kubeconfig):
     export UTCP_KUBERNETES_INSECURE="true"
     export UTCP_KUBERNETES_VERSION="1.35"
 
+Example (two Kubernetes clusters sharing one spec):
+    export UTCP_SERVICES="k8s_prod,k8s_staging"
+    export UTCP_K8S_PROD_TYPE="kubernetes"
+    export UTCP_K8S_PROD_OPENAPI_URL="https://10.0.0.1:6443/openapi/v2"
+    export UTCP_K8S_STAGING_TYPE="kubernetes"
+    export UTCP_K8S_STAGING_OPENAPI_URL="https://10.0.1.1:6443/openapi/v2"
+    (plus AUTH_TYPE/KUBECONFIG_CONTENT for each)
+
 Example (Grafana with bearer token):
     export UTCP_GRAFANA_OPENAPI_URL="https://grafana.example.com/api/swagger.json"
     export UTCP_GRAFANA_AUTH_TYPE="bearer"
@@ -29,6 +45,7 @@ import logging
 import os
 from dataclasses import dataclass, field
 from enum import StrEnum
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +254,67 @@ def _validate_bearer_auth(service_name: str, service_key: str) -> bool:
     return True
 
 
+# =============================================================================
+# Config File Overlay
+# =============================================================================
+
+# Maps variables set from UTCP_CONFIG_FILE -> their value before the file set them
+_config_file_originals: dict[str, str | None] = {}
+
+
+def _parse_env_file(text: str) -> dict[str, str]:
+    """Parse KEY=VALUE lines (with optional 'export ' and quotes, '#' comments)."""
+    values = {}
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.removeprefix('export ').split('=', 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        values[key.strip()] = value
+    return values
+
+
+def _apply_config_file() -> None:
+    """Overlay UTCP_* variables from UTCP_CONFIG_FILE onto the environment.
+
+    Variables the file no longer sets get their previous value back, so
+    removing a line from the file undoes it on the next load.
+    """
+    path = os.getenv('UTCP_CONFIG_FILE', '')
+    if not path:
+        return
+    try:
+        values = _parse_env_file(Path(path).read_text())
+    except OSError as e:
+        logger.warning('Cannot read UTCP_CONFIG_FILE %s, keeping previous settings: %s', path, e)
+        return
+
+    for key in list(values):
+        if not key.startswith('UTCP_') or key == 'UTCP_CONFIG_FILE':
+            logger.warning('Ignoring %s in %s: only UTCP_* settings are allowed', key, path)
+            del values[key]
+
+    for key, original in list(_config_file_originals.items()):
+        if key not in values:
+            if original is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = original
+            del _config_file_originals[key]
+
+    for key, value in values.items():
+        if key not in _config_file_originals:
+            _config_file_originals[key] = os.environ.get(key)
+        os.environ[key] = value
+
+
+# Default pooled connections per host of a service (see http_pool.py)
+DEFAULT_MAX_CONNECTIONS = 16
+
+
 @dataclass
 class UTCPServiceConfig:
     """Configuration for a single UTCP service.
@@ -251,6 +329,18 @@ class UTCPServiceConfig:
         version: Version of the OpenAPI spec to use (e.g., '1.30', 'reef', '11')
         dynamic: If True, generate tools at runtime from OpenAPI URL
         approval_policy: Policy for requiring human approval (never, always, write_operations)
+        spec_source: Where to load the spec from ('local' or 'live')
+        init_timeout: Seconds allowed for client initialization at worker startup
+        critical: If True, the worker waits for this service before polling tasks;
+            otherwise it finishes initializing in the background
+        lazy_schemas: If True, only an operation index is built at startup and
+            input schemas are resolved from the spec on first use
+        service_type: Service type (e.g., 'kubernetes') selecting the spec files,
+            OpenAPI handler and supported auth types; several services (one per
+            cluster) may share a type
+        kubeconfig_content: Base64-encoded kubeconfig (when auth_type='kubeconfig'),
+            kept so a rotated kubeconfig shows up as a config change on reload
+        max_connections: Pooled connections per host for operation calls
     """
 
     name: str
@@ -263,6 +353,12 @@ class UTCPServiceConfig:
     dynamic: bool = False
     approval_policy: str = 'always'  # Default: require approval for all operations (safest)
     spec_source: str = 'local'  # Where to load spec: 'local' or 'live'
+    init_timeout: float = 120.0
+    critical: bool = True
+    lazy_schemas: bool = False
+    service_type: str = ''
+    kubeconfig_content: str = field(default='', repr=False)
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
 
 
 @dataclass
@@ -275,6 +371,7 @@ class UTCPConfig:
     def from_env(cls) -> 'UTCPConfig':
         """Load UTCP configuration from environment variables."""
         config = cls()
+        _apply_config_file()
         services_str = os.getenv('UTCP_SERVICES', '')
 
         if not services_str:
@@ -311,6 +408,10 @@ class UTCPConfig:
         """Load configuration for a single UTCP service."""
         service_key = service_name.upper().replace('-', '_')
 
+        # Get service type (several clusters of one type share its specs and handler)
+        service_type_key = f'UTCP_{service_key}_TYPE'
+        service_type = os.getenv(service_type_key, '').strip().lower() or service_name
+
         # Check if enabled
         enabled_key = f'UTCP_{service_key}_ENABLED'
         enabled = os.getenv(enabled_key, 'true').lower() == 'true'
@@ -332,7 +433,7 @@ class UTCPConfig:
         auth_type = os.getenv(auth_type_key, 'proxy').lower()
 
         # Validate auth type against service-specific supported types
-        supported_auth_types = _get_supported_auth_types(service_name)
+        supported_auth_types = _get_supported_auth_types(service_type)
         if auth_type not in supported_auth_types:
             logger.error(
                 "UTCP service '%s' has invalid auth type '%s' (supported: %s)",
@@ -385,7 +486,7 @@ class UTCPConfig:
         spec_source = os.getenv(spec_source_key, 'local').lower()
 
         supported_spec_sources = SERVICE_SPEC_SOURCES.get(
-            service_name, SERVICE_SPEC_SOURCES['_default']
+            service_type, SERVICE_SPEC_SOURCES['_default']
         )
         if spec_source not in supported_spec_sources:
             logger.warning(
@@ -397,6 +498,39 @@ class UTCPConfig:
             )
             spec_source = 'local'
 
+        # Get startup initialization timeout (seconds)
+        init_timeout_key = f'UTCP_{service_key}_INIT_TIMEOUT'
+        try:
+            init_timeout = float(os.getenv(init_timeout_key, '120'))
+        except ValueError:
+            logger.warning(
+                "UTCP service '%s' has invalid %s, using default 120 seconds",
+                service_name,
+                init_timeout_key,
+            )
+            init_timeout = 120.0
+
+        # Get critical flag (worker waits for critical services before polling)
+        critical_key = f'UTCP_{service_key}_CRITICAL'
+        critical = os.getenv(critical_key, 'true').lower() == 'true'
+
+        # Get lazy schema flag (build operation index only, resolve schemas on demand)
+        lazy_schemas_key = f'UTCP_{service_key}_LAZY_SCHEMAS'
+        lazy_schemas = os.getenv(lazy_schemas_key, 'false').lower() == 'true'
+
+        # Get the connection pool size (per host)
+        max_connections_key = f'UTCP_{service_key}_MAX_CONNECTIONS'
+        try:
+            max_connections = int(os.getenv(max_connections_key, str(DEFAULT_MAX_CONNECTIONS)))
+        except ValueError:
+            logger.warning(
+                "UTCP service '%s' has invalid %s, using default %d",
+                service_name,
+                max_connections_key,
+                DEFAULT_MAX_CONNECTIONS,
+            )
+            max_connections = DEFAULT_MAX_CONNECTIONS
+
         return UTCPServiceConfig(
             name=service_name,
             openapi_url=openapi_url,
@@ -408,6 +542,12 @@ class UTCPConfig:
             dynamic=dynamic,
             approval_policy=approval_policy,
             spec_source=spec_source,
+            init_timeout=init_timeout,
+            critical=critical,
+            lazy_schemas=lazy_schemas,
+            service_type=service_type,
+            kubeconfig_content=os.getenv(f'UTCP_{service_key}_KUBECONFIG_CONTENT', ''),
+            max_connections=max_connections,
         )
 
     @property
@@ -0,0 +1,105 @@
+"""Facets of UTCP operations: the resource each operation acts on.
+
+Listing a whole service (hundreds of Kubernetes operations with their
+descriptions) costs more LLM input than most investigations. Facets let
+an agent drill down instead: a tag -> resource tree with operation counts
+(for Kubernetes, group/version -> resource, e.g. core_v1 -> pods), then
+the operations of one tag or resource.
+
+An operation's resource is derived from its URL path: the path segments
+all the service's operations share (the base URL) and those up to the
+API version are dropped, as are Kubernetes' watch and namespace scoping,
+and the first remaining literal segment is the resource:
+
+    /api/v1/namespaces/{namespace}/pods/{name}/log  -> pods
+    /apis/apps/v1/watch/namespaces/{namespace}/deployments  -> deployments
+    /api/dashboards/uid/{uid} (Grafana, base /api)  -> dashboards
+"""
+
+import re
+from collections.abc import Sequence
+from urllib.parse import urlparse
+
+from utcp.data.tool import Tool
+
+# Facet of operations without tags, or without a resource (API roots)
+UNTAGGED = '(untagged)'
+ROOT = '(root)'
+
+_VERSION_RE = re.compile(r'v\d+((alpha|beta)\d*)?')
+
+
+def _segments(tool: Tool) -> list[str]:
+    url = getattr(tool.tool_call_template, 'url', '') or ''
+    return [segment for segment in urlparse(url).path.split('/') if segment]
+
+
+def _resource(segments: list[str]) -> str:
+    # Skip through the API version, if any
+    for i in range(len(segments) - 1, -1, -1):
+        if _VERSION_RE.fullmatch(segments[i]):
+            segments = segments[i + 1 :]
+            break
+
+    i = 0
+    while i < len(segments):
+        segment = segments[i]
+        if segment == 'watch':
+            i += 1
+        elif segment == 'namespaces' and segments[i + 1 : i + 2] == ['{namespace}']:
+            # Namespace scoping, unless the namespace itself is the resource
+            if i + 2 == len(segments):
+                return segment
+            i += 2
+        elif segment.startswith('{'):
+            i += 1
+        else:
+            return segment
+    return ROOT
+
+
+def operation_resources(tools: Sequence[Tool]) -> list[str]:
+    """Derive the resource of each operation.
+
+    Args:
+        tools: All operations of a service
+
+    Returns:
+        The resource of each operation, in tool order
+    """
+    paths = [_segments(tool) for tool in tools]
+
+    # Segments shared by all paths (the base URL), keeping at least one
+    shared = min((len(path) - 1 for path in paths), default=0)
+    for i in range(max(shared, 0)):
+        if any(path[i] != paths[0][i] for path in paths):
+            shared = i
+            break
+    return [_resource(path[max(shared, 0) :]) for path in paths]
+
+
+def tool_tags(tool: Tool) -> list[str]:
+    """The tags of an operation, or the untagged facet."""
+    return list(tool.tags) or [UNTAGGED]
+
+
+def facet_tree(
+    tools: Sequence[Tool], resources: Sequence[str]
+) -> dict[str, dict[str, int | dict[str, int]]]:
+    """Count operations per tag and resource.
+
+    Args:
+        tools: The operations
+        resources: The resource of each operation (see operation_resources)
+
+    Returns:
+        Maps tag -> {'total': operations, 'resources': {resource: operations}},
+        tags and resources in first-seen order
+    """
+    tree: dict[str, dict] = {}
+    for tool, resource in zip(tools, resources, strict=True):
+        for tag in tool_tags(tool):
+            facet = tree.setdefault(tag, {'total': 0, 'resources': {}})
+            facet['total'] += 1
+            facet['resources'][resource] = facet['resources'].get(resource, 0) + 1
+    return tree
@@ -0,0 +1,300 @@
+"""Pooled, keep-alive HTTP sessions for UTCP operation calls.
+
+utcp-http opens a new aiohttp session, and so new TCP and TLS connections,
+for every operation call: each Kubernetes or Grafana call pays a full
+handshake, and concurrent investigations pay it over and over. Instead,
+each service gets a connection pool when its client is created (see
+ToolLoader.create_client), and LocalFileHttpProtocol sends the service's
+calls through it. A pool has:
+
+    - one aiohttp session, opened on first use, whose connections are
+      kept alive between calls (UTCP_HTTP_KEEPALIVE_TIMEOUT)
+    - at most UTCP_{SERVICE}_MAX_CONNECTIONS connections per host;
+      further calls wait for a free connection
+    - a DNS cache (UTCP_HTTP_DNS_CACHE_TTL)
+    - the service's own SSL context (verifying, or for insecure services
+      not), instead of a process-wide patch of aiohttp. Reusing kept-alive
+      connections is what avoids repeated TLS handshakes; asyncio does not
+      resume TLS sessions across connections.
+    - no cookie jar: calls stay independent, as with per-call sessions
+
+A pool is replaced only when its settings change (e.g., insecure toggled
+on reload), so reloads keep warm connections. A replaced or dropped pool
+closes once its in-flight calls finish.
+
+When a metric meter is set (see worker.py), pools record:
+
+    utcp_http_requests_in_flight{service}  gauge
+    utcp_http_pool_utilization{service}    gauge, in-flight calls / max connections
+    utcp_http_connections_created{service} counter
+    utcp_http_connections_reused{service}  counter
+
+Configuration:
+    UTCP_{SERVICE}_MAX_CONNECTIONS: Connections per host (default: 16)
+    UTCP_HTTP_KEEPALIVE_TIMEOUT: Seconds idle connections are kept (default: 30)
+    UTCP_HTTP_DNS_CACHE_TTL: Seconds DNS lookups are cached (default: 300)
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import ssl
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from temporalio.common import MetricMeter
+
+from ein_agent_worker.utcp.config import DEFAULT_MAX_CONNECTIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 300
+
+# Maps service_name -> connection pool
+_pools: dict[str, 'ConnectionPool'] = {}
+
+# Replaced or dropped pools still serving calls
+_retired: set['ConnectionPool'] = set()
+
+# Tasks closing idle replaced or dropped pools
+_closing: set[asyncio.Task] = set()
+
+# Metric instruments, created by set_metric_meter()
+_metrics: dict[str, Any] = {}
+
+
+def _float_from_env(key: str, default: float) -> float:
+    value = os.getenv(key, str(default))
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning('Invalid %s %r, using default %s', key, value, default)
+        return default
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Settings of a service's connection pool.
+
+    Attributes:
+        insecure: Skip TLS verification
+        max_connections: Connections per host
+        keepalive_timeout: Seconds idle connections are kept
+        dns_cache_ttl: Seconds DNS lookups are cached
+    """
+
+    insecure: bool = False
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL
+
+    @classmethod
+    def from_env(cls, insecure: bool, max_connections: int) -> 'PoolSettings':
+        """Settings of a service, with the worker-wide ones from the environment."""
+        return cls(
+            insecure=insecure,
+            max_connections=max(max_connections, 1),
+            keepalive_timeout=_float_from_env(
+                'UTCP_HTTP_KEEPALIVE_TIMEOUT', DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            dns_cache_ttl=int(_float_from_env('UTCP_HTTP_DNS_CACHE_TTL', DEFAULT_DNS_CACHE_TTL)),
+        )
+
+
+class ConnectionPool:
+    """A service's keep-alive aiohttp session and its statistics."""
+
+    def __init__(self, service_name: str, settings: PoolSettings, ssl_context: ssl.SSLContext):
+        """Initialize the pool (its session is opened on first use).
+
+        Args:
+            service_name: The service name
+            settings: The pool settings
+            ssl_context: SSL context of the service's connections
+        """
+        self.service_name = service_name
+        self.settings = settings
+        self.ssl_context = ssl_context
+        self.in_flight = 0
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._retired = False
+
+    def _open(self) -> aiohttp.ClientSession:
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_created)
+        trace.on_connection_reuseconn.append(self._on_connection_reused)
+        connector = aiohttp.TCPConnector(
+            limit=0,  # per host only
+            limit_per_host=self.settings.max_connections,
+            keepalive_timeout=self.settings.keepalive_timeout,
+            ttl_dns_cache=self.settings.dns_cache_ttl,
+            ssl=self.ssl_context,
+        )
+        self._loop = asyncio.get_running_loop()
+        logger.debug('[%s] Opened HTTP connection pool', self.service_name)
+        return aiohttp.ClientSession(
+            connector=connector,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trace_configs=[trace],
+        )
+
+    async def _on_connection_created(self, *_args) -> None:
+        self.connections_created += 1
+        if _metrics:
+            _metrics['created'].add(1, {'service': self.service_name})
+
+    async def _on_connection_reused(self, *_args) -> None:
+        self.connections_reused += 1
+        if _metrics:
+            _metrics['reused'].add(1, {'service': self.service_name})
+
+    def _record_in_flight(self) -> None:
+        if _metrics:
+            attributes = {'service': self.service_name}
+            _metrics['in_flight'].set(self.in_flight, attributes)
+            _metrics['utilization'].set(self.in_flight / self.settings.max_connections, attributes)
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Use the pool's session for one call.
+
+        Yields:
+            The session (opened for the running event loop if needed)
+        """
+        if self._loop is not asyncio.get_running_loop():
+            self._close_stale()
+        if self._session is None or self._session.closed:
+            self._session = self._open()
+        self.in_flight += 1
+        self.requests += 1
+        self._record_in_flight()
+        try:
+            yield self._session
+        finally:
+            self.in_flight -= 1
+            self._record_in_flight()
+            if self._retired and not self.in_flight:
+                await self.close()
+
+    def _close_stale(self) -> None:
+        """Close the session opened for another event loop, on that loop."""
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        if self._loop is None or self._loop.is_closed():
+            # Its connections were closed with the loop
+            return
+        asyncio.run_coroutine_threadsafe(session.close(), self._loop)
+        logger.debug('[%s] Closing HTTP connection pool of another event loop', self.service_name)
+
+    def retire(self) -> None:
+        """Close the pool once its in-flight calls finish."""
+        self._retired = True
+        if self.in_flight:
+            # Closed by the last call (see session())
+            _retired.add(self)
+        elif self._session is not None and not self._session.closed:
+            if self._loop is None or self._loop.is_closed():
+                self._session = None
+                return
+            task = self._loop.create_task(self.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+
+    async def close(self) -> None:
+        """Close the pool's session and connections."""
+        _retired.discard(self)
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            logger.debug('[%s] Closed HTTP connection pool', self.service_name)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the pool's settings and connection statistics."""
+        return {
+            'max_connections': self.settings.max_connections,
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+        }
+
+
+def configure(service_name: str, settings: PoolSettings, ssl_context: ssl.SSLContext) -> None:
+    """Create a service's connection pool, unless one with the same settings exists.
+
+    Args:
+        service_name: The service name
+        settings: The pool settings
+        ssl_context: SSL context of the service's connections
+    """
+    pool = _pools.get(service_name)
+    if pool is not None and pool.settings == settings:
+        return
+    _pools[service_name] = ConnectionPool(service_name, settings, ssl_context)
+    if pool is not None:
+        pool.retire()
+    logger.info(
+        '[%s] HTTP connection pool: %d connections per host, keep-alive %ss, %s TLS',
+        service_name,
+        settings.max_connections,
+        settings.keepalive_timeout,
+        'unverified' if settings.insecure else 'verified',
+    )
+
+
+def get_pool(service_name: str) -> ConnectionPool | None:
+    """Get a service's connection pool, if one was configured."""
+    return _pools.get(service_name)
+
+
+def drop(service_name: str) -> None:
+    """Drop a service's connection pool, closing it once its calls finish."""
+    pool = _pools.pop(service_name, None)
+    if pool is not None:
+        pool.retire()
+
+
+async def close_all() -> None:
+    """Close every pool (at shutdown)."""
+    pools = [*_pools.values(), *_retired]
+    _pools.clear()
+    _retired.clear()
+    for pool in pools:
+        await pool.close()
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    """Get the statistics of each service's pool."""
+    return {service_name: pool.stats() for service_name, pool in _pools.items()}
+
+
+def set_metric_meter(meter: MetricMeter | None) -> None:
+    """Set (or with None, clear) the meter pool usage is recorded to.
+
+    Args:
+        meter: Metric meter, e.g. the Temporal runtime's
+    """
+    _metrics.clear()
+    if meter is None:
+        return
+    _metrics['in_flight'] = meter.create_gauge(
+        'utcp_http_requests_in_flight', 'UTCP operation calls in flight'
+    )
+    _metrics['utilization'] = meter.create_gauge_float(
+        'utcp_http_pool_utilization', 'UTCP operation calls in flight per pooled connection'
+    )
+    _metrics['created'] = meter.create_counter(
+        'utcp_http_connections_created', 'New connections opened for UTCP operation calls'
+    )
+    _metrics['reused'] = meter.create_counter(
+        'utcp_http_connections_reused', 'Kept-alive connections reused for UTCP operation calls'
+    )
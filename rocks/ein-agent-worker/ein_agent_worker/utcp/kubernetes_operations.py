@@ -0,0 +1,309 @@
+"""Group/version/kind index of Kubernetes operations.
+
+Kubernetes operation IDs and paths follow a strict shape, so an operation
+can be found exactly from what it does instead of by search:
+
+    listCoreV1NamespacedPod
+        GET /api/v1/namespaces/{namespace}/pods
+        -> verb list, group '' (core), version v1, kind Pod, scope namespaced
+    readAppsV1NamespacedDeploymentStatus
+        GET /apis/apps/v1/namespaces/{namespace}/deployments/{name}/status
+        -> verb read, group apps, version v1, kind Deployment,
+           scope namespaced, subresource status
+    listCoreV1PodForAllNamespaces
+        GET /api/v1/pods
+        -> verb list, kind Pod, scope all_namespaces
+
+The group, version, scope, resource and subresource come from the path;
+the verb and kind from the operation ID, once its group/version (from the
+operation's tag, e.g. apps_v1 -> AppsV1), scope and subresource parts are
+removed. Discovery operations (getAPIVersions, get...APIResources) and
+non-resource paths are not indexed.
+
+Operations are parsed once per spec, named by operation ID, and shared by
+every service loading that spec; each service views them under its own
+tool name prefix (see KubernetesOperationIndex.with_prefix).
+"""
+
+import copy
+import dataclasses
+import difflib
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from utcp.data.tool import Tool
+
+# Scopes
+NAMESPACED = 'namespaced'
+ALL_NAMESPACES = 'all_namespaces'
+CLUSTER = 'cluster'
+
+_VERSION_RE = re.compile(r'v(\d+)(?:(alpha|beta)(\d+))?')
+_VERB_RE = re.compile(r'[a-z]+')
+
+# Stability rank of version levels: GA before beta before alpha
+_LEVELS = {None: 2, 'beta': 1, 'alpha': 0}
+
+
+@dataclass(frozen=True)
+class KubernetesOperation:
+    """One Kubernetes operation, by what it does.
+
+    Attributes:
+        name: Full tool name (the operation ID in a shared index)
+        verb: list, read, watch or connect
+        group: API group ('' for the core group)
+        version: API version (e.g., v1, v1beta1)
+        kind: Resource kind (e.g., Pod)
+        resource: Resource (plural) name in the path (e.g., pods)
+        scope: namespaced, all_namespaces (namespaced kind across all
+            namespaces) or cluster (cluster-scoped kind)
+        subresource: Subresource (e.g., status, log), or ''
+        named: Whether the operation acts on a single named object
+        path: URL path template
+    """
+
+    name: str
+    verb: str
+    group: str
+    version: str
+    kind: str
+    resource: str
+    scope: str
+    subresource: str
+    named: bool
+    path: str
+
+
+def _version_rank(version: str) -> tuple[int, int, int]:
+    """Sort key of API versions: most stable, then newest, first."""
+    match = _VERSION_RE.fullmatch(version)
+    if not match:
+        return (-1, 0, 0)
+    major, level, minor = match.groups()
+    return (_LEVELS[level], int(major), int(minor or 0))
+
+
+def _group_version_prefix(tag: str) -> str:
+    """Operation ID infix of a group/version tag (rbacAuthorization_v1 -> RbacAuthorizationV1)."""
+    group, _, version = tag.rpartition('_')
+    return group[:1].upper() + group[1:] + version[:1].upper() + version[1:]
+
+
+def parse_operation(
+    operation_id: str, tags: Sequence[str], url: str
+) -> KubernetesOperation | None:
+    """Parse a Kubernetes operation from its ID, tag and path.
+
+    Args:
+        operation_id: The operation ID (tool name without the service prefix)
+        tags: The operation's tags
+        url: The operation's URL, or its path
+
+    Returns:
+        The parsed operation, named by its ID, or None for discovery and
+        non-resource operations
+    """
+    path = urlparse(url).path
+    segments = [segment for segment in path.split('/') if segment]
+
+    # /api/v1/... (core group) or /apis/<group>/<version>/...
+    for i, segment in enumerate(segments):
+        if segment == 'api' and i + 1 < len(segments):
+            group, version, rest = '', segments[i + 1], segments[i + 2 :]
+            break
+        if segment == 'apis' and i + 2 < len(segments):
+            group, version, rest = segments[i + 1], segments[i + 2], segments[i + 3 :]
+            break
+    else:
+        return None
+    if not _VERSION_RE.fullmatch(version):
+        return None
+
+    if rest[:1] == ['watch']:
+        rest = rest[1:]
+    namespaced = rest[:2] == ['namespaces', '{namespace}'] and len(rest) > 2
+    if namespaced:
+        rest = rest[2:]
+    if not rest or rest[0].startswith('{'):
+        return None
+    resource, rest = rest[0], rest[1:]
+    named = rest[:1] == ['{name}']
+    subresource = rest[1] if named and len(rest) > 1 else ''
+
+    verb_match = _VERB_RE.match(operation_id)
+    if verb_match is None or not tags:
+        return None
+    verb = verb_match.group()
+    kind = operation_id[len(verb) :]
+    gv_prefix = _group_version_prefix(tags[0])
+    if not kind.startswith(gv_prefix):
+        return None
+    kind = kind[len(gv_prefix) :]
+    if verb == 'connect':
+        # connect operation IDs include the HTTP method
+        kind = kind.removeprefix('Get')
+
+    all_namespaces = kind.endswith('ForAllNamespaces')
+    kind = kind.removesuffix('ForAllNamespaces')
+    if namespaced:
+        kind = kind.removeprefix('Namespaced')
+    if verb == 'watch' and not named:
+        kind = kind.removesuffix('List')
+    if subresource:
+        kind = kind.removesuffix('WithPath')
+        if kind.lower().endswith(subresource.lower()):
+            kind = kind[: -len(subresource)]
+    if not kind:
+        return None
+
+    scope = NAMESPACED if namespaced else ALL_NAMESPACES if all_namespaces else CLUSTER
+    return KubernetesOperation(
+        name=operation_id,
+        verb=verb,
+        group=group,
+        version=version,
+        kind=kind,
+        resource=resource,
+        scope=scope,
+        subresource=subresource,
+        named=named,
+        path=path,
+    )
+
+
+def _matches_group(operation: KubernetesOperation, group: str) -> bool:
+    # 'core' or '' for the core group; full ('rbac.authorization.k8s.io') or
+    # short ('rbac') group names otherwise
+    if group in ('', 'core'):
+        return operation.group == ''
+    return group in (operation.group, operation.group.split('.')[0])
+
+
+class KubernetesOperationIndex:
+    """Kubernetes operations by kind, for exact lookups."""
+
+    def __init__(self, operations: Sequence[KubernetesOperation], prefix: str = ''):
+        """Initialize the index.
+
+        Args:
+            operations: The parsed operations, named by operation ID
+            prefix: The service prefix of tool names ('<manual>.'), added
+                to the names of the operations returned
+        """
+        self.operations = list(operations)
+        self.prefix = prefix
+        self._by_id = {operation.name: operation for operation in self.operations}
+        # Maps lower-cased kind and resource names -> operations
+        self._by_kind: dict[str, list[KubernetesOperation]] = {}
+        for operation in self.operations:
+            for key in {operation.kind.lower(), operation.resource.lower()}:
+                self._by_kind.setdefault(key, []).append(operation)
+
+    @classmethod
+    def from_tools(cls, tools: Sequence[Tool], prefix: str = '') -> 'KubernetesOperationIndex':
+        """Build an index from a Kubernetes service's tools.
+
+        Args:
+            tools: The tools
+            prefix: The service prefix of tool names ('<manual>.')
+
+        Returns:
+            The index
+        """
+        operations = (
+            parse_operation(
+                tool.name.removeprefix(prefix),
+                tool.tags,
+                getattr(tool.tool_call_template, 'url', '') or '',
+            )
+            for tool in tools
+        )
+        return cls([operation for operation in operations if operation is not None], prefix)
+
+    def with_prefix(self, prefix: str) -> 'KubernetesOperationIndex':
+        """View the index under another service's tool names, sharing its operations.
+
+        Args:
+            prefix: The service prefix of tool names ('<manual>.')
+
+        Returns:
+            The view
+        """
+        view = copy.copy(self)
+        view.prefix = prefix
+        return view
+
+    def _named(self, operation: KubernetesOperation) -> KubernetesOperation:
+        """Name an operation by its full tool name."""
+        if not self.prefix:
+            return operation
+        return dataclasses.replace(operation, name=self.prefix + operation.name)
+
+    def get(self, tool_name: str) -> KubernetesOperation | None:
+        """Look up an operation by its full tool name."""
+        operation = self._by_id.get(tool_name.removeprefix(self.prefix))
+        return None if operation is None else self._named(operation)
+
+    def kinds(self) -> list[str]:
+        """All indexed kinds, sorted."""
+        return sorted({operation.kind for operation in self.operations})
+
+    def find(
+        self,
+        kind: str,
+        verb: str = 'list',
+        namespaced: bool | None = None,
+        subresource: str = '',
+        group: str | None = None,
+        version: str = '',
+    ) -> list[KubernetesOperation]:
+        """Find the operations matching a description.
+
+        Args:
+            kind: Kind or resource name, case-insensitive (e.g., Pod, pods)
+            verb: list, read, watch or connect
+            namespaced: True for operations in one namespace, False for
+                cluster-scoped kinds or all namespaces, None for either
+            subresource: Subresource (e.g., status, log), '' for the object
+            group: API group ('core' or '' for the core group), None for any
+            version: API version, '' for any
+
+        Returns:
+            Matching operations, best first: most stable and newest
+            version, then whole collections before single objects
+        """
+        subresource = subresource.lower()
+        matches = [
+            operation
+            for operation in self._by_kind.get(kind.lower(), ())
+            if operation.verb == verb.lower()
+            and operation.subresource == subresource
+            and (namespaced is None or (operation.scope == NAMESPACED) == namespaced)
+            and (group is None or _matches_group(operation, group.lower()))
+            and (not version or operation.version == version.lower())
+        ]
+        matches.sort(key=lambda op: (_version_rank(op.version), not op.named), reverse=True)
+        return [self._named(operation) for operation in matches]
+
+    def describe(self, kind: str) -> dict:
+        """Describe what is available for a kind, to correct a failed lookup.
+
+        Args:
+            kind: Kind or resource name
+
+        Returns:
+            The verbs, scopes, subresources, groups and versions of the
+            kind, or similar kinds if it is unknown
+        """
+        operations = self._by_kind.get(kind.lower())
+        if not operations:
+            return {
+                'similar_kinds': difflib.get_close_matches(kind, self.kinds(), n=5, cutoff=0.6)
+            }
+        return {
+            field: sorted({getattr(operation, field) for operation in operations})
+            for field in ('verb', 'scope', 'subresource', 'group', 'version')
+        }
@@ -0,0 +1,247 @@
+"""Transparent pagination of Kubernetes list operations.
+
+Without a limit, a Kubernetes list returns every object in one response:
+unbounded in size on a large cluster. Paging by hand with limit/continue
+costs the agent a turn per page. Instead, the call activity pages list
+operations itself, in pages of UTCP_LIST_PAGE_SIZE objects:
+
+    1. each page is projected (default exclusions and the call's fields,
+       see projection.py) as soon as it arrives, and the raw page dropped,
+       so memory is bounded by one raw page plus the projected items kept
+    2. paging stops once the item budget (UTCP_LIST_MAX_ITEMS objects
+       read, or the call's own 'limit' if lower) or the byte budget
+       (UTCP_LIST_MAX_BYTES of compact JSON projected items) is reached,
+       or the list is complete
+    3. the items are merged into one list response, with its kind,
+       apiVersion and metadata from the first page, and a 'pagination'
+       summary:
+
+        {"pages": 3, "items": 1000, "truncated": true,
+         "remaining": 4200, "continue": "<token>"}
+
+    'remaining' is the server's estimate (metadata.remainingItemCount),
+    when it gives one. Passing 'continue' back resumes the list there;
+    there is no token when the byte budget ran out within a page.
+
+If a later page fails (e.g., 410 Gone for an expired continue token) or
+is not a list, the items already read are returned as truncated, with the
+failure in 'pagination.error' and the failed page's 'continue' token.
+Fields selecting none of the items (e.g., 'kind') read a single page of
+one object.
+
+Watches (watch=true) are not paginated.
+
+Configuration:
+    UTCP_LIST_PAGE_SIZE: Objects requested per page (default: 500)
+    UTCP_LIST_MAX_ITEMS: Most objects returned per call (default: 1000)
+    UTCP_LIST_MAX_BYTES: Most bytes of (compact JSON) objects returned
+        per call (default, and at most: UTCP_RESPONSE_MAX_BYTES less 8192,
+        so lists fit the response budget, see response_summary.py)
+"""
+
+import logging
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ein_agent_worker.utcp import serialization
+from ein_agent_worker.utcp.projection import WILDCARD, field_paths, project
+from ein_agent_worker.utcp.response_summary import DEFAULT_MAX_RESPONSE_BYTES, max_response_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_ITEMS = 1000
+# Room left in the response budget (see response_summary.py) for the list's
+# kind, metadata and pagination summary, so a list within its byte budget is
+# returned as is, not summarized
+RESPONSE_HEADROOM = 8 * 1024
+DEFAULT_MAX_BYTES = DEFAULT_MAX_RESPONSE_BYTES - RESPONSE_HEADROOM
+
+
+class FieldsNotFoundError(ValueError):
+    """None of a call's fields are in the response."""
+
+    def __init__(self, available_fields: list[str]):
+        super().__init__('None of the fields are in the response')
+        self.available_fields = available_fields
+
+
+def _int_from_env(key: str, default: int) -> int:
+    value = os.getenv(key, str(default))
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        logger.warning('Invalid %s %r, using default %d', key, value, default)
+        return default
+
+
+@dataclass(frozen=True)
+class ListBudget:
+    """Page size and limits of a paginated list.
+
+    Attributes:
+        page_size: Objects requested per page
+        max_items: Most objects returned
+        max_bytes: Most bytes of (compact JSON) objects returned
+    """
+
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_items: int = DEFAULT_MAX_ITEMS
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    @classmethod
+    def from_env(cls) -> 'ListBudget':
+        """Budget from UTCP_LIST_PAGE_SIZE, UTCP_LIST_MAX_ITEMS and UTCP_LIST_MAX_BYTES.
+
+        The byte budget is capped by the response budget (UTCP_RESPONSE_MAX_BYTES).
+        """
+        response_bytes = max(max_response_bytes() - RESPONSE_HEADROOM, 1)
+        return cls(
+            page_size=_int_from_env('UTCP_LIST_PAGE_SIZE', DEFAULT_PAGE_SIZE),
+            max_items=_int_from_env('UTCP_LIST_MAX_ITEMS', DEFAULT_MAX_ITEMS),
+            max_bytes=min(_int_from_env('UTCP_LIST_MAX_BYTES', response_bytes), response_bytes),
+        )
+
+
+def should_paginate(arguments: dict[str, Any]) -> bool:
+    """Whether a list call's arguments allow paging it (not a watch)."""
+    return str(arguments.get('watch', '')).lower() not in ('true', '1')
+
+
+def _project_item(
+    item: Any, fields: Sequence[tuple[str, ...]], exclude: Sequence[tuple[str, ...]]
+) -> Any:
+    """Project one object of a list page as part of the page (None if nothing is kept)."""
+    projected = project({'items': [item]}, fields, exclude)
+    return projected['items'][0] if projected and projected.get('items') else None
+
+
+async def paginate_list(
+    call: Callable[[dict[str, Any]], Awaitable[Any]],
+    arguments: dict[str, Any],
+    fields: Sequence[tuple[str, ...]] = (),
+    exclude: Sequence[tuple[str, ...]] = (),
+    budget: ListBudget | None = None,
+) -> Any:
+    """Call a Kubernetes list operation page by page, projecting each page.
+
+    Args:
+        call: Calls the operation with the given arguments
+        arguments: The call's arguments ('limit' caps the objects read,
+            'continue' resumes a previous list)
+        fields: Paths to keep (see projection.py)
+        exclude: Paths to remove
+        budget: Page size and limits (default: from the environment)
+
+    Returns:
+        The merged list response with its 'pagination' summary, or a
+        response that is not a list as returned
+
+    Raises:
+        FieldsNotFoundError: If none of the fields are in the response
+    """
+    budget = budget or ListBudget.from_env()
+    max_items = budget.max_items
+    if str(arguments.get('limit', '')).isdigit() and int(arguments['limit']) > 0:
+        max_items = min(max_items, int(arguments['limit']))
+    # Fields selecting only the list's own keys (kind, metadata...) need
+    # one page, of one object
+    keeps_items = not fields or any(path[0] in ('items', WILDCARD) for path in fields)
+    page_size = budget.page_size if keeps_items else 1
+
+    merged: dict[str, Any] | None = None
+    available_fields: list[str] = []
+    items: list[Any] = []
+    size = 0
+    read = 0
+    pages = 0
+    token = arguments.get('continue') or ''
+    remaining = None
+    truncated = False
+    error = None
+    while True:
+        page_arguments = {**arguments, 'limit': min(page_size, max_items - read)}
+        if token:
+            page_arguments['continue'] = token
+        try:
+            page = await call(page_arguments)
+        except Exception as e:
+            # A later page failing (e.g., 410 Gone for an expired continue
+            # token) keeps the pages already read
+            if merged is None:
+                raise
+            error = str(e) or type(e).__name__
+            logger.warning('Listing stopped after %d pages: %s', pages, error)
+            break
+        if not isinstance(page, dict) or not isinstance(page.get('items'), list):
+            # Not a list response (e.g., an error Status)
+            if merged is None:
+                return page
+            error = page
+            break
+        pages += 1
+
+        metadata = page.get('metadata') or {}
+        page_token = metadata.get('continue') or ''
+        remaining = metadata.get('remainingItemCount')
+        if merged is None:
+            available_fields = field_paths(page)
+            envelope = {key: value for key, value in page.items() if key != 'items'}
+            merged = project(envelope, fields, exclude) or {}
+            if isinstance(merged.get('metadata'), dict):
+                merged['metadata'] = {
+                    key: value
+                    for key, value in merged['metadata'].items()
+                    if key not in ('continue', 'remainingItemCount')
+                }
+        if not keeps_items:
+            # Nothing of the rest of the list would be returned
+            remaining = None
+            token = ''
+            break
+
+        page_items = page['items']
+        del page
+        for position, item in enumerate(page_items):
+            projected = None if read >= max_items else _project_item(item, fields, exclude)
+            item_size = len(serialization.dumps(projected)) if projected is not None else 0
+            if read >= max_items or (items and size + item_size > budget.max_bytes):
+                # Stopped within the page: its continue token would skip
+                # the rest of it, so report what is left instead
+                truncated = True
+                unread = len(page_items) - position
+                if not page_token:
+                    remaining = unread
+                elif remaining is not None:
+                    remaining += unread
+                token = ''
+                break
+            read += 1
+            if projected is not None:
+                items.append(projected)
+                size += item_size
+        else:
+            token = page_token
+            if token and read < max_items and size < budget.max_bytes:
+                continue
+            truncated = bool(token)
+        break
+
+    if fields and not merged and not items and error is None:
+        raise FieldsNotFoundError(available_fields)
+    if keeps_items:
+        merged['items'] = items
+    merged['pagination'] = {'pages': pages, 'items': len(items), 'truncated': truncated}
+    if error is not None:
+        # Resuming from the failed page's token retries it
+        merged['pagination']['truncated'] = truncated = True
+        merged['pagination']['error'] = error
+    if truncated:
+        if remaining is not None:
+            merged['pagination']['remaining'] = remaining
+        if token:
+            merged['pagination']['continue'] = token
+    logger.debug('Listed %d objects in %d pages (truncated: %s)', len(items), pages, truncated)
+    return merged
@@ -0,0 +1,238 @@
+"""Lazy input-schema materialization for UTCP operations.
+
+In lazy mode a service's manual only carries a lightweight operation index:
+name, tags, description and the HTTP call template (method and URL). Input
+and output schemas are left empty. The first time an operation's parameters
+are needed, its input schema is resolved from the raw spec and kept in a
+bounded LRU cache. The spec itself is parsed on that first lookup, not at
+startup.
+
+Calling an operation never needs the schema: header and body fields are
+already part of the call template.
+
+Configuration:
+    UTCP_{SERVICE}_LAZY_SCHEMAS: Enable lazy mode for a service (default: false)
+    UTCP_SCHEMA_CACHE_SIZE: Resolved input schemas kept per service (default: 256)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from utcp_http.openapi_converter import OpenApiConverter
+
+from ein_agent_worker.utcp.lru import LRUCache
+from ein_agent_worker.utcp.openapi_handlers import OpenApiHandler
+from ein_agent_worker.utcp.spec.streaming import load_spec
+from utcp.data.tool import JsonSchema, Tool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_CACHE_SIZE = 256
+
+# Services registered in lazy mode
+_lazy_services: set[str] = set()
+
+# Maps service_name -> resolver for its operation input schemas
+_resolvers: dict[str, 'LazySchemaResolver'] = {}
+
+
+def set_lazy_schemas(service_name: str, enabled: bool) -> None:
+    """Enable or disable lazy schema mode for a service.
+
+    Must be called before the service's manual is registered.
+
+    Args:
+        service_name: The service name (e.g., 'kubernetes')
+        enabled: Whether to defer schema resolution
+    """
+    if enabled:
+        _lazy_services.add(service_name)
+    else:
+        _lazy_services.discard(service_name)
+        _resolvers.pop(service_name, None)
+
+
+def is_lazy(service_name: str) -> bool:
+    """Check whether a service uses lazy schema mode.
+
+    Args:
+        service_name: The service name
+
+    Returns:
+        True if schemas are resolved on demand
+    """
+    return service_name in _lazy_services
+
+
+def register_resolver(service_name: str, resolver: 'LazySchemaResolver | None') -> None:
+    """Register (or with None, drop) the schema resolver for a service.
+
+    Args:
+        service_name: The service name
+        resolver: Resolver bound to the service's spec, or None
+    """
+    if resolver is None:
+        _resolvers.pop(service_name, None)
+    else:
+        _resolvers[service_name] = resolver
+
+
+def get_resolver(service_name: str) -> 'LazySchemaResolver | None':
+    """Get the schema resolver for a service.
+
+    Args:
+        service_name: The service name
+
+    Returns:
+        The resolver, or None if the service is not in lazy mode
+    """
+    return _resolvers.get(service_name)
+
+
+async def resolve_inputs(service_name: str, tool: Tool) -> JsonSchema:
+    """Return a tool's input schema, resolving it on demand in lazy mode.
+
+    Args:
+        service_name: The service the tool belongs to
+        tool: The registered tool
+
+    Returns:
+        The tool's input schema
+    """
+    resolver = _resolvers.get(service_name)
+    if resolver is None:
+        return tool.inputs
+    inputs = await asyncio.to_thread(resolver.get_inputs, tool.name)
+    return inputs if inputs is not None else tool.inputs
+
+
+def _schema_cache_size_from_env() -> int:
+    value = os.getenv('UTCP_SCHEMA_CACHE_SIZE', str(DEFAULT_SCHEMA_CACHE_SIZE))
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            'Invalid UTCP_SCHEMA_CACHE_SIZE %r, using default %d',
+            value,
+            DEFAULT_SCHEMA_CACHE_SIZE,
+        )
+        return DEFAULT_SCHEMA_CACHE_SIZE
+
+
+class IndexOnlyOpenApiConverter(OpenApiConverter):
+    """OpenApiConverter that emits tools without input/output schemas.
+
+    Header and body fields are still extracted since the call template
+    needs them to build requests.
+    """
+
+    def _extract_inputs(
+        self, path: str, operation: dict[str, Any]
+    ) -> tuple[JsonSchema, list[str], str | None]:
+        _, header_fields, body_field = super()._extract_inputs(path, operation)
+        return JsonSchema(), header_fields, body_field
+
+    def _extract_outputs(self, operation: dict[str, Any]) -> JsonSchema:
+        return JsonSchema()
+
+
+class LazySchemaResolver:
+    """Resolve operation input schemas from a service's raw spec on demand.
+
+    The spec is read, filtered and preprocessed exactly as during
+    registration, but only on the first lookup. Resolved schemas are kept
+    in an LRU cache; evicted entries are simply resolved again.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        handler: OpenApiHandler,
+        read_spec: Callable[[], bytes],
+        is_yaml: bool = False,
+        cache_size: int | None = None,
+    ):
+        """Initialize the resolver.
+
+        Args:
+            service_name: The service name
+            handler: OpenAPI handler used to preprocess the spec
+            read_spec: Returns the raw spec contents (called once)
+            is_yaml: Whether the spec is YAML rather than JSON
+            cache_size: Max resolved schemas kept (default: UTCP_SCHEMA_CACHE_SIZE)
+        """
+        self.service_name = service_name
+        self._handler = handler
+        self._read_spec: Callable[[], bytes] | None = read_spec
+        self._is_yaml = is_yaml
+        self._converter: OpenApiConverter | None = None
+        self._operations: dict[str, tuple[str, dict]] = {}
+        self._lock = threading.Lock()
+        self.cache = LRUCache(
+            cache_size if cache_size is not None else _schema_cache_size_from_env()
+        )
+
+    def _ensure_loaded(self) -> None:
+        """Parse the spec and index its operations (first call only)."""
+        with self._lock:
+            if self._read_spec is None:
+                return
+
+            start = time.perf_counter()
+            spec_data = load_spec(
+                self._read_spec(),
+                self.service_name,
+                self._handler.READ_ONLY_METHODS,
+                is_yaml=self._is_yaml,
+            )
+            spec_data = self._handler.preprocess_spec(spec_data, self.service_name)
+
+            for path, path_item in spec_data.get('paths', {}).items():
+                for operation in path_item.values():
+                    if isinstance(operation, dict) and operation.get('operationId'):
+                        self._operations[operation['operationId']] = (path, operation)
+
+            self._converter = OpenApiConverter(spec_data, call_template_name=self.service_name)
+            # Drop the reader so raw spec bytes it may hold can be freed
+            self._read_spec = None
+            logger.info(
+                '[%s] Loaded spec for lazy schema resolution (%d operations) in %.2fs',
+                self.service_name,
+                len(self._operations),
+                time.perf_counter() - start,
+            )
+
+    def get_inputs(self, tool_name: str) -> JsonSchema | None:
+        """Get the input schema for an operation, resolving it if needed.
+
+        Blocking on the first call (parses the spec), so call it from a
+        worker thread.
+
+        Args:
+            tool_name: Tool name, with or without the service prefix
+
+        Returns:
+            The resolved input schema, or None if the operation is unknown
+        """
+        inputs = self.cache.get(tool_name)
+        if inputs is not None:
+            return inputs
+
+        self._ensure_loaded()
+        # The UTCP client prefixes operation IDs with '<manual name>.' unless
+        # they already start with it
+        entry = self._operations.get(tool_name) or self._operations.get(
+            tool_name.removeprefix(f'{self.service_name}.')
+        )
+        if entry is None or self._converter is None:
+            return None
+
+        path, operation = entry
+        inputs, _, _ = self._converter._extract_inputs(path, operation)
+        self.cache.put(tool_name, inputs)
+        return inputs
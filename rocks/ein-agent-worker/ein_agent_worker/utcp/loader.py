@@ -8,28 +8,40 @@ import base64
 import json
 import logging
 import os
+import re
 from collections.abc import Callable
 from pathlib import Path
 from typing import ClassVar
 
 import yaml
-from agents import function_tool
 
-from ein_agent_worker.utcp.local_file_protocol import (
-    register_local_file_protocol,
-    set_api_base_url,
-)
+from ein_agent_worker.utcp import http_pool, serialization, service_context
+from ein_agent_worker.utcp import registry as utcp_registry
+from ein_agent_worker.utcp.call_resolution import coerce_arguments, resolve_operation
+from ein_agent_worker.utcp.catalog import get_catalog
+from ein_agent_worker.utcp.local_file_protocol import register_local_file_protocol
+from ein_agent_worker.utcp.manual_store import get_manual_store
 from ein_agent_worker.utcp.openapi_handlers import (
     DEFAULT_OPENAPI_HANDLERS,
+    BearerTokenLoader,
     OpenApiHandler,
 )
 from ein_agent_worker.utcp.openapi_handlers.default import DefaultOpenApiHandler
+from ein_agent_worker.utcp.projection import (
+    field_paths,
+    get_default_exclusions,
+    parse_fields,
+    project,
+)
+from ein_agent_worker.utcp.response_summary import fit_response, max_response_bytes
+from ein_agent_worker.utcp.spec.bundle import bundle_version
 from ein_agent_worker.utcp.spec.strategy import (
     LiveURLStrategy,
     LocalFileStrategy,
     SpecSourceStrategy,
 )
 from ein_agent_worker.utcp.ssl_config import SSLConfigManager
+from ein_agent_worker.utcp.startup_report import phase
 from utcp.utcp_client import UtcpClient
 
 logger = logging.getLogger(__name__)
@@ -40,8 +52,8 @@ DEFAULT_SPECS_DIR = Path(__file__).parent.parent.parent / 'specs'
 
 def _serialize_result(result) -> str:
     """Serialize a result to JSON string."""
-    if isinstance(result, (dict, list)):
-        return json.dumps(result, indent=2)
+    if isinstance(result, dict | list):
+        return serialization.dumps(result)
     return str(result)
 
 
@@ -61,20 +73,13 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
     Returns:
         List of function tools for the agent
     """
-    # Cache for all available tools (populated lazily on first use)
-    tools_cache: list | None = None
+    # Deferred: the OpenAI Agents SDK takes seconds to import, and the worker
+    # only needs the UTCP clients (not these tools) to start
+    from agents import function_tool
 
     async def _get_all_tools():
-        """Get all tools with caching to avoid repeated fetches."""
-        nonlocal tools_cache
-        if tools_cache is None:
-            logger.info(
-                '[%s] Loading all operations into cache (one-time operation)',
-                service_name,
-            )
-            tools_cache = await utcp_client.search_tools(' ', limit=2000)
-            logger.info('[%s] Cached %d operations', service_name, len(tools_cache))
-        return tools_cache
+        """Get all tools from the service's operation catalog."""
+        return (await get_catalog(service_name, utcp_client)).tools
 
     @function_tool(name_override=f'list_{service_name}_operations')
     async def list_operations(tag: str = '', page: int = 1) -> str:
@@ -93,7 +98,6 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
             Plain text list of operation names (one per line) with pagination info.
         """
         try:
-            # Use cached tools to avoid repeated fetches
             all_tools = await _get_all_tools()
 
             # Filter by tag if provided
@@ -142,45 +146,11 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
             descriptions (truncated to 100 chars).
         """
         try:
-            # Use cached tools to avoid repeated fetches
-            all_tools = await _get_all_tools()
-
-            query_lower = query.lower()
-            query_words = query_lower.split()
-
-            scored_tools = []
-
-            for tool in all_tools:
-                name_lower = tool.name.lower()
-                desc_lower = tool.description.lower() if tool.description else ''
-
-                score = 0
-
-                # Exact name match
-                if query_lower == name_lower.replace(f'{service_name}.', ''):
-                    score += 100
-
-                # Partial name match
-                if query_lower in name_lower:
-                    score += 50
-
-                # Word matches in name
-                matches_in_name = sum(1 for w in query_words if w in name_lower)
-                score += matches_in_name * 10
-
-                # Word matches in description
-                matches_in_desc = sum(1 for w in query_words if w in desc_lower)
-                score += matches_in_desc * 5
-
-                if score > 0:
-                    scored_tools.append((score, tool))
-
-            # Sort by score descending
-            scored_tools.sort(key=lambda x: x[0], reverse=True)
+            catalog = await get_catalog(service_name, utcp_client)
 
             # Take top 'limit' (cap at 50)
             actual_limit = min(limit, 50)
-            top_tools = [t[1] for t in scored_tools[:actual_limit]]
+            top_tools = [tool for _, tool in catalog.search(query, actual_limit)]
 
             result = []
             for tool in top_tools:
@@ -195,47 +165,53 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
                     'description': desc,
                 })
 
-            return json.dumps(result, indent=2)
+            return serialization.dumps(result)
         except Exception as e:
             logger.error('Error searching %s operations: %s', service_name, e)
             return json.dumps({'error': str(e)})
 
     @function_tool(name_override=f'get_{service_name}_operation_details')
-    async def get_operation_details(tool_name: str) -> str:
-        """Get detailed parameter schema for a specific operation.
+    async def get_operation_details(tool_name: str, verbose: bool = False) -> str:
+        """Get the parameters of a specific operation.
 
         Use this after finding an operation with search to know what parameters it requires.
 
         Args:
             tool_name: The exact name of the tool (e.g., "k8s.listCoreV1NamespacedPod")
+            verbose: Return the full JSON schema instead of the summary
 
         Returns:
-            JSON schema of the tool's parameters.
+            JSON summary of the tool's parameters, required first.
         """
         try:
-            # Use cached tools to avoid repeated fetches
-            all_tools = await _get_all_tools()
-
-            for tool in all_tools:
-                if tool.name == tool_name:
-                    # Serialize the schema
-                    schema = _serialize_schema(tool.inputs) if hasattr(tool, 'inputs') else {}
-
-                    response = {
-                        'name': tool.name,
-                        'description': tool.description,
-                        'parameters': schema,
-                    }
-
-                    return json.dumps(response, indent=2)
+            catalog = await get_catalog(service_name, utcp_client)
+            tool = catalog.get(tool_name)
+            if tool is None:
+                return json.dumps({'error': f"Tool '{tool_name}' not found."})
 
-            return json.dumps({'error': f"Tool '{tool_name}' not found."})
+            if verbose:
+                response = {
+                    'name': tool.name,
+                    'description': tool.description,
+                    'parameters': await catalog.parameters(tool),
+                }
+                return serialization.dumps(response)
+
+            response = {
+                'name': tool.name,
+                'description': tool.description,
+                'method': getattr(tool.tool_call_template, 'http_method', None),
+                'parameters': await catalog.parameter_summaries(tool),
+            }
+            return serialization.dumps(response)
         except Exception as e:
             logger.error('Error getting %s operation details: %s', service_name, e)
             return json.dumps({'error': str(e)})
 
     @function_tool(name_override=f'call_{service_name}_operation')
-    async def call_operation(tool_name: str, arguments: str = '{}') -> str:
+    async def call_operation(
+        tool_name: str, arguments: str = '{}', fields: str = '', top_by: str = ''
+    ) -> str:
         """Execute an API operation.
 
         IMPORTANT: This tool is ONLY for operations of this service.
@@ -246,16 +222,26 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
         Args:
             tool_name: The exact tool name from search results
             arguments: JSON string of arguments matching the tool's parameter schema
+            fields: Comma-separated response paths to keep
+                (e.g., "items.metadata.name,items.status.phase"); empty: all
+            top_by: Numeric field path to rank items by if the response is
+                summarized (e.g., "status.containerStatuses.restartCount")
 
         Returns:
-            The result of the API call as JSON
+            The result of the API call as JSON, or a summary of its items
+            if it is over the size budget
         """
+        try:
+            paths = parse_fields(fields)
+        except ValueError as e:
+            return json.dumps({'error': str(e)})
+
         try:
             # Validate tool name belongs to this service
             # Tool names should be prefixed with service name
             expected_prefix = f'{service_name}.'
-            if not tool_name.startswith(expected_prefix):
-                tool_service = tool_name.split('.')[0]
+            tool_service = tool_name.split('.')[0]
+            if tool_service != service_name and tool_service in utcp_registry.list_services():
                 error_msg = (
                     f"Tool name mismatch: '{tool_name}' does not "
                     f"start with '{expected_prefix}'. "
@@ -267,10 +253,43 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
                 logger.error('[%s] %s', service_name, error_msg)
                 return json.dumps({'error': error_msg})
 
-            logger.debug('[%s] Calling tool: %s', service_name, tool_name)
             args = json.loads(arguments) if arguments else {}
-            result = await utcp_client.call_tool(tool_name, args)
-            return _serialize_result(result)
+            if isinstance(args, str):
+                args = json.loads(args)
+            if not isinstance(args, dict):
+                return json.dumps({'error': 'Arguments must be a JSON object'})
+
+            catalog = await get_catalog(service_name, utcp_client)
+            resolution = resolve_operation(catalog, tool_name, args)
+            if resolution.tool is None:
+                response = {
+                    'error': f"Tool '{tool_name}' not found. "
+                    f'Use search_{service_name}_operations to find the exact name.'
+                }
+                if resolution.candidates:
+                    response['did_you_mean'] = resolution.candidates
+                return json.dumps(response)
+
+            tool = resolution.tool
+            args, corrections = coerce_arguments(args, await catalog.parameters(tool))
+            corrections = resolution.corrections + corrections
+
+            logger.debug('[%s] Calling tool: %s', service_name, tool.name)
+            result = await utcp_client.call_tool(tool.name, args)
+            if isinstance(result, dict | list):
+                projected = project(result, paths, get_default_exclusions(service_name))
+                if projected is None:
+                    error = {
+                        'error': f'None of the fields {fields!r} are in the response',
+                        'available_fields': field_paths(result),
+                    }
+                    return json.dumps(error)
+                result = projected
+            if corrections:
+                response = serialization.dumps({'corrections': corrections, 'result': result})
+            else:
+                response = _serialize_result(result)
+            return fit_response(result, response, max_response_bytes(), top_by, corrections)
         except json.JSONDecodeError as e:
             return json.dumps({'error': f'Invalid JSON arguments: {e}'})
         except Exception as e:
@@ -289,18 +308,6 @@ def create_utcp_tools(utcp_client: UtcpClient, service_name: str) -> list[Callab
     return [list_operations, search_operations, get_operation_details, call_operation]
 
 
-def _serialize_schema(obj) -> dict:
-    """Recursively serialize JsonSchema objects to dicts."""
-    if hasattr(obj, 'model_dump'):
-        data = obj.model_dump()
-        return _serialize_schema(data)
-    elif isinstance(obj, dict):
-        return {k: _serialize_schema(v) for k, v in obj.items() if v is not None}
-    elif isinstance(obj, list):
-        return [_serialize_schema(item) for item in obj]
-    return obj
-
-
 def _extract_token_from_kubeconfig(kubeconfig_data: dict, service_name: str) -> str:
     """Extract bearer token from kubeconfig dictionary (IN MEMORY).
 
@@ -383,7 +390,7 @@ class ToolLoader:
     Orchestrates client creation using injected strategies and handlers:
     - SpecSourceStrategy: determines where to load specs from (local/live)
     - OpenApiHandler: provides service-specific auth and spec preprocessing
-    - SSLConfigManager: manages SSL verification settings
+    - SSLConfigManager: provides each service's SSL context
     """
 
     # Map spec_source config values to strategy classes
@@ -422,6 +429,9 @@ class ToolLoader:
         insecure: bool = False,
         version: str = '',
         spec_source: str = 'local',
+        lazy_schemas: bool = False,
+        service_type: str = '',
+        max_connections: int = http_pool.DEFAULT_MAX_CONNECTIONS,
     ) -> UtcpClient:
         """Create a UTCP client for a service.
 
@@ -433,6 +443,11 @@ class ToolLoader:
             insecure: Skip TLS verification for self-signed certificates
             version: Version of the spec to use (for local spec file lookup)
             spec_source: Where to load the spec from - 'local' or 'live'
+            lazy_schemas: Build only an operation index and resolve input
+                schemas on first use
+            service_type: Service type selecting the spec files and OpenAPI
+                handler (default: service_name)
+            max_connections: Pooled connections per host for operation calls
 
         Returns:
             Configured UtcpClient instance
@@ -442,18 +457,32 @@ class ToolLoader:
         # 1. Register protocol (idempotent)
         register_local_file_protocol()
 
-        # 2. Configure SSL if needed
-        if insecure:
-            self.ssl_manager.disable_ssl_verification()
-
-        # 3. Resolve spec source using per-service strategy
+        # 2. Resolve spec source using per-service strategy
+        service_type = service_type or service_name
         strategy_cls = self._SPEC_STRATEGIES.get(spec_source, LocalFileStrategy)
         strategy = strategy_cls()
-        resolved_source = strategy.resolve(service_name, openapi_url, version, self.specs_dir)
-        set_api_base_url(service_name, resolved_source.api_base_url)
+        resolved_source = strategy.resolve(service_type, openapi_url, version, self.specs_dir)
+
+        # 3. Get OpenAPI handler
+        handler = self.openapi_handlers.get(service_type, DefaultOpenApiHandler(service_type))
 
-        # 4. Get OpenAPI handler
-        handler = self.openapi_handlers.get(service_name, DefaultOpenApiHandler(service_name))
+        # 4. Collect the client's state: the connection pool for operation
+        # calls (with the service's own SSL context), API base URL, service
+        # type, lazy schemas and response exclusions. It replaces the
+        # service's current state only when the client is registered.
+        if insecure:
+            logger.warning(
+                '[%s] TLS verification disabled - use only for development', service_name
+            )
+        context = service_context.ServiceContext(
+            service_name=service_name,
+            service_type=service_type,
+            api_base_url=resolved_source.api_base_url,
+            lazy=lazy_schemas,
+            pool_settings=http_pool.PoolSettings.from_env(insecure, max_connections),
+            ssl_context=self.ssl_manager.ssl_context(insecure),
+            exclusions=handler.RESPONSE_EXCLUDE,
+        )
 
         # 5. Build call template
         call_template: dict = {
@@ -521,6 +550,10 @@ class ToolLoader:
             }
 
             variable_loader = handler.get_variable_loader(bearer_token)
+            if isinstance(variable_loader, BearerTokenLoader) and service_type != service_name:
+                # Auth placeholders are namespaced by the manual (service) name
+                namespace = re.escape(service_name.replace('_', '__'))
+                variable_loader.patterns.append(rf'{namespace}_API_KEY_\d+')
             if variable_loader:
                 load_variables_from.append(variable_loader)
 
@@ -549,13 +582,29 @@ class ToolLoader:
         logger.info('  - API base URL: %s', resolved_source.api_base_url)
         logger.info('  - Auth type: %s', auth_type)
         logger.info('  - Insecure mode: %s', insecure)
+        logger.info('  - Lazy schemas: %s', lazy_schemas)
+        logger.info('  - Service type: %s', service_type)
 
         config = UtcpClientConfig(**config_dict)
-        client = await UtcpClient.create(config=config)
+        with phase('client_create'), service_context.building(context):
+            client = await UtcpClient.create(config=config)
         self._clients[service_name] = client
         logger.info('[%s] UTCP client created successfully', service_name)
         return client
 
+    def remove_client(self, service_name: str) -> None:
+        """Forget a removed service's client and the shared state built for it.
+
+        Args:
+            service_name: Service name
+        """
+        self._clients.pop(service_name, None)
+        service_context.drop(service_name)
+        store = get_manual_store()
+        if store is not None:
+            store.release(service_name)
+        logger.info('[%s] Removed UTCP client', service_name)
+
     def load_service_tools(
         self,
         utcp_client: UtcpClient,
@@ -586,10 +635,11 @@ class ToolLoader:
         if not service_dir.exists():
             return []
 
-        versions = [
-            spec_file.stem
+        # A version may ship both a raw spec and its compiled bundle
+        versions = {
+            bundle_version(spec_file)
             for spec_file in service_dir.iterdir()
             if spec_file.suffix in ['.json', '.yaml', '.yml']
-        ]
+        }
 
         return sorted(versions)
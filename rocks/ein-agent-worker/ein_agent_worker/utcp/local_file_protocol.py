@@ -5,28 +5,59 @@ This extended protocol adds support for file:// URLs, enabling loading of
 OpenAPI specs from local files for offline development and testing.
 
 Additionally, this protocol applies security preprocessing (read-only filtering)
-to ALL specs (both file:// and https://) via OpenAPI handlers.
+to ALL specs (both file:// and https://) via OpenAPI handlers, and sends
+operation calls through each service's connection pool (see http_pool.py).
 """
 
-import json
+import asyncio
+import contextlib
+import hashlib
 import logging
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+import aiohttp
 import httpx
+import ijson
 import yaml
 from utcp_http.http_call_template import HttpCallTemplate
 from utcp_http.http_communication_protocol import HttpCommunicationProtocol
 from utcp_http.openapi_converter import OpenApiConverter
 
+from ein_agent_worker.utcp import http_pool, search, service_context
+from ein_agent_worker.utcp.lazy_schema import IndexOnlyOpenApiConverter, LazySchemaResolver
+from ein_agent_worker.utcp.manual_cache import ManualCache
+from ein_agent_worker.utcp.manual_store import (
+    ManualStore,
+    SharedManual,
+    content_key,
+    get_manual_store,
+)
 from ein_agent_worker.utcp.openapi_handlers import DEFAULT_OPENAPI_HANDLERS, OpenApiHandler
 from ein_agent_worker.utcp.openapi_handlers.default import DefaultOpenApiHandler
+from ein_agent_worker.utcp.service_context import ServiceContext
+from ein_agent_worker.utcp.spec.bundle import (
+    BundleError,
+    build_manual,
+    check_bundle,
+    compile_spec,
+    is_bundle,
+    load_search_index,
+    read_bundle,
+    source_spec_path,
+)
+from ein_agent_worker.utcp.spec.fetch import SpecFetcher
+from ein_agent_worker.utcp.spec.streaming import load_spec
+from ein_agent_worker.utcp.startup_report import phase, set_tool_count
+from utcp.data.auth_implementations.oauth2_auth import OAuth2Auth
 from utcp.data.call_template import CallTemplate
 from utcp.data.register_manual_response import RegisterManualResult
 from utcp.data.utcp_manual import UtcpManual, UtcpManualSerializer
 
 if TYPE_CHECKING:
+    from ein_agent_worker.utcp.semantic import SemanticIndex
     from utcp.utcp_client import UtcpClient
 
 logger = logging.getLogger(__name__)
@@ -34,35 +65,15 @@ logger = logging.getLogger(__name__)
 # Track if protocol has been registered
 _protocol_registered = False
 
-# Registry for API base URLs when using local spec files
-# Maps service_name -> actual API endpoint URL
-_api_base_urls: dict[str, str] = {}
+# Seconds an operation call may take (as in utcp-http)
+OPERATION_CALL_TIMEOUT = 30.0
 
 
-def set_api_base_url(service_name: str, url: str) -> None:
-    """Register the API base URL for a service.
+def _build_semantic_index(manual: UtcpManual, prefix: str) -> 'SemanticIndex':
+    # Imported here: NumPy is only needed once a manual is registered
+    from ein_agent_worker.utcp.semantic import SemanticIndex
 
-    When loading specs from local files, we need to know the real API
-    endpoint URL for making actual API calls.
-
-    Args:
-        service_name: The service name (e.g., 'kubernetes', 'grafana')
-        url: The actual API endpoint URL (e.g., 'https://10.x.x.x:6443')
-    """
-    _api_base_urls[service_name] = url
-    logger.debug('Registered API base URL for %s: %s', service_name, url)
-
-
-def get_api_base_url(service_name: str) -> str | None:
-    """Get the registered API base URL for a service.
-
-    Args:
-        service_name: The service name
-
-    Returns:
-        The API base URL if registered, None otherwise
-    """
-    return _api_base_urls.get(service_name)
+    return SemanticIndex.from_tools(manual.tools, prefix)
 
 
 class LocalFileHttpProtocol(HttpCommunicationProtocol):
@@ -78,9 +89,19 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
     def __init__(
         self,
         openapi_handlers: dict[str, OpenApiHandler] | None = None,
+        manual_cache: ManualCache | None = None,
+        spec_fetcher: SpecFetcher | None = None,
+        manual_store: ManualStore | None = None,
     ):
         super().__init__()
         self.openapi_handlers = openapi_handlers or DEFAULT_OPENAPI_HANDLERS
+        self.manual_cache = manual_cache or ManualCache.from_env()
+        self.spec_fetcher = spec_fetcher or SpecFetcher.from_env()
+        self.manual_store = manual_store if manual_store is not None else get_manual_store()
+
+    def _get_handler(self, service_type: str) -> OpenApiHandler:
+        """Get the OpenAPI handler for a service type."""
+        return self.openapi_handlers.get(service_type, DefaultOpenApiHandler(service_type))
 
     async def register_manual(
         self, caller: 'UtcpClient', manual_call_template: CallTemplate
@@ -100,22 +121,200 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
             raise ValueError('LocalFileHttpProtocol can only be used with HttpCallTemplate')
 
         url = manual_call_template.url
+        service_name = manual_call_template.name
+        # Filled in here and applied once the client is registered
+        context = service_context.current(service_name)
+        service_context.stage(caller, context)
 
-        # Handle file:// URLs by reading directly from disk
+        # Handle file:// URLs by reading directly from disk, and HTTP/HTTPS
+        # URLs with preprocessing
         if url.startswith('file://'):
-            return await self._register_from_file(manual_call_template, url)
+            result = await self._register_from_file(manual_call_template, url, context)
+        else:
+            result = await self._register_from_http(caller, manual_call_template, url, context)
+
+        # Bundles and shared operations come with prebuilt indexes; otherwise
+        # index the tools once here
+        if result.success:
+            prefix = f'{service_name}.'
+            if context.index is None:
+                with phase('index'):
+                    context.index = await asyncio.to_thread(
+                        search.SearchIndex.from_tools, result.manual.tools, prefix
+                    )
+            if context.semantic is None:
+                with phase('semantic_index'):
+                    context.semantic = await asyncio.to_thread(
+                        _build_semantic_index, result.manual, prefix
+                    )
+            # Published as the service's catalog once the client is registered
+            context.manual = result.manual
 
-        # Handle HTTP/HTTPS URLs with preprocessing
-        return await self._register_from_http(caller, manual_call_template, url)
+        set_tool_count(len(result.manual.tools))
+        return result
+
+    async def call_tool(
+        self,
+        caller: 'UtcpClient',
+        tool_name: str,
+        tool_args: dict[str, Any],
+        tool_call_template: CallTemplate,
+    ) -> Any:
+        """Call an operation through its service's connection pool.
+
+        Builds the request exactly as HttpCommunicationProtocol does, but
+        on the service's keep-alive session instead of a new session per
+        call. A service without a pool (its client is not registered yet)
+        gets a session of its own, with the SSL context of the client's
+        staged context, so an insecure service stays insecure either way.
+
+        Args:
+            caller: The UTCP client that is calling this method.
+            tool_name: Name of the tool to call.
+            tool_args: Arguments of the call.
+            tool_call_template: Call template of the tool to call.
+
+        Returns:
+            The response: parsed JSON, or text.
+        """
+        if not isinstance(tool_call_template, HttpCallTemplate):
+            return await super().call_tool(caller, tool_name, tool_args, tool_call_template)
+
+        headers = dict(tool_call_template.headers or {})
+        remaining_args = dict(tool_args)
+        for field_name in tool_call_template.header_fields or ():
+            if field_name in remaining_args:
+                headers[field_name] = str(remaining_args.pop(field_name))
+        body = None
+        if tool_call_template.body_field in remaining_args:
+            body = remaining_args.pop(tool_call_template.body_field)
+
+        url = self._build_url_with_path_params(tool_call_template.url, remaining_args)
+        # The remaining arguments are query parameters
+        auth, cookies = self._apply_auth(tool_call_template, headers, remaining_args)
+
+        json_body = data = None
+        if body is not None:
+            headers.setdefault('Content-Type', tool_call_template.content_type)
+            if 'application/json' in headers['Content-Type']:
+                json_body = body
+            else:
+                data = body
+
+        # Tool names are '<service>.<operation>'; call templates are named
+        # after the spec's title
+        async with self._call_session(caller, tool_name.split('.', 1)[0]) as session:
+            if isinstance(tool_call_template.auth, OAuth2Auth):
+                token = await self._fetch_oauth2_token(session, tool_call_template.auth)
+                headers['Authorization'] = f'Bearer {token}'
+            async with session.request(
+                tool_call_template.http_method,
+                url,
+                params=remaining_args,
+                headers=headers,
+                auth=auth,
+                json=json_body,
+                data=data,
+                cookies=cookies,
+                timeout=aiohttp.ClientTimeout(total=OPERATION_CALL_TIMEOUT),
+            ) as response:
+                response.raise_for_status()
+                if 'application/json' in response.headers.get('Content-Type', '').lower():
+                    try:
+                        return await response.json()
+                    except Exception:
+                        logger.error(
+                            "Invalid JSON response from tool '%s' despite its Content-Type",
+                            tool_name,
+                        )
+                return await response.text()
+
+    @contextlib.asynccontextmanager
+    async def _call_session(
+        self, caller: 'UtcpClient', service_name: str
+    ) -> AsyncIterator[aiohttp.ClientSession]:
+        """Get the session for a service's calls: its pool's, or one for this call."""
+        pool = http_pool.get_pool(service_name)
+        if pool is not None:
+            async with pool.session() as session:
+                yield session
+            return
+
+        context = service_context.staged(caller, service_name)
+        ssl_context = context.ssl_context if context is not None else None
+        connector = aiohttp.TCPConnector(ssl=ssl_context if ssl_context is not None else True)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            yield session
+
+    async def _fetch_oauth2_token(self, session: aiohttp.ClientSession, auth: OAuth2Auth) -> str:
+        """Get an OAuth2 client credentials token, on the service's session.
+
+        As HttpCommunicationProtocol._handle_oauth2: tokens are cached per
+        client ID, and the credentials are sent in the body, then in a
+        Basic Auth header if that fails.
+        """
+        if auth.client_id in self._oauth_tokens:
+            return self._oauth_tokens[auth.client_id]['access_token']
+
+        attempts = (
+            (
+                {
+                    'grant_type': 'client_credentials',
+                    'client_id': auth.client_id,
+                    'client_secret': auth.client_secret,
+                    'scope': auth.scope,
+                },
+                None,
+            ),
+            (
+                {'grant_type': 'client_credentials', 'scope': auth.scope},
+                aiohttp.BasicAuth(auth.client_id, auth.client_secret),
+            ),
+        )
+        error: aiohttp.ClientError | None = None
+        for data, basic_auth in attempts:
+            try:
+                async with session.post(auth.token_url, data=data, auth=basic_auth) as response:
+                    response.raise_for_status()
+                    token_response = await response.json()
+            except aiohttp.ClientError as e:
+                logger.error('OAuth2 token fetch from %s failed: %s', auth.token_url, e)
+                error = e
+                continue
+            self._oauth_tokens[auth.client_id] = token_response
+            return token_response['access_token']
+        raise error
 
     async def _register_from_file(
-        self, manual_call_template: HttpCallTemplate, file_url: str
+        self, manual_call_template: HttpCallTemplate, file_url: str, context: ServiceContext
     ) -> RegisterManualResult:
         """Load OpenAPI spec from a local file.
 
+        Reading, parsing and converting the spec is CPU-bound, so it runs in a
+        worker thread to keep the event loop free for other services that are
+        initializing concurrently.
+
         Args:
             manual_call_template: The call template containing configuration.
             file_url: The file:// URL pointing to the spec file.
+            context: The context of the client being built.
+
+        Returns:
+            RegisterManualResult with the loaded manual or error details.
+        """
+        return await asyncio.to_thread(
+            self._load_from_file, manual_call_template, file_url, context
+        )
+
+    def _load_from_file(
+        self, manual_call_template: HttpCallTemplate, file_url: str, context: ServiceContext
+    ) -> RegisterManualResult:
+        """Read, parse and convert a local spec file (blocking).
+
+        Args:
+            manual_call_template: The call template containing configuration.
+            file_url: The file:// URL pointing to the spec file.
+            context: The context of the client being built.
 
         Returns:
             RegisterManualResult with the loaded manual or error details.
@@ -136,13 +335,107 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
 
             logger.info('Loading OpenAPI spec from local file: %s', file_path)
 
-            # Read and parse the file
-            content = file_path.read_text()
+            service_name = manual_call_template.name
+            api_base_url = context.api_base_url
+            handler = self._get_handler(context.service_type)
+
+            # Compiled bundles need no spec processing at all
+            if is_bundle(file_path):
+                with phase('read'):
+                    bundle = read_bundle(file_path)
+                try:
+                    utcp_manual = self._load_bundle(
+                        manual_call_template, file_path, bundle, handler, context
+                    )
+                    return RegisterManualResult(
+                        success=True,
+                        manual_call_template=manual_call_template,
+                        manual=utcp_manual,
+                        errors=[],
+                    )
+                except BundleError as e:
+                    # Fall back to the raw spec the bundle was compiled from
+                    source_path = source_spec_path(file_path, bundle)
+                    if not source_path.exists():
+                        raise
+                    logger.warning(
+                        '[%s] Not using bundle %s (%s), loading %s instead',
+                        service_name,
+                        file_path.name,
+                        e,
+                        source_path.name,
+                    )
+                    file_path = source_path
 
-            if file_path.suffix in ['.yaml', '.yml']:
-                spec_data = yaml.safe_load(content)
-            else:
-                spec_data = json.loads(content)
+            is_yaml = file_path.suffix in ['.yaml', '.yml']
+            lazy = context.lazy
+
+            # In lazy mode, schemas are resolved from the file on first use
+            context.resolver = (
+                LazySchemaResolver(service_name, handler, file_path.read_bytes, is_yaml)
+                if lazy
+                else None
+            )
+
+            with phase('read'):
+                content = file_path.read_bytes()
+
+            # Share one compiled operation set between services using this spec
+            if self.manual_store is not None and not lazy and not manual_call_template.auth_tools:
+                shared = self._get_shared(
+                    service_name,
+                    hashlib.sha256(content).hexdigest(),
+                    handler,
+                    lambda: compile_spec(
+                        content, file_path.name, service_name, handler, is_yaml=is_yaml
+                    ),
+                )
+                if shared is not None:
+                    spec_header = dict(shared.bundle['spec'])
+                    spec_url = self._bind_api_base_url(
+                        spec_header, handler, api_base_url, manual_call_template
+                    )
+                    utcp_manual = self._bind_shared(
+                        manual_call_template, shared, spec_header, spec_url, context
+                    )
+                    return RegisterManualResult(
+                        success=True,
+                        manual_call_template=manual_call_template,
+                        manual=utcp_manual,
+                        errors=[],
+                    )
+            elif self.manual_store is not None:
+                self.manual_store.release(service_name)
+
+            # Try the converted manual cache before parsing
+            cache_key = None
+            if self.manual_cache and not manual_call_template.auth_tools:
+                cache_key = ManualCache.build_key(
+                    content,
+                    handler,
+                    api_base_url or manual_call_template.url,
+                    manual_call_template.name,
+                    lazy=lazy,
+                )
+                with phase('cache_load'):
+                    cached_manual = self.manual_cache.load(cache_key)
+                if cached_manual is not None:
+                    logger.info(
+                        '[%s] Loaded converted UTCP manual from cache (%d tools)',
+                        service_name,
+                        len(cached_manual.tools),
+                    )
+                    return RegisterManualResult(
+                        success=True,
+                        manual_call_template=manual_call_template,
+                        manual=cached_manual,
+                        errors=[],
+                    )
+
+            with phase('parse'):
+                spec_data = load_spec(
+                    content, service_name, handler.READ_ONLY_METHODS, is_yaml=is_yaml
+                )
 
             # Check if UTCP manual or OpenAPI spec
             if 'utcp_version' in spec_data and 'tools' in spec_data:
@@ -152,63 +445,33 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                 )
                 utcp_manual = UtcpManualSerializer().validate_dict(spec_data)
             else:
-                # Convert OpenAPI spec to UTCP manual
-                service_name = manual_call_template.name
-                api_base_url = get_api_base_url(service_name)
-
                 # Apply service-specific preprocessing via handler
-                handler = self.openapi_handlers.get(
-                    service_name, DefaultOpenApiHandler(service_name)
-                )
-                spec_data = handler.preprocess_spec(spec_data, service_name)
+                with phase('preprocess'):
+                    spec_data = handler.preprocess_spec(spec_data, service_name)
 
                 # Construct the full base URL for API operations
                 # OpenApiConverter uses spec_url as the base for all API calls
-                spec_url_param = None
-
-                if api_base_url:
-                    parsed = urlparse(api_base_url)
-
-                    # Delegate URL resolution to the handler
-                    resolved_url = handler.resolve_server_url(
-                        spec_data, api_base_url, service_name
-                    )
-                    spec_data['servers'] = [{'url': resolved_url}]
-
-                    # Set host and scheme for fallback
-                    spec_data['host'] = parsed.netloc
-                    spec_data['schemes'] = [parsed.scheme]
-
-                    # Use scheme://host as spec_url
-                    spec_url_param = f'{parsed.scheme}://{parsed.netloc}'
-                    logger.info(
-                        '[%s] Set spec: host=%s, scheme=%s, spec_url=%s',
-                        service_name,
-                        parsed.netloc,
-                        parsed.scheme,
-                        spec_url_param,
-                    )
-                else:
-                    # No configured API base URL, fall back to spec file URL
-                    spec_url_param = manual_call_template.url
-                    logger.warning(
-                        '[%s] No API base URL configured, falling back to spec URL: %s',
-                        service_name,
-                        spec_url_param,
-                    )
+                spec_url_param = self._bind_api_base_url(
+                    spec_data, handler, api_base_url, manual_call_template
+                )
 
                 logger.info(
                     '[%s] Converting OpenAPI spec to UTCP manual with base URL: %s',
                     service_name,
                     spec_url_param,
                 )
-                converter = OpenApiConverter(
+                converter_cls = IndexOnlyOpenApiConverter if lazy else OpenApiConverter
+                converter = converter_cls(
                     spec_data,
                     spec_url=spec_url_param,
                     call_template_name=manual_call_template.name,
                     auth_tools=manual_call_template.auth_tools,
                 )
-                utcp_manual = converter.convert()
+                with phase('convert'):
+                    utcp_manual = converter.convert()
+
+                if cache_key:
+                    self.manual_cache.store(cache_key, utcp_manual)
 
             return RegisterManualResult(
                 success=True,
@@ -217,7 +480,7 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                 errors=[],
             )
 
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+        except (ijson.JSONError, yaml.YAMLError) as e:
             error_msg = f'Error parsing spec file: {e}'
             logger.error(error_msg)
             return RegisterManualResult(
@@ -236,21 +499,219 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                 errors=[error_msg],
             )
 
+    def _bind_api_base_url(
+        self,
+        spec_data: dict,
+        handler: OpenApiHandler,
+        api_base_url: str | None,
+        manual_call_template: HttpCallTemplate,
+    ) -> str:
+        """Point a local spec at the configured API server.
+
+        Sets the spec's servers/host/schemes from the configured API base URL
+        (resolved by the handler), modifying spec_data in place.
+
+        Args:
+            spec_data: The preprocessed spec, or a bundle's spec fields.
+            handler: The OpenAPI handler for the service.
+            api_base_url: The configured API base URL, if any.
+            manual_call_template: The call template containing configuration.
+
+        Returns:
+            The spec_url to convert with.
+        """
+        service_name = manual_call_template.name
+
+        if not api_base_url:
+            # No configured API base URL, fall back to spec file URL
+            logger.warning(
+                '[%s] No API base URL configured, falling back to spec URL: %s',
+                service_name,
+                manual_call_template.url,
+            )
+            return manual_call_template.url
+
+        parsed = urlparse(api_base_url)
+
+        # Delegate URL resolution to the handler
+        with phase('resolve_server_url'):
+            resolved_url = handler.resolve_server_url(spec_data, api_base_url, service_name)
+        spec_data['servers'] = [{'url': resolved_url}]
+
+        # Set host and scheme for fallback
+        spec_data['host'] = parsed.netloc
+        spec_data['schemes'] = [parsed.scheme]
+
+        # Use scheme://host as spec_url
+        spec_url = f'{parsed.scheme}://{parsed.netloc}'
+        logger.info(
+            '[%s] Set spec: host=%s, scheme=%s, spec_url=%s',
+            service_name,
+            parsed.netloc,
+            parsed.scheme,
+            spec_url,
+        )
+        return spec_url
+
+    def _load_bundle(
+        self,
+        manual_call_template: HttpCallTemplate,
+        bundle_path: Path,
+        bundle: dict,
+        handler: OpenApiHandler,
+        context: ServiceContext,
+    ) -> UtcpManual:
+        """Materialize a compiled spec bundle (blocking).
+
+        Args:
+            manual_call_template: The call template containing configuration.
+            bundle_path: Path the bundle was read from.
+            bundle: The bundle document.
+            handler: The OpenAPI handler for the service.
+            context: The context of the client being built.
+
+        Returns:
+            The manual with call templates bound to the API server.
+
+        Raises:
+            BundleError: If the bundle cannot be used for this service.
+        """
+        service_name = manual_call_template.name
+        if manual_call_template.auth_tools:
+            raise BundleError('auth_tools require converting the raw spec')
+        check_bundle(bundle, bundle_path, handler)
+
+        # Bundles carry full schemas (interned and shared), so lazy mode has
+        # nothing left to defer
+        context.resolver = None
+
+        spec_header = dict(bundle['spec'])
+        spec_url = self._bind_api_base_url(
+            spec_header, handler, context.api_base_url, manual_call_template
+        )
+
+        # A raw spec and its bundle share the content address (the raw spec's hash)
+        if self.manual_store is not None:
+            shared = self._get_shared(
+                service_name, bundle['source']['sha256'], handler, lambda: bundle, persist=False
+            )
+            if shared is not None:
+                return self._bind_shared(
+                    manual_call_template, shared, spec_header, spec_url, context
+                )
+
+        with phase('bind'):
+            utcp_manual = build_manual(bundle, spec_header, spec_url)
+        context.index = load_search_index(bundle, f'{service_name}.')
+
+        logger.info(
+            '[%s] Loaded compiled bundle %s (%d tools, %d shared schemas)',
+            service_name,
+            bundle_path.name,
+            len(utcp_manual.tools),
+            len(bundle['schemas']),
+        )
+        return utcp_manual
+
+    def _get_shared(
+        self,
+        service_name: str,
+        spec_sha256: str,
+        handler: OpenApiHandler,
+        compile_bundle: Callable[[], dict],
+        persist: bool = True,
+    ) -> SharedManual | None:
+        """Get the shared compiled operations for a spec (blocking).
+
+        Args:
+            service_name: The service binding the operations.
+            spec_sha256: Hex SHA-256 digest of the raw spec contents.
+            handler: The OpenAPI handler for the service.
+            compile_bundle: Compiles the spec (called on a miss only).
+            persist: Whether to keep compiled operations in the manual cache.
+
+        Returns:
+            The shared entry, or None if the spec is not an OpenAPI spec
+            (e.g., a UTCP manual).
+        """
+        key = content_key(spec_sha256, handler)
+
+        def load_or_compile() -> dict:
+            if persist and self.manual_cache:
+                with phase('cache_load'):
+                    bundle = self.manual_cache.load_compiled(key)
+                if bundle is not None:
+                    logger.info('[%s] Loaded compiled operations from cache', service_name)
+                    return bundle
+            bundle = compile_bundle()
+            if persist and self.manual_cache:
+                self.manual_cache.store_compiled(key, bundle)
+            return bundle
+
+        try:
+            return self.manual_store.get_or_compile(key, service_name, load_or_compile)
+        except BundleError as e:
+            logger.debug('[%s] Not sharing operations: %s', service_name, e)
+            self.manual_store.release(service_name)
+            return None
+
+    def _bind_shared(
+        self,
+        manual_call_template: HttpCallTemplate,
+        shared: SharedManual,
+        spec_header: dict,
+        spec_url: str,
+        context: ServiceContext,
+    ) -> UtcpManual:
+        """Bind shared compiled operations to a service (blocking).
+
+        Args:
+            manual_call_template: The call template containing configuration.
+            shared: The shared compiled operations.
+            spec_header: The spec fields, with the server URL resolved.
+            spec_url: Fallback URL used when the spec declares no servers.
+            context: The context of the client being built.
+
+        Returns:
+            The service's manual, with schemas shared with other services.
+        """
+        service_name = manual_call_template.name
+        prefix = f'{service_name}.'
+        with phase('bind'):
+            utcp_manual = build_manual(shared.bundle, spec_header, spec_url, shared.schemas)
+        # The indexes are shared too, viewed under this service's tool names
+        names = [prefix + name for name in shared.index.names]
+        context.index = shared.index.with_names(names)
+        context.semantic = shared.semantic.with_names(names)
+        context.kubernetes = shared.kubernetes.with_prefix(prefix)
+        logger.info(
+            '[%s] Bound %d shared operations (%d schemas, %d service(s) sharing)',
+            service_name,
+            len(utcp_manual.tools),
+            len(shared.schemas),
+            len(shared.services),
+        )
+        return utcp_manual
+
     async def _register_from_http(
         self,
         caller: 'UtcpClient',
         manual_call_template: HttpCallTemplate,
         http_url: str,
+        context: ServiceContext,
     ) -> RegisterManualResult:
         """Load OpenAPI spec from HTTP/HTTPS URL with preprocessing.
 
         Fetches the spec from a live URL and applies security preprocessing
-        (read-only filtering) before converting to UTCP manual.
+        (read-only filtering) before converting to UTCP manual. Fetches are
+        conditional against an on-disk copy, which is also used when the
+        endpoint is unreachable (see spec/fetch.py).
 
         Args:
             caller: The UTCP client making the request.
             manual_call_template: The call template containing configuration.
             http_url: The HTTP/HTTPS URL pointing to the spec.
+            context: The context of the client being built.
 
         Returns:
             RegisterManualResult with the loaded manual or error details.
@@ -275,34 +736,20 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                     auth.var_name,
                 )
 
-            # Fetch spec from URL using httpx
-            async with httpx.AsyncClient(verify=False) as client:  # noqa: S501
-                response = await client.get(http_url, headers=headers)
-                response.raise_for_status()
-
-                # Parse response
-                content_type = response.headers.get('content-type', '')
-                if 'yaml' in content_type or http_url.endswith(('.yaml', '.yml')):
-                    spec_data = yaml.safe_load(response.text)
-                else:
-                    spec_data = response.json()
-
-            # Apply service-specific preprocessing via handler
-            handler = self.openapi_handlers.get(service_name, DefaultOpenApiHandler(service_name))
-            spec_data = handler.preprocess_spec(spec_data, service_name)
+            # Fetch spec (revalidated against, or falling back to, the disk cache)
+            with phase('fetch'):
+                fetched = await self.spec_fetcher.fetch(service_name, http_url, headers)
 
-            # Convert OpenAPI spec to UTCP manual
-            logger.info(
-                '[%s] Converting OpenAPI spec to UTCP manual (from live URL)',
-                service_name,
-            )
-            converter = OpenApiConverter(
-                spec_data,
-                spec_url=http_url,
-                call_template_name=manual_call_template.name,
-                auth_tools=manual_call_template.auth_tools,
+            # Parse and convert off the event loop (CPU-bound for large specs)
+            is_yaml = 'yaml' in fetched.content_type or http_url.endswith(('.yaml', '.yml'))
+            utcp_manual = await asyncio.to_thread(
+                self._convert_http_spec,
+                manual_call_template,
+                http_url,
+                fetched.content,
+                is_yaml,
+                context,
             )
-            utcp_manual = converter.convert()
 
             return RegisterManualResult(
                 success=True,
@@ -320,7 +767,7 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                 manual=UtcpManual(manual_version='0.0.0', tools=[]),
                 errors=[error_msg],
             )
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+        except (ijson.JSONError, yaml.YAMLError) as e:
             error_msg = f'Error parsing spec from {http_url}: {e}'
             logger.error(error_msg)
             return RegisterManualResult(
@@ -339,6 +786,94 @@ class LocalFileHttpProtocol(HttpCommunicationProtocol):
                 errors=[error_msg],
             )
 
+    def _convert_http_spec(
+        self,
+        manual_call_template: HttpCallTemplate,
+        http_url: str,
+        content: bytes,
+        is_yaml: bool,
+        context: ServiceContext,
+    ) -> UtcpManual:
+        """Parse, preprocess and convert a fetched spec (blocking).
+
+        Args:
+            manual_call_template: The call template containing configuration.
+            http_url: The URL the spec was fetched from.
+            content: The raw response body.
+            is_yaml: Whether the body is YAML rather than JSON.
+            context: The context of the client being built.
+
+        Returns:
+            The converted UtcpManual.
+        """
+        service_name = manual_call_template.name
+        handler = self._get_handler(context.service_type)
+        lazy = context.lazy
+
+        # In lazy mode, keep the raw body to resolve schemas from on first use
+        context.resolver = (
+            LazySchemaResolver(service_name, handler, lambda: content, is_yaml) if lazy else None
+        )
+
+        # Clusters serving the same spec share one compiled operation set
+        if self.manual_store is not None and not lazy and not manual_call_template.auth_tools:
+            shared = self._get_shared(
+                service_name,
+                hashlib.sha256(content).hexdigest(),
+                handler,
+                lambda: compile_spec(content, http_url, service_name, handler, is_yaml=is_yaml),
+            )
+            if shared is not None:
+                return self._bind_shared(
+                    manual_call_template, shared, shared.bundle['spec'], http_url, context
+                )
+        elif self.manual_store is not None:
+            self.manual_store.release(service_name)
+
+        # An unchanged live spec converts to the same manual as last time
+        cache_key = None
+        if self.manual_cache and not manual_call_template.auth_tools:
+            cache_key = ManualCache.build_key(
+                content, handler, http_url, manual_call_template.name, lazy=lazy
+            )
+            with phase('cache_load'):
+                cached_manual = self.manual_cache.load(cache_key)
+            if cached_manual is not None:
+                logger.info(
+                    '[%s] Loaded converted UTCP manual from cache (%d tools)',
+                    service_name,
+                    len(cached_manual.tools),
+                )
+                return cached_manual
+
+        with phase('parse'):
+            spec_data = load_spec(
+                content, service_name, handler.READ_ONLY_METHODS, is_yaml=is_yaml
+            )
+
+        # Apply service-specific preprocessing via handler
+        with phase('preprocess'):
+            spec_data = handler.preprocess_spec(spec_data, service_name)
+
+        # Convert OpenAPI spec to UTCP manual
+        logger.info(
+            '[%s] Converting OpenAPI spec to UTCP manual (from live URL)',
+            service_name,
+        )
+        converter_cls = IndexOnlyOpenApiConverter if lazy else OpenApiConverter
+        converter = converter_cls(
+            spec_data,
+            spec_url=http_url,
+            call_template_name=manual_call_template.name,
+            auth_tools=manual_call_template.auth_tools,
+        )
+        with phase('convert'):
+            utcp_manual = converter.convert()
+
+        if cache_key:
+            self.manual_cache.store(cache_key, utcp_manual)
+        return utcp_manual
+
 
 def register_local_file_protocol() -> None:
     """Register the LocalFileHttpProtocol to handle file:// URLs.
@@ -0,0 +1,77 @@
+"""Bounded, thread-safe LRU cache with hit/miss accounting."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Sentinel distinguishing a miss from a cached None
+_MISSING = object()
+
+
+class LRUCache:
+    """A least-recently-used mapping holding at most `maxsize` entries.
+
+    Used where values are expensive to build but cheap to rebuild, so
+    evicting them under memory pressure is always safe.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = max(maxsize, 0)
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, marking it most recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a miss.
+
+        Returns:
+            The cached value, or default.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh an entry, evicting the least recently used ones.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
@@ -0,0 +1,175 @@
+"""Persistent on-disk cache of converted UTCP manuals.
+
+Converting an OpenAPI spec into a UTCP manual (parse, read-only filtering,
+OpenApiConverter) is repeated for every service on every worker start.
+The result only depends on the spec contents, the handler that preprocessed
+it, the API base URL it was bound to and the utcp-http converter version,
+so it is stored here and reused by later starts.
+
+Compiled operation sets shared between services (see manual_store.py) do
+not depend on the base URL, and are stored keyed by content address only.
+
+Configuration:
+    UTCP_MANUAL_CACHE_ENABLED: Enable the manual cache (default: true)
+    UTCP_MANUAL_CACHE_DIR: Cache directory (default: ~/.cache/ein-agent/utcp-manuals)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from ein_agent_worker.utcp.openapi_handlers import OpenApiHandler
+from ein_agent_worker.utcp.versions import handler_id, utcp_http_version
+from utcp.data.utcp_manual import UtcpManual
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached artifact layout or conversion pipeline changes
+CACHE_FORMAT_VERSION = '1'
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'ein-agent' / 'utcp-manuals'
+
+
+class ManualCache:
+    """Store converted, already-filtered UTCP manuals on disk.
+
+    Entries are gzip-compressed JSON dumps of the UtcpManual, named after
+    a key that covers everything the conversion depends on. Any I/O or
+    validation error is treated as a cache miss so a broken cache never
+    prevents the worker from starting.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def from_env(cls) -> 'ManualCache | None':
+        """Create a cache from environment variables.
+
+        Returns:
+            A ManualCache, or None if caching is disabled.
+        """
+        if os.getenv('UTCP_MANUAL_CACHE_ENABLED', 'true').lower() != 'true':
+            logger.info('UTCP manual cache disabled')
+            return None
+        cache_dir = os.getenv('UTCP_MANUAL_CACHE_DIR', '')
+        return cls(Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR)
+
+    @staticmethod
+    def build_key(
+        spec_bytes: bytes,
+        handler: OpenApiHandler,
+        base_url: str,
+        call_template_name: str,
+        lazy: bool = False,
+    ) -> str:
+        """Build the cache key for a spec conversion.
+
+        The resolved server URL is derived by the handler from the spec and
+        the configured base URL, so keying on (spec hash, handler, base URL)
+        identifies it without having to parse the spec first.
+
+        Args:
+            spec_bytes: Raw contents of the spec file.
+            handler: The OpenAPI handler used to preprocess the spec.
+            base_url: The configured API base URL (or spec URL fallback).
+            call_template_name: The manual call template name.
+            lazy: Whether the manual is a schema-less lazy-mode index.
+
+        Returns:
+            Hex digest identifying the converted manual.
+        """
+        parts = [
+            CACHE_FORMAT_VERSION,
+            hashlib.sha256(spec_bytes).hexdigest(),
+            handler_id(handler),
+            base_url,
+            call_template_name,
+            'lazy' if lazy else 'full',
+            utcp_http_version(),
+        ]
+        return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.json.gz'
+
+    def load(self, key: str) -> UtcpManual | None:
+        """Load a cached manual.
+
+        Args:
+            key: Cache key from build_key().
+
+        Returns:
+            The cached UtcpManual, or None on a miss.
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return UtcpManual.model_validate_json(gzip.decompress(path.read_bytes()))
+        except Exception as e:
+            logger.warning('Ignoring unreadable UTCP manual cache entry %s: %s', path, e)
+            return None
+
+    def store(self, key: str, manual: UtcpManual) -> None:
+        """Persist a converted manual.
+
+        Args:
+            key: Cache key from build_key().
+            manual: The converted UtcpManual.
+        """
+        self._write(self._path(key), manual.model_dump_json(by_alias=True).encode())
+
+    def _compiled_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.bundle.json.gz'
+
+    def load_compiled(self, key: str) -> dict | None:
+        """Load a cached compiled operation set (see manual_store.py).
+
+        Args:
+            key: Content address from manual_store.content_key().
+
+        Returns:
+            The bundle document, or None on a miss.
+        """
+        path = self._compiled_path(key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except Exception as e:
+            logger.warning('Ignoring unreadable UTCP manual cache entry %s: %s', path, e)
+            return None
+
+    def store_compiled(self, key: str, bundle: dict) -> None:
+        """Persist a compiled operation set.
+
+        Args:
+            key: Content address from manual_store.content_key().
+            bundle: The bundle document.
+        """
+        self._write(
+            self._compiled_path(key),
+            json.dumps(bundle, separators=(',', ':'), ensure_ascii=False).encode(),
+        )
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Compress and write an entry.
+
+        The entry is written to a temporary file and atomically renamed so
+        concurrent workers sharing the directory never see partial files.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data = gzip.compress(data, compresslevel=1)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+            logger.info('Stored UTCP manual cache entry %s (%d bytes)', path.name[:12], len(data))
+        except OSError as e:
+            logger.warning('Failed to write UTCP manual cache entry: %s', e)
@@ -0,0 +1,205 @@
+"""Process-wide, content-addressed store of compiled operation sets.
+
+Several UTCP services often load the same spec, typically one
+`UTCP_SERVICES` entry per Kubernetes cluster, all on the same version.
+Converting the spec separately for each of them holds one full copy of
+every operation and schema per cluster, although only the API base URL
+and the auth differ.
+
+Instead, a spec is compiled once into the server-relative bundle layout
+(see spec/bundle.py), keyed by the hash of its contents and the handler
+that preprocessed it. Its schemas are materialized once as shared
+JsonSchema objects, and its search, semantic and Kubernetes operation
+indexes are built once, by operation ID. Each service only binds its own
+base URL and call template name on top, and views the indexes under its
+own tool name prefix. Memory then grows with the number of distinct spec
+versions, not the number of clusters, except for the tool objects
+themselves: the UTCP client renames those with the service prefix.
+
+Compiled entries are also persisted in the manual cache, so later worker
+starts skip parsing even for raw (uncompiled) specs.
+
+Configuration:
+    UTCP_SHARED_MANUALS_ENABLED: Share compiled operations between services (default: true)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ein_agent_worker.utcp.kubernetes_operations import KubernetesOperationIndex, parse_operation
+from ein_agent_worker.utcp.openapi_handlers import OpenApiHandler
+from ein_agent_worker.utcp.search import SearchIndex, operation_fields
+from ein_agent_worker.utcp.spec.bundle import BUNDLE_FORMAT_VERSION, load_search_index
+from ein_agent_worker.utcp.startup_report import phase
+from ein_agent_worker.utcp.versions import handler_id, utcp_http_version
+from utcp.data.tool import JsonSchema, JsonSchemaSerializer
+
+if TYPE_CHECKING:
+    from ein_agent_worker.utcp.semantic import SemanticIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SharedManual:
+    """A compiled operation set shared by every service loading the same spec.
+
+    Attributes:
+        key: Content address (see content_key())
+        bundle: Compiled bundle document (operations with server-relative URLs)
+        schemas: The bundle's schema table as shared JsonSchema objects
+        index: Search index, naming operations by ID
+        semantic: Semantic index, naming operations by ID
+        kubernetes: Kubernetes operation index, naming operations by ID
+        services: Names of the services bound to this entry
+    """
+
+    key: str
+    bundle: dict
+    schemas: list[JsonSchema]
+    index: SearchIndex
+    semantic: 'SemanticIndex'
+    kubernetes: KubernetesOperationIndex
+    services: set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, key: str, bundle: dict) -> 'SharedManual':
+        """Materialize a bundle's schemas and build its operation indexes.
+
+        Args:
+            key: Content address
+            bundle: Compiled bundle document
+
+        Returns:
+            The entry, bound to no service yet
+        """
+        # Imported here: NumPy is only needed once a manual is registered
+        from ein_agent_worker.utcp.semantic import SemanticIndex
+
+        names, fields, kubernetes = [], [], []
+        for operation in bundle['operations']:
+            name, tags = operation['name'], operation['tags']
+            url = operation['call_template'].get('url', '')
+            names.append(name)
+            fields.append(operation_fields(name, tags, url, operation['description']))
+            parsed = parse_operation(name, tags, url)
+            if parsed is not None:
+                kubernetes.append(parsed)
+
+        schema_serializer = JsonSchemaSerializer()
+        with phase('semantic_index'):
+            semantic = SemanticIndex.build(names, fields)
+        return cls(
+            key=key,
+            bundle=bundle,
+            schemas=[schema_serializer.validate_dict(data) for data in bundle['schemas']],
+            index=load_search_index(bundle),
+            semantic=semantic,
+            kubernetes=KubernetesOperationIndex(kubernetes),
+        )
+
+
+def content_key(spec_sha256: str, handler: OpenApiHandler) -> str:
+    """Build the content address of a compiled spec.
+
+    Args:
+        spec_sha256: Hex SHA-256 digest of the raw spec contents.
+        handler: The OpenAPI handler used to preprocess the spec.
+
+    Returns:
+        Hex digest identifying the compiled operation set.
+    """
+    parts = [str(BUNDLE_FORMAT_VERSION), spec_sha256, handler_id(handler), utcp_http_version()]
+    return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+
+class ManualStore:
+    """Compiled operation sets keyed by content address.
+
+    Services initialize concurrently in worker threads, so compilation is
+    serialized per key: the first service compiles and the others wait for
+    and reuse its result.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, SharedManual] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    def get_or_compile(
+        self, key: str, service_name: str, compile_bundle: Callable[[], dict]
+    ) -> SharedManual:
+        """Get the entry for a key, compiling it on first use.
+
+        Args:
+            key: Content address from content_key().
+            service_name: The service binding the entry.
+            compile_bundle: Returns the bundle document (called on a miss only).
+
+        Returns:
+            The shared entry, with service_name recorded as a user.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                entry = SharedManual.build(key, compile_bundle())
+            else:
+                logger.info(
+                    '[%s] Sharing compiled operations with %s (%d operations, %d schemas)',
+                    service_name,
+                    ', '.join(sorted(entry.services)),
+                    len(entry.bundle['operations']),
+                    len(entry.schemas),
+                )
+
+            with self._lock:
+                entry.services.add(service_name)
+                self._entries[key] = entry
+                # A re-registered service may have moved to another spec
+                self._unbind(service_name, keep=key)
+        return entry
+
+    def release(self, service_name: str) -> None:
+        """Unbind a service, dropping entries no other service uses.
+
+        Args:
+            service_name: The service name.
+        """
+        with self._lock:
+            self._unbind(service_name)
+
+    def _unbind(self, service_name: str, keep: str | None = None) -> None:
+        for key, entry in list(self._entries.items()):
+            if key == keep:
+                continue
+            entry.services.discard(service_name)
+            if not entry.services:
+                del self._entries[key]
+                self._key_locks.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every protocol instance in the process
+_store = ManualStore()
+
+
+def get_manual_store() -> ManualStore | None:
+    """Get the process-wide store.
+
+    Returns:
+        The store, or None if sharing is disabled.
+    """
+    if os.getenv('UTCP_SHARED_MANUALS_ENABLED', 'true').lower() != 'true':
+        return None
+    return _store
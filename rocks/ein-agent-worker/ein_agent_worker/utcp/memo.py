@@ -0,0 +1,139 @@
+"""Worker-wide memoization of UTCP discovery responses.
+
+Agents repeat the same discovery calls constantly: the same search in
+nearly every investigation, and again in each specialist after a handoff.
+A service's catalog (see catalog.py) only changes when its client is
+replaced, and each replacement gets a new catalog version, so the
+responses of the search, details and list activities are memoized per worker
+for all workflows, keyed by:
+
+    search:     (service, catalog version, normalized query, limit)
+    search_all: (((service, catalog version), ...), normalized query, limit)
+    details:    (service, catalog version, tool name, verbose)
+    list:       (service, catalog version, tag, resource, mode, page, page size)
+
+Entries of replaced catalogs are never hit again and age out of the
+bounded LRU caches; there is no TTL. Only successful responses are
+memoized.
+
+When a metric meter is set (see worker.py), lookups are recorded as:
+
+    utcp_memo_hits{cache}      counter
+    utcp_memo_misses{cache}    counter
+    utcp_memo_hit_rate{cache}  gauge, hits / lookups since start
+
+Configuration:
+    UTCP_MEMO_CACHE_SIZE: Responses kept per cache (default: 1024, 0 disables)
+"""
+
+import logging
+import os
+from collections.abc import Hashable
+from typing import Any
+
+from temporalio.common import MetricMeter
+
+from ein_agent_worker.utcp.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMO_CACHE_SIZE = 1024
+
+# Metric instruments, created by set_metric_meter()
+_metrics: dict[str, Any] = {}
+
+
+def _memo_cache_size_from_env() -> int:
+    value = os.getenv('UTCP_MEMO_CACHE_SIZE', str(DEFAULT_MEMO_CACHE_SIZE))
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            'Invalid UTCP_MEMO_CACHE_SIZE %r, using default %d',
+            value,
+            DEFAULT_MEMO_CACHE_SIZE,
+        )
+        return DEFAULT_MEMO_CACHE_SIZE
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for use in a memo key.
+
+    Only whitespace is collapsed: case splits camelCase operation names
+    into search terms, so queries differing in case can rank differently.
+    """
+    return ' '.join(query.split())
+
+
+class ResponseMemo:
+    """LRU memo of activity responses, recording hits and misses."""
+
+    def __init__(self, name: str, maxsize: int | None = None):
+        """Initialize the memo.
+
+        Args:
+            name: Cache name, used as the metrics' 'cache' attribute
+            maxsize: Maximum entries (default: UTCP_MEMO_CACHE_SIZE)
+        """
+        self.name = name
+        self.cache = LRUCache(maxsize if maxsize is not None else _memo_cache_size_from_env())
+
+    def get(self, key: Hashable) -> str | None:
+        """Get a memoized response, or None on a miss."""
+        response = self.cache.get(key)
+        if _metrics:
+            attributes = {'cache': self.name}
+            _metrics['hits' if response is not None else 'misses'].add(1, attributes)
+            _metrics['hit_rate'].set(self.cache.hit_rate, attributes)
+        return response
+
+    def put(self, key: Hashable, response: str) -> None:
+        """Memoize a (successful) response."""
+        self.cache.put(key, response)
+
+
+search_results = ResponseMemo('search')
+cross_service_search_results = ResponseMemo('search_all')
+operation_details = ResponseMemo('details')
+operation_lists = ResponseMemo('list')
+
+_memos = (search_results, cross_service_search_results, operation_details, operation_lists)
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    """Get the entries, hits, misses and hit rate of each memo."""
+    return {
+        memo.name: {
+            'entries': len(memo.cache),
+            'hits': memo.cache.hits,
+            'misses': memo.cache.misses,
+            'hit_rate': round(memo.cache.hit_rate, 4),
+        }
+        for memo in _memos
+    }
+
+
+def clear() -> None:
+    """Drop all memoized responses and reset the statistics."""
+    for memo in _memos:
+        memo.cache.clear()
+
+
+def set_metric_meter(meter: MetricMeter | None) -> None:
+    """Set (or with None, clear) the meter memo lookups are recorded to.
+
+    Args:
+        meter: Metric meter, e.g. the Temporal runtime's
+    """
+    _metrics.clear()
+    if meter is None:
+        return
+    _metrics['hits'] = meter.create_counter(
+        'utcp_memo_hits', 'UTCP discovery responses served from the memo'
+    )
+    _metrics['misses'] = meter.create_counter(
+        'utcp_memo_misses', 'UTCP discovery responses not found in the memo'
+    )
+    _metrics['hit_rate'] = meter.create_gauge_float(
+        'utcp_memo_hit_rate', 'Fraction of UTCP discovery lookups served from the memo'
+    )
@@ -47,8 +47,13 @@ class OpenApiHandler(ABC):
     circular imports between config.py and handlers.
     """
 
-    @staticmethod
-    def filter_readonly_operations(spec_data: dict, service_name: str) -> dict:
+    # HTTP methods exposed to the agent; everything else is filtered out
+    READ_ONLY_METHODS: frozenset[str] = frozenset({'get'})
+
+    # Field paths removed from every API response (see projection.py)
+    RESPONSE_EXCLUDE: tuple[str, ...] = ()
+
+    def filter_readonly_operations(self, spec_data: dict, service_name: str) -> dict:
         """Filter OpenAPI spec to only include read-only (GET) operations.
 
         This provides defense-in-depth security by ensuring the AI agent
@@ -64,7 +69,7 @@ class OpenApiHandler(ABC):
         if 'paths' not in spec_data:
             return spec_data
 
-        read_only_methods = {'get'}
+        read_only_methods = self.READ_ONLY_METHODS
         filtered_paths = {}
         total_operations = 0
         filtered_operations = 0
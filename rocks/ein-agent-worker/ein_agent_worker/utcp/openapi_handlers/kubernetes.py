@@ -15,6 +15,17 @@ class KubernetesOpenApiHandler(OpenApiHandler):
     credential management. Supported auth types are defined in config.SERVICE_AUTH_TYPES.
     """
 
+    # Server-side apply bookkeeping and kubectl's copy of the last applied
+    # object: often most of a response, never needed for troubleshooting
+    RESPONSE_EXCLUDE = tuple(
+        f'{prefix}metadata.{field}'
+        for prefix in ('', 'items.', 'object.')
+        for field in (
+            'managedFields',
+            'annotations["kubectl.kubernetes.io/last-applied-configuration"]',
+        )
+    )
+
     def get_variable_loader(self, token: str) -> VariableLoader | None:
         """Create a bearer token loader for Kubernetes API key variables.
 
@@ -0,0 +1,141 @@
+"""Compact summaries of UTCP operation parameters.
+
+An operation's full input schema is nested JSON Schema with every field's
+complete description: kilobytes for many Kubernetes list operations, read
+again by the model on each turn. Usually only a parameter's name, type and
+location and whether it is required matter. A summary lists exactly those,
+one flat entry per parameter, with required parameters first:
+
+    {"name": "namespace", "in": "path", "type": "string", "required": true}
+    {"name": "limit", "in": "query", "type": "integer",
+     "description": "limit is a maximum number of responses to return..."}
+
+Along with enum values, defaults and the first sentence of each
+description. Object schemas (request bodies) are collapsed to the names of
+their top-level fields. The full schema is still available (verbose mode
+of get_{service}_operation_details).
+
+Parameter locations come from the call template: URL template variables
+are path parameters, header and body fields are named by the template, and
+everything else goes in the query string. Path variables missing from the
+schema (path-level parameters the converter drops) are still listed.
+"""
+
+import re
+from typing import Any
+
+from utcp.data.tool import Tool
+
+# Longest description kept, in characters
+MAX_DESCRIPTION_LENGTH = 160
+
+# Most enum values listed
+MAX_ENUM_VALUES = 20
+
+# Most fields listed for a collapsed object
+MAX_OBJECT_FIELDS = 20
+
+_PATH_VARIABLE_RE = re.compile(r'{([^{}]+)}')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s')
+
+
+def _short_description(description: Any) -> str:
+    """First sentence (or line) of a description, capped in length."""
+    if not isinstance(description, str):
+        return ''
+    text = description.strip().split('\n', 1)[0]
+    text = _SENTENCE_END_RE.split(text, 1)[0]
+    if len(text) > MAX_DESCRIPTION_LENGTH:
+        text = text[: MAX_DESCRIPTION_LENGTH - 3].rstrip() + '...'
+    return text
+
+
+def _type_of(schema: Any) -> str:
+    """Compact type of a schema: string, integer(int64), array<string>, string|number."""
+    if not isinstance(schema, dict):
+        return 'any'
+    for combinator in ('oneOf', 'anyOf'):
+        if schema.get(combinator):
+            types = dict.fromkeys(_type_of(option) for option in schema[combinator])
+            return '|'.join(types)
+    if schema.get('allOf'):
+        return _type_of(schema['allOf'][0])
+
+    schema_type = schema.get('type')
+    if isinstance(schema_type, list):
+        return '|'.join(str(t) for t in schema_type)
+    if schema_type == 'array':
+        return f'array<{_type_of(schema.get("items"))}>'
+    if schema_type is None:
+        schema_type = 'object' if 'properties' in schema else 'any'
+    if schema.get('format') and schema_type in ('string', 'integer', 'number'):
+        return f'{schema_type}({schema["format"]})'
+    return schema_type
+
+
+def _locations(tool: Tool) -> tuple[list[str], set[str], str]:
+    template = tool.tool_call_template
+    url = getattr(template, 'url', '') or ''
+    path_variables = list(dict.fromkeys(_PATH_VARIABLE_RE.findall(url)))
+    header_fields = set(getattr(template, 'header_fields', None) or ())
+    body_field = getattr(template, 'body_field', None) or ''
+    return path_variables, header_fields, body_field
+
+
+def _summarize(name: str, schema: Any, location: str, required: bool) -> dict[str, Any]:
+    schema = schema if isinstance(schema, dict) else {}
+    summary: dict[str, Any] = {'name': name, 'in': location, 'type': _type_of(schema)}
+    if required:
+        summary['required'] = True
+    if 'enum' in schema:
+        summary['enum'] = schema['enum'][:MAX_ENUM_VALUES]
+    if 'default' in schema:
+        summary['default'] = schema['default']
+    description = _short_description(schema.get('description'))
+    if description:
+        summary['description'] = description
+
+    # Collapse objects (request bodies) to their top-level fields
+    properties = schema.get('properties')
+    if isinstance(properties, dict) and properties:
+        fields = list(properties)
+        summary['fields'] = fields[:MAX_OBJECT_FIELDS]
+        if len(fields) > MAX_OBJECT_FIELDS:
+            summary['more_fields'] = len(fields) - MAX_OBJECT_FIELDS
+    return summary
+
+
+def summarize_parameters(tool: Tool, schema: dict) -> list[dict[str, Any]]:
+    """Summarize an operation's parameters.
+
+    Args:
+        tool: The operation
+        schema: Its serialized input schema (see OperationCatalog.parameters)
+
+    Returns:
+        One summary per parameter: required parameters first, then in
+        schema order
+    """
+    path_variables, header_fields, body_field = _locations(tool)
+    properties = schema.get('properties') or {}
+    required = set(schema.get('required') or ())
+
+    def location(name: str) -> str:
+        if name in header_fields:
+            return 'header'
+        if name == body_field:
+            return 'body'
+        return 'query'
+
+    # Path parameters, in URL order, are always required, even if the
+    # schema lacks them
+    summaries = [
+        _summarize(name, properties.get(name, {'type': 'string'}), 'path', True)
+        for name in path_variables
+    ]
+    summaries += [
+        _summarize(name, prop, location(name), name in required)
+        for name, prop in properties.items()
+        if name not in path_variables
+    ]
+    return sorted(summaries, key=lambda summary: not summary.get('required'))
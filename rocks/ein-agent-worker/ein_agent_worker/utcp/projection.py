@@ -0,0 +1,187 @@
+"""Projection of UTCP operation responses.
+
+A Kubernetes list on a busy cluster returns megabytes, mostly
+metadata.managedFields, last-applied annotations and full specs the agent
+never reads. Responses are projected inside the call activity, before
+they are serialized into Temporal payloads and LLM context:
+
+    - per-service default exclusions (OpenApiHandler.RESPONSE_EXCLUDE,
+      e.g. metadata.managedFields for Kubernetes), always removed
+    - an optional 'fields' selection per call, keeping only those paths
+
+Paths are dotted keys. Lists are traversed implicitly, so a path applies
+to every element ('items.metadata.name'); 'items[]' says so explicitly.
+'*' matches every key of an object, and keys containing dots are quoted
+in brackets:
+
+    items.metadata.name
+    items[].status.containerStatuses.restartCount
+    data.result.metric.*
+    metadata.annotations["kubectl.kubernetes.io/last-applied-configuration"]
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+# Path key matching every key of an object
+WILDCARD = '*'
+
+# A path segment: a ["quoted"] key, or a bare key, optionally suffixed [] or [*]
+_SEGMENT_RE = re.compile(r'\[\s*"([^"]*)"\s*\]|\[\s*\'([^\']*)\'\s*\]|([^.\[\]]+)(?:\[\*?\])?')
+
+# Maps service_name -> parsed paths excluded from its responses by default
+_exclusions: dict[str, list[tuple[str, ...]]] = {}
+
+
+def parse_path(path: str) -> tuple[str, ...]:
+    """Parse a field path into its keys.
+
+    Args:
+        path: Dotted path, optionally prefixed with '$.' or '.' (JSONPath, jq)
+
+    Returns:
+        The keys ('*' matching any key)
+
+    Raises:
+        ValueError: If the path is empty or malformed
+    """
+    text = path.strip().removeprefix('$').lstrip('.')
+    keys = []
+    position = 0
+    while position < len(text):
+        match = _SEGMENT_RE.match(text, position)
+        if match is None:
+            raise ValueError(f'Invalid field path: {path!r}')
+        keys.append(next(group for group in match.groups() if group is not None).strip())
+        position = match.end()
+        if text[position : position + 1] == '.':
+            position += 1
+    if not keys:
+        raise ValueError(f'Empty field path: {path!r}')
+    return tuple(keys)
+
+
+def parse_fields(fields: str | Sequence[str]) -> list[tuple[str, ...]]:
+    """Parse a 'fields' argument: a list of paths, or a comma-separated string.
+
+    Commas inside quoted keys do not separate paths.
+    """
+    if isinstance(fields, str):
+        fields = re.findall(r'(?:\[[^\]]*\]|[^,])+', fields)
+    return [parse_path(field) for field in fields if field.strip()]
+
+
+def _select(value: Any, paths: list[tuple[str, ...]]) -> Any:
+    """Keep only the given paths of a value (None if none of them exist)."""
+    if any(not path for path in paths):
+        return value
+    if isinstance(value, list):
+        if not value:
+            return value
+        selected = [_select(item, paths) for item in value]
+        return [item for item in selected if item is not None] or None
+    if not isinstance(value, dict):
+        return None
+
+    by_key: dict[str, list[tuple[str, ...]]] = {}
+    for path in paths:
+        keys = value if path[0] == WILDCARD else (path[0],) if path[0] in value else ()
+        for key in keys:
+            by_key.setdefault(key, []).append(path[1:])
+
+    result = {}
+    for key, rest in by_key.items():
+        selected = _select(value[key], rest)
+        if selected is not None:
+            result[key] = selected
+    return result or None
+
+
+def _exclude(value: Any, paths: Iterable[tuple[str, ...]]) -> Any:
+    """Copy a value without the given paths (sharing untouched subtrees)."""
+    paths = [path for path in paths if path]
+    if not paths:
+        return value
+    if isinstance(value, list):
+        return [_exclude(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    result = {}
+    for key, item in value.items():
+        rest = [path[1:] for path in paths if path[0] in (key, WILDCARD)]
+        if any(not path for path in rest):
+            continue
+        result[key] = _exclude(item, rest)
+    return result
+
+
+def project(
+    result: Any, fields: Sequence[tuple[str, ...]] = (), exclude: Sequence[tuple[str, ...]] = ()
+) -> Any:
+    """Project a response.
+
+    Args:
+        result: The parsed response
+        fields: Paths to keep (default: everything)
+        exclude: Paths to remove, before selecting
+
+    Returns:
+        The projected response: a copy sharing unchanged subtrees with
+        the original, or None if fields were given and none matched
+    """
+    if exclude:
+        result = _exclude(result, exclude)
+    if fields:
+        result = _select(result, list(fields))
+    return result
+
+
+def field_paths(value: Any, depth: int = 2, limit: int = 50) -> list[str]:
+    """List the paths of a value, to help correct a selection that matched nothing.
+
+    Args:
+        value: The response
+        depth: Levels of nesting listed
+        limit: Most paths listed
+
+    Returns:
+        Dotted paths, lists traversed through their first element
+    """
+    paths: list[str] = []
+
+    def walk(node: Any, prefix: str, level: int) -> None:
+        while isinstance(node, list) and node:
+            node = node[0]
+        if not isinstance(node, dict) or level == depth:
+            return
+        for key, item in node.items():
+            if len(paths) >= limit:
+                return
+            path = f'{prefix}.{key}' if prefix else key
+            if '.' in key:
+                path = f'{prefix}["{key}"]'
+            paths.append(path)
+            walk(item, path, level + 1)
+
+    walk(value, '', 0)
+    return paths
+
+
+def set_default_exclusions(service_name: str, paths: Sequence[str]) -> None:
+    """Set the paths removed from all of a service's responses.
+
+    Args:
+        service_name: The service name
+        paths: Field paths (see parse_path)
+    """
+    if paths:
+        _exclusions[service_name] = [parse_path(path) for path in paths]
+    else:
+        _exclusions.pop(service_name, None)
+
+
+def get_default_exclusions(service_name: str) -> list[tuple[str, ...]]:
+    """Get the parsed paths removed from all of a service's responses."""
+    return _exclusions.get(service_name, [])
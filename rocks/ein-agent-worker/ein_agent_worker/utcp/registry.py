@@ -12,6 +12,7 @@ This pattern:
 
 import logging
 
+from ein_agent_worker.utcp import catalog
 from ein_agent_worker.utcp.config import UTCPServiceConfig
 from utcp.utcp_client import UtcpClient
 
@@ -29,17 +30,38 @@ def register_client(
 ) -> None:
     """Register a pre-initialized UTCP client.
 
+    Also publishes the client's operations as the service's catalog (see
+    catalog.py), replacing the previous client's. A client created by
+    ToolLoader.create_client should first have its catalog built off the
+    event loop with catalog.prepare(); otherwise it is built here.
+
     Args:
         service_name: Service name (e.g., 'kubernetes', 'grafana')
         client: The UTCP client instance (already initialized with OpenAPI spec)
         config: Optional service configuration (for approval policy, etc.)
     """
+    catalog.publish(service_name, client)
     _utcp_clients[service_name] = client
     if config:
         _service_configs[service_name] = config
     logger.info("Registered UTCP client for '%s'", service_name)
 
 
+def unregister_client(service_name: str) -> None:
+    """Remove a service's client and configuration.
+
+    Callers already holding the client (e.g., running activities) keep
+    using it until they finish.
+
+    Args:
+        service_name: Service name
+    """
+    _utcp_clients.pop(service_name, None)
+    _service_configs.pop(service_name, None)
+    catalog.drop(service_name)
+    logger.info("Unregistered UTCP client for '%s'", service_name)
+
+
 def get_client(service_name: str) -> UtcpClient | None:
     """Get a registered UTCP client.
 
@@ -75,6 +97,8 @@ def list_services() -> list[str]:
 
 def clear() -> None:
     """Clear all registered clients and configs."""
+    for service_name in _utcp_clients:
+        catalog.drop(service_name)
     _utcp_clients.clear()
     _service_configs.clear()
     logger.info('Cleared UTCP registry')
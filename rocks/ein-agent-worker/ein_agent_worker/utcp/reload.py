@@ -0,0 +1,243 @@
+"""Hot reload of UTCP services without restarting the worker.
+
+A reload re-reads the UTCP configuration (UTCPConfig.from_env, which
+overlays UTCP_CONFIG_FILE on the environment) and diffs it against the
+registry:
+
+- new services are built and registered
+- services whose configuration changed (URL, version, auth, rotated
+  token or kubeconfig, ...) get a new client, built while the old one
+  keeps serving, and then swapped in with a single registry assignment
+- services no longer configured (or disabled) are unregistered
+- unchanged services are left alone
+
+Activities already running keep the client they looked up and finish
+against it. Unchanged specs are not converted again: compiled operations
+are shared through the manual store and cached on disk.
+
+Reloads are triggered by SIGHUP, by changes to UTCP_CONFIG_FILE, or by
+the utcp-reload-services activity (see activities/worker_config.py). They
+run one at a time.
+
+Configuration:
+    UTCP_CONFIG_WATCH_INTERVAL: Seconds between UTCP_CONFIG_FILE change checks
+        (default: 30, 0 disables watching)
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ein_agent_worker.utcp import catalog, startup_report
+from ein_agent_worker.utcp import registry as utcp_registry
+from ein_agent_worker.utcp.config import UTCPConfig, UTCPServiceConfig
+from ein_agent_worker.utcp.loader import ToolLoader
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 30.0
+
+# Maps service_name -> number of the latest initialization started for it.
+# An initialization only registers its client if no newer one has started.
+_generations: dict[str, int] = {}
+
+# Maps service_name -> config of the initialization in progress
+_initializing: dict[str, UTCPServiceConfig] = {}
+
+# The worker's reloader (set at startup)
+_reloader: 'ServiceReloader | None' = None
+
+
+async def initialize_service(loader: ToolLoader, svc: UTCPServiceConfig) -> bool:
+    """Create a single UTCP client within its deadline and register it.
+
+    Registering replaces any previous client of the service.
+
+    Args:
+        loader: The shared tool loader.
+        svc: The service configuration.
+
+    Returns:
+        True if the client was registered.
+    """
+    generation = _generations[svc.name] = _generations.get(svc.name, 0) + 1
+    _initializing[svc.name] = svc
+    try:
+        with startup_report.measure_service(svc.name) as report:
+            client = await asyncio.wait_for(
+                loader.create_client(
+                    service_name=svc.name,
+                    openapi_url=svc.openapi_url,
+                    auth_type=svc.auth_type,
+                    token=svc.token,
+                    insecure=svc.insecure,
+                    version=svc.version,
+                    spec_source=svc.spec_source,
+                    lazy_schemas=svc.lazy_schemas,
+                    service_type=svc.service_type,
+                    max_connections=svc.max_connections,
+                ),
+                timeout=svc.init_timeout,
+            )
+            # Built off the event loop, and registered below only if current
+            await catalog.prepare(svc.name, client)
+            if _generations.get(svc.name) != generation:
+                logger.info('[%s] Discarding client superseded by a reload', svc.name)
+                catalog.discard(client)
+                return False
+            # Register client along with its config (for approval policy)
+            utcp_registry.register_client(svc.name, client, config=svc)
+            report.success = True
+            return True
+    except TimeoutError:
+        logger.error(
+            'Timed out initializing UTCP client for %s after %ss',
+            svc.name,
+            svc.init_timeout,
+        )
+    except Exception as e:
+        logger.error(
+            'Failed to initialize UTCP client for %s: %s',
+            svc.name,
+            e,
+        )
+    finally:
+        if _generations.get(svc.name) == generation:
+            _initializing.pop(svc.name, None)
+    return False
+
+
+@dataclass
+class ReloadResult:
+    """Outcome of a reload, as service names."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Return the result as a dict."""
+        return asdict(self)
+
+
+class ServiceReloader:
+    """Reconcile registered UTCP clients with the current configuration."""
+
+    def __init__(self, loader: ToolLoader):
+        """Initialize the reloader.
+
+        Args:
+            loader: The tool loader the worker's clients were created with.
+        """
+        self.loader = loader
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def reload(self) -> ReloadResult:
+        """Reload services whose configuration changed.
+
+        Returns:
+            Which services were added, changed, removed or failed to build.
+        """
+        async with self._lock:
+            config = UTCPConfig.from_env()
+            desired = {svc.name: svc for svc in config.enabled_services}
+            known = set(utcp_registry.list_services()) | set(_initializing)
+            result = ReloadResult()
+
+            to_build = []
+            for name, svc in desired.items():
+                current = _initializing.get(name) or utcp_registry.get_service_config(name)
+                if current is None:
+                    result.added.append(name)
+                    to_build.append(svc)
+                elif current != svc:
+                    result.changed.append(name)
+                    to_build.append(svc)
+                else:
+                    result.unchanged.append(name)
+
+            # Build in the background of the old clients, which keep serving
+            outcomes = await asyncio.gather(
+                *(initialize_service(self.loader, svc) for svc in to_build)
+            )
+            result.failed = [
+                svc.name for svc, ok in zip(to_build, outcomes, strict=True) if not ok
+            ]
+
+            for name in sorted(known - desired.keys()):
+                # Stop a build in progress from registering
+                _generations[name] = _generations.get(name, 0) + 1
+                _initializing.pop(name, None)
+                utcp_registry.unregister_client(name)
+                self.loader.remove_client(name)
+                result.removed.append(name)
+
+            logger.info('UTCP services reloaded: %s', result.to_dict())
+            return result
+
+    def request_reload(self) -> None:
+        """Schedule a reload in the background (e.g., from a signal handler)."""
+        logger.info('UTCP service reload requested')
+        task = asyncio.create_task(self._reload_logged(), name='utcp-reload')
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def watch_config_file(self) -> None:
+        """Reload whenever UTCP_CONFIG_FILE changes (runs until cancelled)."""
+        path = os.getenv('UTCP_CONFIG_FILE', '')
+        interval = _watch_interval_from_env()
+        if not path or interval <= 0:
+            return
+
+        logger.info('Watching %s for UTCP service changes every %ss', path, interval)
+        last_mtime = _mtime(Path(path))
+        while True:
+            await asyncio.sleep(interval)
+            mtime = _mtime(Path(path))
+            if mtime != last_mtime:
+                last_mtime = mtime
+                logger.info('%s changed', path)
+                await self._reload_logged()
+
+    async def _reload_logged(self) -> None:
+        """Reload, logging instead of raising errors (for background reloads)."""
+        try:
+            await self.reload()
+        except Exception:
+            logger.exception('UTCP service reload failed')
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _watch_interval_from_env() -> float:
+    value = os.getenv('UTCP_CONFIG_WATCH_INTERVAL', str(DEFAULT_WATCH_INTERVAL))
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            'Invalid UTCP_CONFIG_WATCH_INTERVAL %r, using default %s',
+            value,
+            DEFAULT_WATCH_INTERVAL,
+        )
+        return DEFAULT_WATCH_INTERVAL
+
+
+def set_reloader(reloader: ServiceReloader | None) -> None:
+    """Set (or with None, clear) the worker's reloader."""
+    global _reloader
+    _reloader = reloader
+
+
+def get_reloader() -> ServiceReloader | None:
+    """Get the worker's reloader, or None if not running in a worker."""
+    return _reloader
@@ -0,0 +1,363 @@
+"""Statistical summaries of operation responses over the size budget.
+
+Even projected and paged, a response can be more than the agent can
+usefully read, and past Temporal's payload limit the activity fails
+outright. Responses whose JSON exceeds UTCP_RESPONSE_MAX_BYTES are
+replaced by a summary of their main list (the response itself, or its
+largest list, e.g. 'items' or 'data.result'), computed in one pass over
+the list:
+
+    {
+      "summary": true,
+      "original_bytes": 5242880,
+      "list": "items",
+      "count": 2400,
+      "fields": {
+        "status.phase": {"count": 2400, "values": {"Running": 2350, "Pending": 50}},
+        "status.containerStatuses.restartCount": {"count": 2610, "min": 0, "max": 41,
+                                                  "mean": 0.3},
+        "status.conditions.Ready": {"count": 2400, "values": {"True": 2390, "False": 10}},
+        ...
+      },
+      "top": {"by": "status.containerStatuses.restartCount",
+              "items": [{"item": "ns/pod-a", "value": 41}, ...]},
+      "sample": [...]
+    }
+
+Fields are the leaf values of each item, by dotted path (lists
+traversed). Kubernetes-style conditions ({"type": "Ready", "status":
+"True"}) are keyed by their type. Numbers get min/max/mean; other values a
+histogram of their most common values, or just a distinct count when
+nearly every item differs (names, UIDs), as such fields summarize
+nothing. The sample is a reservoir sample of items, seeded, so the same
+response gives the same summary.
+
+Responses with no list to summarize (text bodies, single objects), and
+those whose summary is still over the budget, are cut down to their head
+and marked as truncated instead.
+
+Paginated Kubernetes lists are cut to fit this budget before it applies
+(see kubernetes_pagination.py), so they come back as items with a
+continue token rather than summarized.
+
+Configuration:
+    UTCP_RESPONSE_MAX_BYTES: Largest response returned as is (default: 262144)
+"""
+
+import heapq
+import json
+import logging
+import os
+import random
+from collections import Counter
+from typing import Any
+
+from ein_agent_worker.utcp import serialization
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RESPONSE_BYTES = 256 * 1024
+
+# Items kept in the sample and the top-N list
+SAMPLE_SIZE = 3
+TOP_SIZE = 10
+
+# Histograms list this many values; fields with more distinct values than
+# HIGH_CARDINALITY only report the (capped) distinct count
+HISTOGRAM_SIZE = 10
+HIGH_CARDINALITY = 50
+
+# Most fields reported, and the nesting depth flattened
+MAX_FIELDS = 40
+MAX_DEPTH = 6
+
+# Longest string value kept in histograms
+MAX_VALUE_LENGTH = 80
+
+
+def max_response_bytes() -> int:
+    """The response size budget (UTCP_RESPONSE_MAX_BYTES)."""
+    value = os.getenv('UTCP_RESPONSE_MAX_BYTES', str(DEFAULT_MAX_RESPONSE_BYTES))
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            'Invalid UTCP_RESPONSE_MAX_BYTES %r, using default %d',
+            value,
+            DEFAULT_MAX_RESPONSE_BYTES,
+        )
+        return DEFAULT_MAX_RESPONSE_BYTES
+
+
+class _FieldStats:
+    """Running statistics of one field's values."""
+
+    __slots__ = ('count', 'maximum', 'minimum', 'total', 'values')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        # None once the field has too many distinct values to histogram
+        self.values: Counter | None = Counter()
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            self.total += value
+            self.minimum = value if self.minimum is None else min(self.minimum, value)
+            self.maximum = value if self.maximum is None else max(self.maximum, value)
+            return
+        if self.values is not None:
+            text = value if isinstance(value, str) else json.dumps(value)
+            self.values[text[:MAX_VALUE_LENGTH]] += 1
+            if len(self.values) > HIGH_CARDINALITY:
+                self.values = None
+
+    def numeric(self) -> bool:
+        return self.minimum is not None
+
+    def informative(self) -> bool:
+        # Values nearly all distinct (names, UIDs, timestamps) summarize nothing
+        if self.numeric():
+            return True
+        return self.values is not None and (len(self.values) < self.count or self.count == 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        summary: dict[str, Any] = {'count': self.count}
+        if self.numeric():
+            numbers = self.count - sum(self.values.values()) if self.values else self.count
+            summary.update(
+                min=self.minimum, max=self.maximum, mean=round(self.total / max(numbers, 1), 3)
+            )
+        elif self.values is not None:
+            summary['values'] = dict(self.values.most_common(HISTOGRAM_SIZE))
+            if len(self.values) > HISTOGRAM_SIZE:
+                summary['distinct'] = len(self.values)
+        else:
+            summary['distinct'] = f'>{HIGH_CARDINALITY}'
+        return summary
+
+
+def _leaves(value: Any, path: str, depth: int, out: list[tuple[str, Any]]) -> None:
+    """Collect the (path, scalar) leaves of a value."""
+    if isinstance(value, dict):
+        if depth >= MAX_DEPTH:
+            return
+        for key, item in value.items():
+            _leaves(item, f'{path}.{key}' if path else key, depth + 1, out)
+    elif isinstance(value, list):
+        for item in value:
+            if (
+                isinstance(item, dict)
+                and isinstance(item.get('type'), str)
+                and isinstance(item.get('status'), str)
+            ):
+                # Conditions: keyed by their type
+                out.append((f'{path}.{item["type"]}', item['status']))
+            else:
+                _leaves(item, path, depth, out)
+    elif value is not None:
+        out.append((path, value))
+
+
+def _main_list(result: Any) -> tuple[str, list] | None:
+    """The list to summarize: the response, or its largest list (two levels deep)."""
+    if isinstance(result, list):
+        return '', result
+    if not isinstance(result, dict):
+        return None
+    candidates = []
+    for key, value in result.items():
+        if isinstance(value, list):
+            candidates.append((len(value), key, value))
+        elif isinstance(value, dict):
+            candidates.extend(
+                (len(inner), f'{key}.{inner_key}', inner)
+                for inner_key, inner in value.items()
+                if isinstance(inner, list)
+            )
+    if not candidates:
+        return None
+    _, path, items = max(candidates, key=lambda candidate: candidate[0])
+    return path, items
+
+
+def _identity(item: Any, position: int) -> str:
+    """A readable identity of an item, for top-N lists."""
+    if isinstance(item, dict):
+        metadata = item.get('metadata')
+        if isinstance(metadata, dict) and metadata.get('name'):
+            namespace = metadata.get('namespace')
+            return f'{namespace}/{metadata["name"]}' if namespace else str(metadata['name'])
+        for key in ('name', 'id', 'uid', 'title', 'metric'):
+            if item.get(key) not in (None, '', {}):
+                value = item[key]
+                return value if isinstance(value, str) else json.dumps(value)[:MAX_VALUE_LENGTH]
+    return f'#{position}'
+
+
+def summarize(result: Any, original_bytes: int, top_by: str = '') -> dict[str, Any] | None:
+    """Summarize a response's main list in one pass.
+
+    Args:
+        result: The parsed response
+        original_bytes: Size of the response's JSON
+        top_by: Field path to rank items by (highest value of the field
+            per item, e.g. status.containerStatuses.restartCount)
+
+    Returns:
+        The summary, or None if the response has no list to summarize
+    """
+    found = _main_list(result)
+    if found is None:
+        return None
+    path, items = found
+
+    stats: dict[str, _FieldStats] = {}
+    top: list[tuple[float, int, str]] = []
+    sample: list[Any] = []
+    rng = random.Random(0)  # noqa: S311
+    for position, item in enumerate(items):
+        leaves: list[tuple[str, Any]] = []
+        _leaves(item, '', 0, leaves)
+        ranked = None
+        for field, value in leaves:
+            field_stats = stats.get(field)
+            if field_stats is None:
+                field_stats = stats[field] = _FieldStats()
+            field_stats.add(value)
+            if field == top_by and isinstance(value, int | float) and not isinstance(value, bool):
+                ranked = value if ranked is None else max(ranked, value)
+
+        if ranked is not None:
+            entry = (ranked, -position, _identity(item, position))
+            if len(top) < TOP_SIZE:
+                heapq.heappush(top, entry)
+            else:
+                heapq.heappushpop(top, entry)
+
+        # Reservoir sampling
+        if position < SAMPLE_SIZE:
+            sample.append(item)
+        else:
+            slot = rng.randrange(position + 1)
+            if slot < SAMPLE_SIZE:
+                sample[slot] = item
+
+    informative = [(field, s) for field, s in stats.items() if s.informative()]
+    informative.sort(key=lambda entry: -entry[1].count)
+    summary: dict[str, Any] = {
+        'summary': True,
+        'original_bytes': original_bytes,
+        'list': path,
+        'count': len(items),
+        'fields': {field: s.to_dict() for field, s in informative[:MAX_FIELDS]},
+    }
+    if len(informative) > MAX_FIELDS:
+        summary['more_fields'] = len(informative) - MAX_FIELDS
+    if isinstance(result, dict) and 'pagination' in result:
+        # A paged Kubernetes list: whether (and where) it was truncated
+        summary['pagination'] = result['pagination']
+    if top_by:
+        summary['top'] = {
+            'by': top_by,
+            'items': [
+                {'item': identity, 'value': value}
+                for value, _, identity in sorted(top, reverse=True)
+            ],
+        }
+    summary['sample'] = sample
+    return summary
+
+
+def fit_response(
+    result: Any,
+    serialized: str,
+    max_bytes: int,
+    top_by: str = '',
+    corrections: list[str] | None = None,
+) -> str:
+    """Return a serialized response, or if it is over budget, its summary or head.
+
+    Args:
+        result: The parsed response
+        serialized: Its JSON
+        max_bytes: The size budget (0 or less: unlimited)
+        top_by: Field path to rank items by in a summary
+        corrections: Corrections made to the call, kept in a summary
+
+    Returns:
+        The response JSON, or the summary JSON (with a compact sample,
+        dropped if even that is over budget), or for a response without
+        a list to summarize, its truncated head (see truncate)
+    """
+    size = len(serialized.encode())
+    if max_bytes <= 0 or size <= max_bytes:
+        return serialized
+    summary = summarize(result, size, top_by)
+    if summary is None:
+        return truncate(serialized, size, max_bytes, corrections)
+    if corrections:
+        summary['corrections'] = corrections
+    summary['hint'] = (
+        'The response was over the size budget. Narrow it with selectors or '
+        'the fields argument to see the items themselves.'
+    )
+    response = serialization.dumps(summary)
+    if len(response.encode()) > max_bytes:
+        summary['sample'] = []
+        response = serialization.dumps(summary)
+        if len(response.encode()) > max_bytes:
+            return truncate(serialized, size, max_bytes, corrections)
+    logger.info(
+        'Summarized a %d-byte response of %d items as %d bytes',
+        size,
+        summary['count'],
+        len(response),
+    )
+    return response
+
+
+def truncate(
+    serialized: str, size: int, max_bytes: int, corrections: list[str] | None = None
+) -> str:
+    """Cut an over-budget response down to its head, marked as truncated.
+
+    For responses with no list to summarize (text bodies, single objects),
+    or whose summary is over budget too:
+
+        {"truncated": true, "original_bytes": 5242880, "head": "<html>...", ...}
+
+    Args:
+        serialized: The response JSON
+        size: Its size in bytes
+        max_bytes: The size budget
+        corrections: Corrections made to the call, kept in the response
+
+    Returns:
+        The marked head JSON, within the budget unless even an empty head
+        is over it
+    """
+    marker: dict[str, Any] = {'truncated': True, 'original_bytes': size, 'head': ''}
+    if corrections:
+        marker['corrections'] = corrections
+    marker['hint'] = (
+        'The response was over the size budget. Narrow it with selectors or '
+        'the fields argument to see all of it.'
+    )
+    overhead = len(serialization.dumps(marker).encode())
+    head = serialized.encode()[: max(max_bytes - overhead, 0)]
+    while True:
+        marker['head'] = head.decode(errors='ignore')
+        response = serialization.dumps(marker)
+        excess = len(response.encode()) - max_bytes
+        if excess <= 0 or not head:
+            break
+        # Escaping the head in JSON made it longer: cut the excess, scaled
+        # by how much the head grew
+        escaped = len(response.encode()) - overhead
+        head = head[: len(head) - max(excess * len(head) // escaped, 1)]
+    logger.info('Truncated a %d-byte response to %d bytes', size, len(response))
+    return response
@@ -0,0 +1,351 @@
+"""Operation search index for UTCP services.
+
+An inverted index over each service's operations, ranked with BM25F:
+operation names, tags, paths and descriptions are tokenized (splitting
+camelCase, so `listCoreV1NamespacedPod` yields list, core, v1,
+namespaced, pod) and weighted per field. Each term's score contribution
+to each operation is query-independent, so it is computed once when the
+index is built; a query only sums the postings of its terms and picks
+the top results with a heap.
+
+Indexes are built once per registration from the registered tools, or
+loaded prebuilt from a compiled spec bundle, and served from the
+service's operation catalog (see catalog.py).
+"""
+
+import copy
+import heapq
+import logging
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from urllib.parse import urlparse
+
+from utcp.data.tool import Tool
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters: term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Field weights (BM25F)
+FIELD_WEIGHTS = {'name': 3.0, 'tags': 2.0, 'path': 1.5, 'description': 1.0}
+
+# Query terms also match longer index terms they are a prefix of
+# (e.g., 'deploy' -> 'deployment'), at this fraction of the score
+PREFIX_MATCH_FACTOR = 0.5
+MIN_PREFIX_LENGTH = 3
+
+# Added when the query is exactly an operation name, ranking it first
+EXACT_MATCH_BONUS = 100.0
+
+# camelCase / PascalCase words, acronyms (with trailing digits) and numbers
+_WORD_RE = re.compile(r'[A-Z]+\d*(?![a-z])|[A-Z]?[a-z]+\d*|\d+')
+
+# Including the filler of natural-language questions ("why is my ... not ...")
+_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'be', 'by', 'can', 'do', 'does', 'for', 'from', 'how',
+    'i', 'in', 'is', 'it', 'me', 'my', 'not', 'of', 'on', 'or', 'that', 'the', 'this', 'to',
+    'what', 'why', 'with',
+})  # fmt: skip
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized search terms.
+
+    Splits on non-alphanumerics and camelCase boundaries, lower-cases,
+    drops stop words and reduces plurals ('pods' -> 'pod', 'policies' ->
+    'policy', 'statuses' -> 'status'), so queries and operations meet on
+    the same terms.
+
+    Args:
+        text: Name, path, tag or free text
+
+    Returns:
+        The terms, in order (with repeats)
+    """
+    terms = []
+    for word in _WORD_RE.findall(text):
+        term = word.lower()
+        if term in _STOP_WORDS:
+            continue
+        if len(term) > 4 and term.endswith('ies'):
+            term = term[:-3] + 'y'
+        elif len(term) > 4 and term.endswith(('sses', 'uses')):
+            term = term[:-2]
+        elif len(term) > 3 and term.endswith('s') and not term.endswith(('ss', 'us')):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+def tool_fields(tool: Tool, prefix: str = '') -> dict[str, list[str]]:
+    """Tokenize the searchable fields of a tool.
+
+    Args:
+        tool: The tool
+        prefix: The service prefix, left out of the name terms
+
+    Returns:
+        Maps field name (see FIELD_WEIGHTS) -> terms
+    """
+    url = getattr(tool.tool_call_template, 'url', '') or ''
+    return operation_fields(tool.name.removeprefix(prefix), tool.tags, url, tool.description)
+
+
+def operation_fields(
+    operation_id: str, tags: Iterable[str], url: str, description: str | None
+) -> dict[str, list[str]]:
+    """Tokenize the searchable fields of an operation.
+
+    Args:
+        operation_id: The operation ID (tool name without the service prefix)
+        tags: The operation's tags
+        url: The operation's URL, or its path
+        description: The operation's description
+
+    Returns:
+        Maps field name (see FIELD_WEIGHTS) -> terms
+    """
+    return {
+        'name': tokenize(operation_id),
+        'tags': [term for tag in tags for term in tokenize(tag)],
+        'path': tokenize(urlparse(url).path),
+        'description': tokenize(description or ''),
+    }
+
+
+class SearchIndex:
+    """BM25F inverted index over a service's operations, in tool order."""
+
+    def __init__(self, names: list[str], postings: dict[str, list]):
+        """Initialize the index.
+
+        Args:
+            names: Full tool names (including the service prefix)
+            postings: Maps term -> [operation position, score] pairs
+        """
+        self._postings = postings
+        self._terms = sorted(postings)
+        self._set_names(names)
+
+    def _set_names(self, names: list[str]) -> None:
+        self.names = names
+        # Tool names are '<manual>.<operation>', and manual names have no dots
+        self._exact = {}
+        for position, name in enumerate(names):
+            self._exact.setdefault(name.split('.', 1)[-1].lower(), position)
+
+    @classmethod
+    def build(cls, names: list[str], fields: list[dict[str, list[str]]]) -> 'SearchIndex':
+        """Build an index from the tokenized fields of each operation.
+
+        Args:
+            names: Full tool names
+            fields: Per operation, maps field name (see FIELD_WEIGHTS) -> terms
+
+        Returns:
+            The index
+        """
+        count = len(fields)
+        average_lengths = {
+            field: max(sum(len(doc.get(field, ())) for doc in fields) / max(count, 1), 1.0)
+            for field in FIELD_WEIGHTS
+        }
+
+        # Length-normalized, field-weighted term frequencies per operation
+        weighted: dict[str, list[tuple[int, float]]] = {}
+        for position, doc in enumerate(fields):
+            frequencies: Counter[str] = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                terms = doc.get(field, ())
+                if not terms:
+                    continue
+                norm = 1 - B + B * len(terms) / average_lengths[field]
+                for term, tf in Counter(terms).items():
+                    frequencies[term] += weight * tf / norm
+            for term, tf in frequencies.items():
+                weighted.setdefault(term, []).append((position, tf))
+
+        postings = {}
+        for term, entries in weighted.items():
+            idf = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            postings[term] = [
+                (position, idf * tf * (K1 + 1) / (tf + K1)) for position, tf in entries
+            ]
+        return cls(names, postings)
+
+    @classmethod
+    def from_tools(cls, tools: Iterable[Tool], prefix: str = '') -> 'SearchIndex':
+        """Build an index from tools.
+
+        Args:
+            tools: The tools
+            prefix: Prepended to tool names that lack it (registered names
+                are '<manual>.<operation>')
+
+        Returns:
+            The index
+        """
+        tools = list(tools)
+        names = [
+            tool.name if not prefix or tool.name.startswith(prefix) else prefix + tool.name
+            for tool in tools
+        ]
+        return cls.build(names, [tool_fields(tool, prefix) for tool in tools])
+
+    @classmethod
+    def from_dict(cls, data: dict, names: list[str]) -> 'SearchIndex':
+        """Load an index saved with to_dict().
+
+        The postings are used as loaded, so services loading the same
+        bundle share them.
+
+        Args:
+            data: The saved index
+            names: Full tool names, in the order the index was built
+
+        Returns:
+            The loaded index
+        """
+        return cls(names, data['postings'])
+
+    def with_names(self, names: list[str]) -> 'SearchIndex':
+        """View the index under other tool names, sharing its postings.
+
+        Services loading the same spec share one index, each under its
+        own tool name prefix.
+
+        Args:
+            names: Full tool names, in the order the index was built
+
+        Returns:
+            The view
+        """
+        view = copy.copy(self)
+        view._set_names(names)
+        return view
+
+    def to_dict(self) -> dict:
+        """Serialize the index (without tool names, which are bound at load)."""
+        return {
+            'postings': {
+                term: [[position, round(score, 4)] for position, score in entries]
+                for term, entries in self._postings.items()
+            }
+        }
+
+    @property
+    def idf_scale(self) -> float:
+        """IDF of a term found in a single operation, the highest any term gets.
+
+        IDF grows with the number of operations, so a small service's best
+        matches score lower than a large one's. Dividing scores by this
+        puts indexes of different sizes on a comparable scale.
+        """
+        count = max(len(self.names), 1)
+        return math.log(1 + (count - 0.5) / 1.5)
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Match a query term exactly and, if long enough, as a prefix."""
+        matches = [(term, 1.0)] if term in self._postings else []
+        if len(term) >= MIN_PREFIX_LENGTH:
+            i = bisect_left(self._terms, term)
+            while i < len(self._terms) and self._terms[i].startswith(term):
+                if self._terms[i] != term:
+                    matches.append((self._terms[i], PREFIX_MATCH_FACTOR))
+                i += 1
+        return matches
+
+    def _score(self, query: str, boosts: dict[int, float] | None) -> dict[int, list]:
+        """Score operations against a query: position -> [score, matched terms]."""
+        scores: dict[int, list] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            # An operation scores its best match of each query term
+            term_scores: dict[int, float] = {}
+            for index_term, factor in self._expand(term):
+                for position, score in self._postings[index_term]:
+                    if score * factor > term_scores.get(position, 0.0):
+                        term_scores[position] = score * factor
+            for position, score in term_scores.items():
+                entry = scores.setdefault(position, [0.0, 0])
+                entry[0] += score
+                entry[1] += 1
+
+        exact = self._exact.get(query.strip().split('.', 1)[-1].lower())
+        if exact is not None:
+            scores.setdefault(exact, [0.0, 0])[0] += EXACT_MATCH_BONUS
+
+        if boosts:
+            scale = self.idf_scale
+            for position, boost in boosts.items():
+                scores.setdefault(position, [0.0, 0])[0] += boost * scale
+        return scores
+
+    def rank(
+        self, query: str, limit: int | None = None, boosts: dict[int, float] | None = None
+    ) -> list[tuple[float, int]]:
+        """Rank operations against a query.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results (default: all matches)
+            boosts: Maps operation position -> score to add, in units of
+                idf_scale (e.g., semantic similarities to the query)
+
+        Returns:
+            (score, operation position) pairs with a positive score, best
+            first (ties keep tool order)
+        """
+
+        def rank(item: tuple[int, list]) -> tuple[float, int]:
+            return item[1][0], -item[0]
+
+        scores = self._score(query, boosts).items()
+        if limit is None:
+            top = sorted(scores, key=rank, reverse=True)
+        else:
+            top = heapq.nlargest(limit, scores, key=rank)
+        return [(score, position) for position, (score, _) in top]
+
+    def match(
+        self, query: str, limit: int | None = None, boosts: dict[int, float] | None = None
+    ) -> list[tuple[int, float, int]]:
+        """Rank operations by how many query terms they match, then by score.
+
+        For merging results of several indexes: scores are divided by
+        idf_scale, and operations matching more of the query come first
+        whatever their index, so a term that is rare in one small index
+        does not outrank operations matching the whole query elsewhere.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results (default: all matches)
+            boosts: As for rank()
+
+        Returns:
+            (matched terms, scaled score, operation position) triples,
+            best first
+        """
+        scale = self.idf_scale
+        matches = [
+            (matched, score / scale, -position)
+            for position, (score, matched) in self._score(query, boosts).items()
+        ]
+        top = sorted(matches, reverse=True) if limit is None else heapq.nlargest(limit, matches)
+        return [(matched, score, -position) for matched, score, position in top]
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[float, str]]:
+        """Rank operations against a query, by tool name.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results (default: all matches)
+
+        Returns:
+            (score, tool name) pairs with a positive score, best first
+        """
+        return [(score, self.names[position]) for score, position in self.rank(query, limit)]
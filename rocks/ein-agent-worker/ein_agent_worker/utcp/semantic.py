@@ -0,0 +1,212 @@
+"""TF-IDF similarity search over UTCP operations, vectorized with NumPy.
+
+Keyword search (search.py) only matches terms the query shares with an
+operation, so natural-language queries like "why is my volume not
+attaching" miss operations named `listStorageV1VolumeAttachment`. This
+index embeds each operation as a sparse TF-IDF vector of hashed features
+(its terms plus their character 3- and 4-grams, so 'attaching' and
+'attachment' share features) over the same fields as the keyword index,
+weighted the same way. A query is embedded the same way and compared
+with every operation in one vectorized sparse dot product, giving cosine
+similarities. Everything is computed offline from the operations; there
+is no model to download.
+
+The matrix is stored feature-major (CSC): a query only touches the
+columns of its own features.
+"""
+
+import copy
+import math
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+import numpy as np
+
+from ein_agent_worker.utcp.search import FIELD_WEIGHTS, tokenize, tool_fields
+from utcp.data.tool import Tool
+
+# Features are hashed into this many buckets
+HASH_BUCKETS = 1 << 20
+
+# Character n-gram lengths (of each term, with '<' and '>' marking its ends)
+NGRAM_LENGTHS = (3, 4)
+
+# Similarities below this are noise (e.g., a shared 'ing')
+MIN_SIMILARITY = 0.05
+
+
+def _term_features(term: str, cache: dict[str, list[int]]) -> list[int]:
+    """Hashed features of a term: the term itself and its character n-grams."""
+    features = cache.get(term)
+    if features is None:
+        marked = f'<{term}>'
+        grams = [f'w:{term}'] + [
+            marked[i : i + n] for n in NGRAM_LENGTHS for i in range(len(marked) - n + 1)
+        ]
+        features = cache[term] = [zlib.crc32(gram.encode()) % HASH_BUCKETS for gram in grams]
+    return features
+
+
+def _featurize(fields: dict[str, list[str]], cache: dict[str, list[int]]) -> Counter[int]:
+    """Field-weighted feature counts of an operation or query."""
+    counts: Counter[int] = Counter()
+    for field, terms in fields.items():
+        weight = FIELD_WEIGHTS.get(field, 1.0)
+        for term in terms:
+            for feature in _term_features(term, cache):
+                counts[feature] += weight
+    return counts
+
+
+class SemanticIndex:
+    """Sparse TF-IDF matrix of a service's operations, in tool order."""
+
+    def __init__(
+        self,
+        names: list[str],
+        features: np.ndarray,
+        idf: np.ndarray,
+        indptr: np.ndarray,
+        rows: np.ndarray,
+        values: np.ndarray,
+    ):
+        """Initialize the index.
+
+        Args:
+            names: Full tool names (including the service prefix)
+            features: Sorted hashed features (matrix columns)
+            idf: IDF of each feature
+            indptr: Column c holds entries indptr[c]:indptr[c + 1]
+            rows: Operation position of each entry
+            values: L2-normalized TF-IDF weight of each entry
+        """
+        self.names = names
+        self._features = features
+        self._idf = idf
+        self._indptr = indptr
+        self._rows = rows
+        self._values = values
+        # Unseen query features get the IDF of the rarest possible feature
+        self._unseen_idf = math.log(1 + len(names)) + 1
+
+    @classmethod
+    def build(cls, names: list[str], fields: list[dict[str, list[str]]]) -> 'SemanticIndex':
+        """Build an index from the tokenized fields of each operation.
+
+        Args:
+            names: Full tool names
+            fields: Per operation, maps field name (see FIELD_WEIGHTS) -> terms
+
+        Returns:
+            The index
+        """
+        cache: dict[str, list[int]] = {}
+        docs = [_featurize(doc, cache) for doc in fields]
+
+        # COO entries with sublinear term frequencies
+        rows = np.fromiter(
+            (position for position, doc in enumerate(docs) for _ in doc), dtype=np.int32
+        )
+        columns = np.fromiter((feature for doc in docs for feature in doc), dtype=np.int64)
+        tf = np.fromiter(
+            (1.0 + math.log(count) for doc in docs for count in doc.values()), dtype=np.float32
+        )
+
+        features, columns, df = np.unique(columns, return_inverse=True, return_counts=True)
+        idf = (np.log((1 + len(docs)) / (1 + df)) + 1).astype(np.float32)
+        values = tf * idf[columns]
+
+        # L2-normalize each operation's vector
+        norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(docs)))
+        values /= np.maximum(norms, 1e-12)[rows].astype(np.float32)
+
+        # Sort entries by column (CSC)
+        order = np.argsort(columns, kind='stable')
+        indptr = np.zeros(len(features) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columns, minlength=len(features)), out=indptr[1:])
+        return cls(names, features, idf, indptr, rows[order], values[order])
+
+    @classmethod
+    def from_tools(cls, tools: Iterable[Tool], prefix: str = '') -> 'SemanticIndex':
+        """Build an index from tools.
+
+        Args:
+            tools: The tools
+            prefix: The service prefix of tool names ('<manual>.')
+
+        Returns:
+            The index
+        """
+        tools = list(tools)
+        names = [
+            tool.name if not prefix or tool.name.startswith(prefix) else prefix + tool.name
+            for tool in tools
+        ]
+        return cls.build(names, [tool_fields(tool, prefix) for tool in tools])
+
+    def with_names(self, names: list[str]) -> 'SemanticIndex':
+        """View the index under other tool names, sharing its matrix.
+
+        Args:
+            names: Full tool names, in the order the index was built
+
+        Returns:
+            The view
+        """
+        view = copy.copy(self)
+        view.names = names
+        return view
+
+    def similarities(self, query: str) -> np.ndarray:
+        """Cosine similarity of a query to every operation.
+
+        Args:
+            query: The search query
+
+        Returns:
+            Similarity per operation position
+        """
+        counts = _featurize({'query': tokenize(query)}, {})
+        similarities = np.zeros(len(self.names))
+        if not counts:
+            return similarities
+
+        query_features = np.fromiter(counts, dtype=np.int64)
+        columns = np.searchsorted(self._features, query_features)
+        columns[columns == len(self._features)] = 0
+        known = self._features[columns] == query_features
+        if not known.any():
+            return similarities
+
+        # Normalized over all query features, seen or not
+        weights = np.fromiter((1.0 + math.log(count) for count in counts.values()), dtype=float)
+        weights *= np.where(known, self._idf[columns], self._unseen_idf)
+        weights /= np.linalg.norm(weights)
+        columns, weights = columns[known], weights[known]
+
+        # Sparse dot product: gather the entries of the query's columns and
+        # sum them per operation
+        starts = self._indptr[columns]
+        lengths = self._indptr[columns + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        entries = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+        return np.bincount(
+            self._rows[entries],
+            weights=self._values[entries] * np.repeat(weights, lengths),
+            minlength=len(self.names),
+        )
+
+    def scores(self, query: str) -> dict[int, float]:
+        """Similarities of a query to the operations it resembles.
+
+        Args:
+            query: The search query
+
+        Returns:
+            Maps operation position -> cosine similarity, for similarities
+            of at least MIN_SIMILARITY
+        """
+        similarities = self.similarities(query)
+        positions = np.flatnonzero(similarities >= MIN_SIMILARITY)
+        return dict(zip(positions.tolist(), similarities[positions].tolist(), strict=True))
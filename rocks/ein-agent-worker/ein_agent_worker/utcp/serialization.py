@@ -0,0 +1,154 @@
+"""JSON serialization of UTCP results.
+
+Operation results, operation lists and details reach the agent as JSON
+strings returned by the UTCP activities. Pretty-printed with the standard
+library json module, the indentation alone is about 30% of a large
+Kubernetes list, paid in Temporal payload bytes and LLM tokens, and
+encoding is the worker's largest CPU cost for such responses. Results are
+instead serialized by dumps(), minified, with the fastest encoder
+available:
+
+    orjson        if installed
+    pydantic      pydantic_core.to_json, installed with the agent SDKs
+    json          the standard library
+
+All of them write non-ASCII characters unescaped and fall back to str() for
+values JSON has no type for. A value an encoder cannot handle (e.g., an
+integer beyond 64 bits for orjson) is serialized with the standard library.
+'pretty' (indented, standard library) is available for debugging, and
+other serializers can be added with register_serializer().
+
+Activity arguments and results are Temporal payloads, encoded by the
+OpenAI Agents plugin's payload converter (pydantic_core, compact); the
+plugin requires its own converter, so only the JSON inside the payloads
+is serialized here.
+
+Benchmark the serializers with `just benchmark-serialization`.
+
+Configuration:
+    UTCP_JSON_SERIALIZER: Serializer name, or 'auto' for the fastest
+        available (default: auto)
+"""
+
+import importlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Fastest first, for 'auto'
+_AUTO_ORDER = ('orjson', 'pydantic', 'json')
+
+# Maps name -> serializer, or a factory loading it (returns None if unavailable)
+_factories: dict[str, Callable[[], Callable[[Any], str] | None]] = {}
+_serializers: dict[str, Callable[[Any], str]] = {}
+
+# The serializer dumps() uses, resolved on first use
+_current: Callable[[Any], str] | None = None
+
+
+def _stdlib(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _pretty(value: Any) -> str:
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
+
+
+def _orjson() -> Callable[[Any], str] | None:
+    try:
+        orjson = importlib.import_module('orjson')
+    except ImportError:
+        return None
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def serialize(value: Any) -> str:
+        try:
+            return orjson.dumps(value, default=str, option=options).decode()
+        except TypeError:
+            # e.g., integers beyond 64 bits
+            return _stdlib(value)
+
+    return serialize
+
+
+def _pydantic() -> Callable[[Any], str] | None:
+    try:
+        pydantic_core = importlib.import_module('pydantic_core')
+    except ImportError:
+        return None
+
+    def serialize(value: Any) -> str:
+        try:
+            return pydantic_core.to_json(value, fallback=str).decode()
+        except (TypeError, ValueError, pydantic_core.PydanticSerializationError):
+            return _stdlib(value)
+
+    return serialize
+
+
+def register_serializer(name: str, factory: Callable[[], Callable[[Any], str] | None]) -> None:
+    """Register a serializer.
+
+    Args:
+        name: Serializer name, for UTCP_JSON_SERIALIZER and set_serializer()
+        factory: Returns the serializer (value -> JSON text), or None if it
+            is unavailable (e.g., its package is not installed); called on
+            first use
+    """
+    _factories[name] = factory
+    _serializers.pop(name, None)
+
+
+def get_serializer(name: str) -> Callable[[Any], str] | None:
+    """Get a serializer by name, or None if it is unknown or unavailable."""
+    serializer = _serializers.get(name)
+    if serializer is None and name in _factories:
+        serializer = _factories[name]()
+        if serializer is not None:
+            _serializers[name] = serializer
+    return serializer
+
+
+def available_serializers() -> list[str]:
+    """List the names of the serializers that are available."""
+    return [name for name in _factories if get_serializer(name) is not None]
+
+
+def set_serializer(name: str = 'auto') -> str:
+    """Set the serializer dumps() uses.
+
+    Args:
+        name: Serializer name, or 'auto' for the fastest available. An
+            unknown or unavailable serializer falls back to 'auto', with a
+            warning.
+
+    Returns:
+        Name of the serializer set
+    """
+    global _current
+    serializer = None if name == 'auto' else get_serializer(name)
+    if serializer is None:
+        if name != 'auto':
+            logger.warning('JSON serializer %r is not available, using the fastest one', name)
+        name = next(name for name in _AUTO_ORDER if get_serializer(name) is not None)
+        serializer = get_serializer(name)
+    _current = serializer
+    logger.debug('Serializing UTCP results with %s', name)
+    return name
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value to (minified, by default) JSON text."""
+    if _current is None:
+        set_serializer(os.getenv('UTCP_JSON_SERIALIZER', 'auto'))
+    return _current(value)
+
+
+register_serializer('orjson', _orjson)
+register_serializer('pydantic', _pydantic)
+register_serializer('json', lambda: _stdlib)
+register_serializer('pretty', lambda: _pretty)
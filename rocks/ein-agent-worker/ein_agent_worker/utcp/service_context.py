@@ -0,0 +1,251 @@
+"""Per-client state of a UTCP service, published together with the client.
+
+Creating a service's client sets up more than the client: the connection
+pool for its operation calls, its API base URL and service type, its lazy
+schema resolver, the fields removed from its responses, and the manual
+and indexes its catalog is built from. A reload builds the new client
+while the old one keeps serving calls, so none of that may change under
+the old client before the new one replaces it.
+
+Everything is therefore collected into a ServiceContext while the client
+is built. ToolLoader.create_client makes the context current for the
+build, the protocol fills it in and stages it with the client, and
+catalog.publish applies it when it swaps the client in. A build that
+fails, or that a newer reload supersedes, is discarded along with its
+context, leaving the running service untouched.
+"""
+
+import contextlib
+import contextvars
+import logging
+import ssl
+import weakref
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ein_agent_worker.utcp import http_pool
+from ein_agent_worker.utcp.kubernetes_operations import KubernetesOperationIndex
+from ein_agent_worker.utcp.lazy_schema import (
+    LazySchemaResolver,
+    get_resolver,
+    is_lazy,
+    register_resolver,
+    set_lazy_schemas,
+)
+from ein_agent_worker.utcp.projection import set_default_exclusions
+from ein_agent_worker.utcp.search import SearchIndex
+from utcp.data.utcp_manual import UtcpManual
+
+if TYPE_CHECKING:
+    from ein_agent_worker.utcp.semantic import SemanticIndex
+    from utcp.utcp_client import UtcpClient
+
+logger = logging.getLogger(__name__)
+
+# Registry for API base URLs when using local spec files
+# Maps service_name -> actual API endpoint URL
+_api_base_urls: dict[str, str] = {}
+
+# Maps service_name -> service type (selects the OpenAPI handler)
+_service_types: dict[str, str] = {}
+
+# The context of the client being built in the current task (and the
+# tasks and threads it starts)
+_current: contextvars.ContextVar['ServiceContext | None'] = contextvars.ContextVar(
+    'utcp_service_context', default=None
+)
+
+# Maps client -> service_name -> context built with that client, until the
+# client is published (or garbage collected)
+_staged: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class ServiceContext:
+    """The state of one service client, applied when the client is published.
+
+    Attributes:
+        service_name: The service name
+        service_type: The service type (selects the OpenAPI handler)
+        api_base_url: The API endpoint URL, if configured
+        lazy: Whether input schemas are resolved on first use
+        pool_settings: Settings of the connection pool for operation calls
+            (None keeps the service's current pool)
+        ssl_context: SSL context of the pool's connections
+        exclusions: Paths removed from all responses (None keeps the
+            current ones)
+        resolver: Resolver of the lazy input schemas (set by the protocol)
+        manual: The registered manual (set by the protocol)
+        index: The manual's search index (set by the protocol)
+        semantic: The manual's semantic index (set by the protocol)
+        kubernetes: The manual's Kubernetes operation index, if shared with
+            other services (set by the protocol)
+    """
+
+    service_name: str
+    service_type: str
+    api_base_url: str | None = None
+    lazy: bool = False
+    pool_settings: http_pool.PoolSettings | None = None
+    ssl_context: ssl.SSLContext | None = None
+    exclusions: Sequence[str] | None = None
+    resolver: LazySchemaResolver | None = None
+    manual: UtcpManual | None = None
+    index: SearchIndex | None = None
+    semantic: 'SemanticIndex | None' = None
+    kubernetes: KubernetesOperationIndex | None = None
+
+    @classmethod
+    def published(cls, service_name: str) -> 'ServiceContext':
+        """Build a context holding a service's currently published state.
+
+        Args:
+            service_name: The service name
+
+        Returns:
+            The context (without a manual or indexes)
+        """
+        return cls(
+            service_name=service_name,
+            service_type=get_service_type(service_name),
+            api_base_url=get_api_base_url(service_name),
+            lazy=is_lazy(service_name),
+            resolver=get_resolver(service_name),
+        )
+
+    def apply(self) -> None:
+        """Make this the service's published state."""
+        if self.api_base_url:
+            set_api_base_url(self.service_name, self.api_base_url)
+        else:
+            _api_base_urls.pop(self.service_name, None)
+        set_service_type(self.service_name, self.service_type)
+        set_lazy_schemas(self.service_name, self.lazy)
+        register_resolver(self.service_name, self.resolver)
+        if self.pool_settings is not None and self.ssl_context is not None:
+            http_pool.configure(self.service_name, self.pool_settings, self.ssl_context)
+        if self.exclusions is not None:
+            set_default_exclusions(self.service_name, self.exclusions)
+
+
+@contextlib.contextmanager
+def building(context: ServiceContext) -> Iterator[ServiceContext]:
+    """Make a context current while its service's client is built.
+
+    Args:
+        context: The context of the client being built
+
+    Yields:
+        The context
+    """
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def current(service_name: str) -> ServiceContext:
+    """Get the context of the client being built for a service.
+
+    Args:
+        service_name: The service name
+
+    Returns:
+        The current context, or for a client built outside
+        ToolLoader.create_client, one holding the published state
+    """
+    context = _current.get()
+    if context is not None and context.service_name == service_name:
+        return context
+    return ServiceContext.published(service_name)
+
+
+def stage(client: 'UtcpClient', context: ServiceContext) -> None:
+    """Stage a context with the client it was built for, until the client is published.
+
+    Args:
+        client: The client
+        context: The client's context
+    """
+    _staged.setdefault(client, {})[context.service_name] = context
+
+
+def staged(client: 'UtcpClient', service_name: str) -> ServiceContext | None:
+    """Get the context a client staged for a service, if it is not published yet."""
+    return _staged.get(client, {}).get(service_name)
+
+
+def take(client: 'UtcpClient', service_name: str) -> ServiceContext | None:
+    """Remove and return the context a client staged for a service, if any."""
+    return _staged.get(client, {}).pop(service_name, None)
+
+
+def discard(client: 'UtcpClient') -> None:
+    """Drop the contexts of a client that will not be published."""
+    _staged.pop(client, None)
+
+
+def drop(service_name: str) -> None:
+    """Drop a removed service's published state.
+
+    Args:
+        service_name: The service name
+    """
+    _api_base_urls.pop(service_name, None)
+    _service_types.pop(service_name, None)
+    set_lazy_schemas(service_name, False)
+    set_default_exclusions(service_name, ())
+    http_pool.drop(service_name)
+
+
+def set_api_base_url(service_name: str, url: str) -> None:
+    """Register the API base URL for a service.
+
+    When loading specs from local files, we need to know the real API
+    endpoint URL for making actual API calls.
+
+    Args:
+        service_name: The service name (e.g., 'kubernetes', 'grafana')
+        url: The actual API endpoint URL (e.g., 'https://10.x.x.x:6443')
+    """
+    _api_base_urls[service_name] = url
+    logger.debug('Registered API base URL for %s: %s', service_name, url)
+
+
+def get_api_base_url(service_name: str) -> str | None:
+    """Get the registered API base URL for a service.
+
+    Args:
+        service_name: The service name
+
+    Returns:
+        The API base URL if registered, None otherwise
+    """
+    return _api_base_urls.get(service_name)
+
+
+def set_service_type(service_name: str, service_type: str) -> None:
+    """Register the service type of a service.
+
+    Several services (e.g., one per Kubernetes cluster) can share a type,
+    and with it the OpenAPI handler and compiled operations.
+
+    Args:
+        service_name: The service name (e.g., 'k8s_prod')
+        service_type: The service type (e.g., 'kubernetes')
+    """
+    _service_types[service_name] = service_type
+
+
+def get_service_type(service_name: str) -> str:
+    """Get the service type of a service.
+
+    Args:
+        service_name: The service name
+
+    Returns:
+        The registered service type, defaulting to the service name
+    """
+    return _service_types.get(service_name, service_name)
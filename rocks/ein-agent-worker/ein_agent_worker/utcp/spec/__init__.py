@@ -1,4 +1,4 @@
-"""Spec source resolution strategies and URL utilities."""
+"""Spec source resolution strategies, URL utilities and streaming spec loading."""
 
 from ein_agent_worker.utcp.spec.resolver import find_spec_file, strip_openapi_suffix
 from ein_agent_worker.utcp.spec.strategy import (
@@ -7,6 +7,7 @@ from ein_agent_worker.utcp.spec.strategy import (
     SpecSource,
     SpecSourceStrategy,
 )
+from ein_agent_worker.utcp.spec.streaming import load_spec, prune_unreachable_schemas
 
 __all__ = [
     'LiveURLStrategy',
@@ -14,5 +15,7 @@ __all__ = [
     'SpecSource',
     'SpecSourceStrategy',
     'find_spec_file',
+    'load_spec',
+    'prune_unreachable_schemas',
     'strip_openapi_suffix',
 ]
@@ -0,0 +1,286 @@
+"""Compiled spec bundles.
+
+A bundle is the build-time output of the spec compiler
+(`python -m ein_agent_worker.utcp.compile`): a compact JSON document
+holding everything the worker needs to register a service without
+touching the raw OpenAPI spec:
+
+- the read-only operations, already converted to UTCP tools, with call
+  template URLs relative to the API server so the base URL can be bound
+  at startup
+- input/output schemas interned into one shared table, so identical
+  schemas are stored (and later held in memory) once
+- the operation search index
+- the top-level spec fields handlers need to resolve the server URL
+
+Bundles live next to the spec they were compiled from, as
+`specs/<service>/<version>.bundle.json`.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from utcp_http.openapi_converter import OpenApiConverter
+
+from ein_agent_worker.utcp.openapi_handlers import OpenApiHandler
+from ein_agent_worker.utcp.search import SearchIndex
+from ein_agent_worker.utcp.spec.streaming import load_spec
+from ein_agent_worker.utcp.startup_report import phase
+from ein_agent_worker.utcp.versions import handler_id, utcp_http_version
+from utcp.data.call_template import CallTemplateSerializer
+from utcp.data.tool import JsonSchema, JsonSchemaSerializer, Tool
+from utcp.data.utcp_manual import UtcpManual
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_SUFFIX = '.bundle.json'
+
+# Bump when the bundle layout or compile pipeline changes
+BUNDLE_FORMAT_VERSION = 2
+
+# Spec sections that are compiled into operations and schemas
+_COMPILED_SECTIONS = frozenset({'paths', 'definitions', 'components'})
+
+# Methods OpenApiConverter turns into tools
+_CONVERTED_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+
+class BundleError(Exception):
+    """Raised when a bundle cannot be used."""
+
+
+def is_bundle(path: Path) -> bool:
+    """Check whether a path names a compiled bundle."""
+    return path.name.endswith(BUNDLE_SUFFIX)
+
+
+def bundle_path_for(spec_path: Path) -> Path:
+    """Return the bundle path for a raw spec file."""
+    return spec_path.with_name(f'{spec_path.stem}{BUNDLE_SUFFIX}')
+
+
+def source_spec_path(bundle_path: Path, bundle: dict) -> Path:
+    """Return the raw spec a bundle was compiled from."""
+    source_name = bundle.get('source', {}).get('name') or f'{bundle_version(bundle_path)}.json'
+    return bundle_path.with_name(source_name)
+
+
+def bundle_version(path: Path) -> str:
+    """Return the spec version a bundle or raw spec file is for."""
+    return path.name.removesuffix(BUNDLE_SUFFIX) if is_bundle(path) else path.stem
+
+
+def compile_bundle(spec_path: Path, service_name: str, handler: OpenApiHandler) -> dict:
+    """Compile a raw OpenAPI spec file into a bundle.
+
+    Args:
+        spec_path: Path to the raw spec file.
+        service_name: The service (and manual call template) name.
+        handler: The OpenAPI handler used to preprocess the spec.
+
+    Returns:
+        The bundle document.
+
+    Raises:
+        BundleError: If the file is not an OpenAPI spec.
+    """
+    return compile_spec(
+        spec_path.read_bytes(),
+        spec_path.name,
+        service_name,
+        handler,
+        is_yaml=spec_path.suffix in ['.yaml', '.yml'],
+    )
+
+
+def compile_spec(
+    content: bytes,
+    source_name: str,
+    service_name: str,
+    handler: OpenApiHandler,
+    is_yaml: bool = False,
+) -> dict:
+    """Compile raw OpenAPI spec contents into a bundle.
+
+    Runs the same load, filter and preprocess steps as registration, then
+    converts each operation with an empty base URL so call template URLs
+    keep only the path.
+
+    Args:
+        content: The raw spec contents.
+        source_name: File name (or URL) the spec was read from.
+        service_name: The service (and manual call template) name.
+        handler: The OpenAPI handler used to preprocess the spec.
+        is_yaml: Whether the spec is YAML rather than JSON.
+
+    Returns:
+        The bundle document.
+
+    Raises:
+        BundleError: If the contents are not an OpenAPI spec.
+    """
+    with phase('parse'):
+        spec_data = load_spec(content, service_name, handler.READ_ONLY_METHODS, is_yaml=is_yaml)
+    if 'paths' not in spec_data:
+        raise BundleError(f'{source_name} is not an OpenAPI spec')
+    with phase('preprocess'):
+        spec_data = handler.preprocess_spec(spec_data, service_name)
+
+    converter = OpenApiConverter(spec_data, call_template_name=service_name)
+    template_serializer = CallTemplateSerializer()
+    schema_serializer = JsonSchemaSerializer()
+    schemas: list[dict] = []
+    schema_ids: dict[str, int] = {}
+
+    def intern(schema: JsonSchema) -> int:
+        data = {k: v for k, v in schema_serializer.to_dict(schema).items() if v is not None}
+        key = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        if key not in schema_ids:
+            schema_ids[key] = len(schemas)
+            schemas.append(data)
+        return schema_ids[key]
+
+    # Same iteration order as OpenApiConverter.convert(), which numbers
+    # auth placeholders as it goes
+    tools: list[Tool] = []
+    operations = []
+    with phase('convert'):
+        for path, path_item in spec_data.get('paths', {}).items():
+            for method, operation in path_item.items():
+                if method.lower() not in _CONVERTED_METHODS:
+                    continue
+                tool = converter._create_tool(path, method, operation, base_url='')
+                if tool is None:
+                    continue
+                tools.append(tool)
+                operation = {
+                    'name': tool.name,
+                    'description': tool.description,
+                    'tags': tool.tags,
+                    'inputs': intern(tool.inputs),
+                    'outputs': intern(tool.outputs),
+                    'call_template': template_serializer.to_dict(tool.tool_call_template),
+                }
+                operations.append(operation)
+
+    return {
+        'format': BUNDLE_FORMAT_VERSION,
+        'service': service_name,
+        'source': {
+            'name': source_name,
+            'sha256': hashlib.sha256(content).hexdigest(),
+        },
+        'handler': handler_id(handler),
+        'utcp_http': utcp_http_version(),
+        'spec': {k: v for k, v in spec_data.items() if k not in _COMPILED_SECTIONS},
+        'schemas': schemas,
+        'operations': operations,
+        'search_index': SearchIndex.from_tools(tools).to_dict(),
+    }
+
+
+def write_bundle(bundle: dict, path: Path) -> None:
+    """Write a bundle as minified JSON."""
+    path.write_text(json.dumps(bundle, separators=(',', ':'), ensure_ascii=False))
+
+
+def read_bundle(path: Path) -> dict:
+    """Read a bundle written by write_bundle()."""
+    return json.loads(path.read_bytes())
+
+
+def check_bundle(bundle: dict, bundle_path: Path, handler: OpenApiHandler) -> None:
+    """Verify a bundle matches the runtime that is about to use it.
+
+    Args:
+        bundle: The bundle document.
+        bundle_path: Where the bundle was read from.
+        handler: The OpenAPI handler configured for the service.
+
+    Raises:
+        BundleError: If the bundle is stale or was compiled differently.
+    """
+    if bundle.get('format') != BUNDLE_FORMAT_VERSION:
+        raise BundleError(f'unsupported bundle format {bundle.get("format")!r}')
+    if bundle.get('handler') != handler_id(handler):
+        raise BundleError(f'compiled with handler {bundle.get("handler")}')
+    if bundle.get('utcp_http') != utcp_http_version():
+        raise BundleError(f'compiled with utcp-http {bundle.get("utcp_http")}')
+
+    # A raw spec shipped alongside must be the one the bundle was built from
+    source_path = source_spec_path(bundle_path, bundle)
+    if source_path.exists():
+        source_sha256 = hashlib.sha256(source_path.read_bytes()).hexdigest()
+        if source_sha256 != bundle['source']['sha256']:
+            raise BundleError(f'stale, {source_path.name} changed since it was compiled')
+
+
+def _converter_base_url(spec_header: dict, spec_url: str) -> str:
+    """Pick the base URL the way OpenApiConverter.convert() does."""
+    if spec_header.get('servers'):
+        return spec_header['servers'][0].get('url', '/')
+    parsed = urlparse(spec_url)
+    return f'{parsed.scheme}://{parsed.netloc}'
+
+
+def build_manual(
+    bundle: dict,
+    spec_header: dict,
+    spec_url: str,
+    schemas: list[JsonSchema] | None = None,
+) -> UtcpManual:
+    """Materialize a bundle into a UTCP manual bound to an API server.
+
+    Args:
+        bundle: The bundle document.
+        spec_header: The bundle's spec fields, with the server URL resolved.
+        spec_url: Fallback URL used when the spec declares no servers.
+        schemas: The bundle's schema table as JsonSchema objects, to share
+            them with other services (default: materialized here).
+
+    Returns:
+        The manual.
+    """
+    base_url = _converter_base_url(spec_header, spec_url).rstrip('/')
+    template_serializer = CallTemplateSerializer()
+
+    # One JsonSchema object per interned schema, shared between tools
+    if schemas is None:
+        schema_serializer = JsonSchemaSerializer()
+        schemas = [schema_serializer.validate_dict(data) for data in bundle['schemas']]
+
+    tools = []
+    for operation in bundle['operations']:
+        template: dict[str, Any] = dict(operation['call_template'])
+        template['url'] = base_url + template['url']
+        tools.append(
+            Tool(
+                name=operation['name'],
+                description=operation['description'],
+                inputs=schemas[operation['inputs']],
+                outputs=schemas[operation['outputs']],
+                tags=operation['tags'],
+                tool_call_template=template_serializer.validate_dict(template),
+            )
+        )
+
+    return UtcpManual(tools=tools)
+
+
+def load_search_index(bundle: dict, prefix: str = '') -> SearchIndex:
+    """Load a bundle's prebuilt search index.
+
+    Args:
+        bundle: The bundle document.
+        prefix: The service prefix of tool names ('<manual>.'); the UTCP
+            client prefixes tool names with the manual name on registration.
+
+    Returns:
+        The index, naming operations '<prefix><operation ID>'.
+    """
+    names = [prefix + operation['name'] for operation in bundle['operations']]
+    return SearchIndex.from_dict(bundle['search_index'], names)
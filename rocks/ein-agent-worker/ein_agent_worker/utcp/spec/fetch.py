@@ -0,0 +1,169 @@
+"""Conditional, compressed and cached fetching of live OpenAPI specs.
+
+Every fetched spec is kept on disk with its ETag/Last-Modified validators.
+Later fetches revalidate with If-None-Match/If-Modified-Since, so an
+unchanged spec costs the API server a 304 instead of a full download. When
+the endpoint is unreachable or failing, the last good copy is used, which
+keeps live mode working while the control plane is struggling.
+
+Configuration:
+    UTCP_SPEC_CACHE_ENABLED: Cache fetched specs on disk (default: true)
+    UTCP_SPEC_CACHE_DIR: Cache directory (default: ~/.cache/ein-agent/utcp-specs)
+"""
+
+import gzip
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'ein-agent' / 'utcp-specs'
+
+# httpx decodes zstd only when the optional zstandard package is installed
+ACCEPT_ENCODING = (
+    'zstd, gzip, deflate' if importlib.util.find_spec('zstandard') is not None else 'gzip, deflate'
+)
+
+# Statuses where the server may recover, so a cached copy is preferred
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class FetchedSpec:
+    """A spec body and how it was obtained."""
+
+    content: bytes
+    content_type: str
+    from_cache: bool = False
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_name, path)
+
+
+class SpecFetcher:
+    """Fetch live specs, revalidating against an on-disk cache.
+
+    Cache I/O errors are logged and otherwise ignored, so the cache can
+    only make fetching cheaper, never make it fail.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the fetcher.
+
+        Args:
+            cache_dir: Cache directory, or None to fetch without caching.
+        """
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def from_env(cls) -> 'SpecFetcher':
+        """Create a fetcher from environment variables."""
+        if os.getenv('UTCP_SPEC_CACHE_ENABLED', 'true').lower() != 'true':
+            logger.info('UTCP live spec cache disabled')
+            return cls(None)
+        cache_dir = os.getenv('UTCP_SPEC_CACHE_DIR', '')
+        return cls(Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR)
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f'{key}.json', self.cache_dir / f'{key}.body.gz'
+
+    def _load(self, url: str) -> tuple[dict, bytes] | None:
+        """Load the cached metadata and body for a URL."""
+        if self.cache_dir is None:
+            return None
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_bytes()), gzip.decompress(body_path.read_bytes())
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning('Ignoring unreadable spec cache entry for %s: %s', url, e)
+            return None
+
+    def _store(self, url: str, response: httpx.Response) -> None:
+        """Cache a successful response with its validators."""
+        if self.cache_dir is None:
+            return
+        meta = {
+            'url': url,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'content_type': response.headers.get('content-type', ''),
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first, so metadata never points at a missing/older body
+            _write_atomic(body_path, gzip.compress(response.content, compresslevel=1))
+            _write_atomic(meta_path, json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning('Failed to write spec cache entry for %s: %s', url, e)
+
+    async def fetch(self, service_name: str, url: str, headers: dict[str, str]) -> FetchedSpec:
+        """Fetch a spec, using the cached copy when it is still valid.
+
+        Args:
+            service_name: The service name (for logging).
+            url: The spec URL.
+            headers: Request headers (e.g., Authorization).
+
+        Returns:
+            The spec body and content type.
+
+        Raises:
+            httpx.HTTPError: If the fetch failed and there is no cached copy
+                (or the server rejected the request outright).
+        """
+        cached = self._load(url)
+        request_headers = {**headers, 'Accept-Encoding': ACCEPT_ENCODING}
+        if cached:
+            meta, _ = cached
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            async with httpx.AsyncClient(verify=False) as client:  # noqa: S501
+                response = await client.get(url, headers=request_headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED and cached:
+                meta, content = cached
+                logger.info('[%s] Spec not modified, using cached copy', service_name)
+                return FetchedSpec(content, meta.get('content_type', ''), from_cache=True)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if cached is None or (
+                isinstance(e, httpx.HTTPStatusError)
+                and e.response.status_code not in _RETRYABLE_STATUS_CODES
+            ):
+                raise
+            meta, content = cached
+            logger.warning(
+                '[%s] Failed to fetch spec from %s (%s), using last cached copy',
+                service_name,
+                url,
+                e,
+            )
+            return FetchedSpec(content, meta.get('content_type', ''), from_cache=True)
+
+        logger.info(
+            '[%s] Fetched spec (%d bytes, content-encoding=%s)',
+            service_name,
+            len(response.content),
+            response.headers.get('content-encoding', 'identity'),
+        )
+        self._store(url, response)
+        return FetchedSpec(response.content, response.headers.get('content-type', ''))
@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 
 from ein_agent_worker.utcp.config import DEFAULT_VERSIONS
+from ein_agent_worker.utcp.spec.bundle import BUNDLE_SUFFIX, is_bundle
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ def find_spec_file(specs_dir: Path, service_name: str, version: str = '') -> Pat
     """Find a local OpenAPI spec file for a service.
 
     Looks for version-specific files first, then falls back to any available spec.
+    Compiled bundles (<version>.bundle.json) take priority over raw specs.
 
     Args:
         specs_dir: Directory containing spec files organized by service.
@@ -52,14 +54,17 @@ def find_spec_file(specs_dir: Path, service_name: str, version: str = '') -> Pat
 
     # Look for the version-specific file
     if version:
-        for ext in ['.json', '.yaml', '.yml']:
+        for ext in [BUNDLE_SUFFIX, '.json', '.yaml', '.yml']:
             spec_path = service_dir / f'{version}{ext}'
             if spec_path.exists():
                 return spec_path
 
-    # Fallback: find any available spec
+    # Fallback: find any available bundle, then any raw spec
+    bundle_files = list(service_dir.glob(f'*{BUNDLE_SUFFIX}'))
+    if bundle_files:
+        return bundle_files[0]
     for ext in ['.json', '.yaml', '.yml']:
-        spec_files = list(service_dir.glob(f'*{ext}'))
+        spec_files = [p for p in service_dir.glob(f'*{ext}') if not is_bundle(p)]
         if spec_files:
             return spec_files[0]
 
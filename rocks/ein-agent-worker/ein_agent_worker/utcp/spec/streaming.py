@@ -0,0 +1,196 @@
+"""Streaming OpenAPI spec loading.
+
+JSON specs are parsed incrementally with ijson instead of json.loads, so
+operations that are not read-only are discarded as they are parsed and
+never exist as Python objects all at once. Schema definitions that are not
+reachable from the remaining operations are dropped afterwards.
+
+YAML specs (small, hand-curated) are loaded whole and then filtered the
+same way.
+"""
+
+import io
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import ijson
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Top-level keys that are parsed with dedicated item-by-item passes
+_STREAMED_KEYS = frozenset({'paths', 'definitions'})
+
+# $ref prefixes of schema containers that are pruned to reachable entries,
+# mapped to the key path of the container in the spec
+_SCHEMA_CONTAINERS: dict[str, tuple[str, ...]] = {
+    '#/definitions/': ('definitions',),
+    '#/components/schemas/': ('components', 'schemas'),
+}
+
+
+def load_spec(
+    content: bytes,
+    service_name: str,
+    methods: Iterable[str],
+    is_yaml: bool = False,
+) -> dict:
+    """Load an OpenAPI spec keeping only the given operations.
+
+    Documents without 'paths' (e.g. UTCP manuals) are returned unfiltered.
+
+    Args:
+        content: Raw spec file contents.
+        service_name: The service name (for logging).
+        methods: Lower-case HTTP methods to keep (the handler's
+            READ_ONLY_METHODS).
+        is_yaml: Whether the content is YAML rather than JSON.
+
+    Returns:
+        The parsed spec with filtered paths and reachable definitions only.
+    """
+    methods = frozenset(methods)
+
+    if is_yaml:
+        spec_data = yaml.safe_load(content)
+        if isinstance(spec_data, dict) and isinstance(spec_data.get('paths'), dict):
+            spec_data['paths'] = _filter_paths(spec_data['paths'].items(), methods, service_name)
+    else:
+        spec_data = _stream_json(content, methods, service_name)
+
+    if isinstance(spec_data, dict) and 'paths' in spec_data:
+        prune_unreachable_schemas(spec_data, service_name)
+    return spec_data
+
+
+def _stream_json(content: bytes, methods: frozenset[str], service_name: str) -> dict:
+    """Parse a JSON spec, materializing only the kept operations."""
+    spec_data = _read_top_level(io.BytesIO(content))
+
+    if 'paths' in spec_data:
+        path_items = ijson.kvitems(io.BytesIO(content), 'paths', use_float=True)
+        spec_data['paths'] = _filter_paths(path_items, methods, service_name)
+    if 'definitions' in spec_data:
+        spec_data['definitions'] = dict(
+            ijson.kvitems(io.BytesIO(content), 'definitions', use_float=True)
+        )
+    return spec_data
+
+
+def _read_top_level(stream: io.BytesIO) -> dict:
+    """Build every top-level value except the streamed ones.
+
+    Streamed keys are recorded with a None placeholder so callers know
+    they are present.
+    """
+    spec_data: dict[str, Any] = {}
+    key = None
+    builder = None
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if prefix == '':
+            if builder is not None:
+                spec_data[key] = builder.value
+                builder = None
+            if event == 'map_key':
+                key = value
+                if key in _STREAMED_KEYS:
+                    spec_data[key] = None
+                else:
+                    builder = ijson.ObjectBuilder()
+            elif event not in {'start_map', 'end_map'}:
+                raise ValueError('OpenAPI spec must be a JSON object')
+            continue
+        if builder is not None:
+            builder.event(event, value)
+
+    return spec_data
+
+
+def _filter_paths(
+    path_items: Iterable[tuple[str, Any]], methods: frozenset[str], service_name: str
+) -> dict:
+    """Keep only the given methods, dropping paths left without operations.
+
+    Mirrors OpenApiHandler.filter_readonly_operations so handlers that
+    filter again afterwards see no difference.
+    """
+    filtered_paths = {}
+    total_operations = 0
+    kept_operations = 0
+
+    for path, path_item in path_items:
+        if not isinstance(path_item, dict):
+            continue
+        total_operations += len(path_item)
+        filtered_item = {m: op for m, op in path_item.items() if m.lower() in methods}
+        if filtered_item:
+            kept_operations += len(filtered_item)
+            filtered_paths[path] = filtered_item
+
+    logger.info(
+        '[%s] Streamed spec: kept %d operations, discarded %d while parsing',
+        service_name,
+        kept_operations,
+        total_operations - kept_operations,
+    )
+    return filtered_paths
+
+
+def prune_unreachable_schemas(spec_data: dict, service_name: str) -> None:
+    """Drop schema definitions not referenced (transitively) by the spec.
+
+    Everything outside the schema containers ('definitions' for Swagger 2.0,
+    'components.schemas' for OpenAPI 3.x) is treated as a root, so only
+    schemas that no remaining operation, parameter or response can reach
+    are removed. The spec is modified in place.
+
+    Args:
+        spec_data: The parsed (already filtered) spec.
+        service_name: The service name (for logging).
+    """
+    containers: dict[str, dict] = {}
+    for ref_prefix, key_path in _SCHEMA_CONTAINERS.items():
+        node: Any = spec_data
+        for key in key_path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, dict) and node:
+            containers[ref_prefix] = node
+
+    if not containers:
+        return
+
+    container_ids = {id(c) for c in containers.values()}
+    reachable: dict[str, set[str]] = {prefix: set() for prefix in containers}
+    pending: list[Any] = [spec_data]
+
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                for ref_prefix, container in containers.items():
+                    if not ref.startswith(ref_prefix):
+                        continue
+                    name = ref[len(ref_prefix) :].replace('~1', '/').replace('~0', '~')
+                    if name in container and name not in reachable[ref_prefix]:
+                        reachable[ref_prefix].add(name)
+                        pending.append(container[name])
+            # Schema containers are only entered through $refs
+            pending.extend(v for v in node.values() if id(v) not in container_ids)
+        elif isinstance(node, list):
+            pending.extend(node)
+
+    for ref_prefix, container in containers.items():
+        kept = {name: container[name] for name in container if name in reachable[ref_prefix]}
+        removed = len(container) - len(kept)
+        container.clear()
+        container.update(kept)
+        logger.info(
+            '[%s] Pruned %d unreachable schema(s) under %s, kept %d',
+            service_name,
+            removed,
+            ref_prefix,
+            len(kept),
+        )
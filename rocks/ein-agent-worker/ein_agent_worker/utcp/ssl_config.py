@@ -4,58 +4,40 @@ WARNING: Disabling SSL verification should only be used for
 development/testing with self-signed certificates.
 """
 
-import logging
 import ssl
 
-import aiohttp
-
-logger = logging.getLogger(__name__)
-
 
 class SSLConfigManager:
-    """Manage SSL verification settings for aiohttp.
-
-    Note: The actual effect of disabling SSL verification is process-wide
-    because it monkey-patches aiohttp. The instance state tracks whether
-    the patch has been applied to ensure idempotency.
+    """Provide the SSL contexts of UTCP services' connections.
+
+    Each service's connection pool (see http_pool.py) uses the context for
+    its own insecure setting, as do its calls and OAuth2 token fetches
+    before it has a pool (see local_file_protocol.py), so skipping
+    verification for one service does not affect any other. Contexts are
+    created once per manager and shared by the services with the same
+    setting.
     """
 
     def __init__(self):
-        self._configured = False
-
-    def disable_ssl_verification(self) -> None:
-        """Disable SSL certificate verification globally for aiohttp.
-
-        WARNING: Only use this for development/testing with self-signed certs.
-        This patches aiohttp to disable SSL verification. Idempotent.
-        """
-        if self._configured:
-            return
+        # Maps insecure -> SSL context
+        self._contexts: dict[bool, ssl.SSLContext] = {}
 
-        # Create an insecure SSL context
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+    def ssl_context(self, insecure: bool = False) -> ssl.SSLContext:
+        """Get the SSL context for a service's connections.
 
-        # Patch aiohttp's TCPConnector to use insecure SSL by default
-        original_init = aiohttp.TCPConnector.__init__
+        WARNING: Only use insecure contexts for development/testing with
+        self-signed certs.
 
-        def _patched_init(self, *args, **kwargs):
-            if 'ssl' not in kwargs:
-                kwargs['ssl'] = ssl_context
-            original_init(self, *args, **kwargs)
+        Args:
+            insecure: Skip certificate and hostname verification
 
-        aiohttp.TCPConnector.__init__ = _patched_init
-
-        # Also patch ClientSession to pass ssl=False by default
-        original_request = aiohttp.ClientSession._request
-
-        async def _patched_request(self, method, url, **kwargs):
-            if 'ssl' not in kwargs:
-                kwargs['ssl'] = False
-            return await original_request(self, method, url, **kwargs)
-
-        aiohttp.ClientSession._request = _patched_request
-
-        self._configured = True
-        logger.warning('SSL verification disabled for aiohttp - use only for development')
+        Returns:
+            The SSL context
+        """
+        context = self._contexts.get(insecure)
+        if context is None:
+            context = self._contexts[insecure] = ssl.create_default_context()
+            if insecure:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+        return context
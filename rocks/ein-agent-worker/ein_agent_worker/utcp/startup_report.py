@@ -0,0 +1,243 @@
+"""Startup phase timing and memory instrumentation for UTCP services.
+
+Each service's initialization is measured as a StartupReport: wall time
+per phase (spec read/fetch, parse, preprocess, server URL resolution,
+conversion, UtcpClient creation, ...), the number of tools registered and
+the RSS / traced-memory growth while it initialized. Code on the startup
+path marks phases with `phase()`; the report being filled is carried in a
+context variable, so phases run in worker threads (asyncio.to_thread) are
+attributed to the right service.
+
+Services initialize concurrently, so memory deltas of overlapping
+services include each other's allocations. Phases nest: 'client_create'
+covers manual registration and the phases within it.
+
+Every finished report is logged as one JSON record, and once the critical
+services are up a summary of all of them is logged. When a metric meter
+is set (see worker.py), reports are also recorded as metrics:
+
+    utcp_startup_phase_duration{service,phase}  histogram, seconds
+    utcp_startup_duration{service}              gauge, seconds
+    utcp_startup_tools{service}                 gauge
+    utcp_startup_rss_delta{service}             gauge, bytes
+
+Configuration:
+    UTCP_STARTUP_TRACEMALLOC: Trace Python allocations during startup (default: false)
+"""
+
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from temporalio.common import MetricMeter
+
+logger = logging.getLogger(__name__)
+
+# Report of the service initializing in the current context
+_current: ContextVar['StartupReport | None'] = ContextVar('utcp_startup_report', default=None)
+
+# Maps service_name -> its latest report
+_reports: dict[str, 'StartupReport'] = {}
+
+# Metric instruments, created by set_metric_meter()
+_metrics: dict[str, Any] = {}
+
+# Whether tracemalloc was started here (and so should be stopped here)
+_tracing_started = False
+
+
+@dataclass
+class StartupReport:
+    """Startup measurements of one UTCP service.
+
+    Attributes:
+        service_name: The service name
+        phases: Seconds spent per phase (accumulated if a phase repeats)
+        tool_count: Number of tools registered
+        total_seconds: Wall time of the whole initialization
+        rss_delta_bytes: Resident set size growth (None if unavailable)
+        traced_delta_bytes: tracemalloc traced-memory growth (None if not tracing)
+        success: Whether the client was created and registered
+    """
+
+    service_name: str
+    phases: dict[str, float] = field(default_factory=dict)
+    tool_count: int = 0
+    total_seconds: float = 0.0
+    rss_delta_bytes: int | None = None
+    traced_delta_bytes: int | None = None
+    success: bool = False
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        """Return the report with durations rounded to milliseconds."""
+        data = asdict(self)
+        data['phases'] = {name: round(s, 3) for name, s in self.phases.items()}
+        data['total_seconds'] = round(self.total_seconds, 3)
+        return data
+
+
+def _current_rss() -> int | None:
+    """Return the current resident set size in bytes (Linux only)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _traced_memory() -> int | None:
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a startup phase of the service initializing in this context.
+
+    A no-op outside measure_service(), e.g. when a manual is re-registered
+    later on.
+
+    Args:
+        name: Phase name (e.g., 'parse')
+    """
+    report = _current.get()
+    if report is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.add_phase(name, time.perf_counter() - start)
+
+
+def set_tool_count(count: int) -> None:
+    """Record the number of tools registered for the service in this context."""
+    report = _current.get()
+    if report is not None:
+        report.tool_count = count
+
+
+@contextmanager
+def measure_service(service_name: str) -> Iterator[StartupReport]:
+    """Measure the initialization of a service.
+
+    The caller sets report.success once the service is ready. The report
+    is logged and recorded as metrics on exit, including on failure.
+
+    Args:
+        service_name: The service name
+
+    Yields:
+        The report being filled
+    """
+    report = StartupReport(service_name)
+    token = _current.set(report)
+    rss_before = _current_rss()
+    traced_before = _traced_memory()
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.total_seconds = time.perf_counter() - start
+        rss_after = _current_rss()
+        traced_after = _traced_memory()
+        if rss_before is not None and rss_after is not None:
+            report.rss_delta_bytes = rss_after - rss_before
+        if traced_before is not None and traced_after is not None:
+            report.traced_delta_bytes = traced_after - traced_before
+        _current.reset(token)
+
+        _reports[service_name] = report
+        _record_metrics(report)
+        logger.info(
+            '[%s] UTCP startup report: %s',
+            service_name,
+            json.dumps(report.to_dict()),
+            extra={'utcp_startup_report': report.to_dict()},
+        )
+
+
+def start_tracing() -> None:
+    """Start tracemalloc for startup if UTCP_STARTUP_TRACEMALLOC is set."""
+    global _tracing_started
+    if os.getenv('UTCP_STARTUP_TRACEMALLOC', 'false').lower() != 'true':
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracing_started = True
+
+
+def log_summary() -> None:
+    """Log the reports of all services initialized so far as one record.
+
+    Also stops tracemalloc if start_tracing() started it, since tracing
+    slows down every allocation.
+    """
+    global _tracing_started
+    reports = sorted(_reports.values(), key=lambda r: r.total_seconds, reverse=True)
+    summary = {
+        'services': [report.to_dict() for report in reports],
+        'rss_bytes': _current_rss(),
+    }
+    if tracemalloc.is_tracing():
+        summary['traced_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+    if _tracing_started:
+        tracemalloc.stop()
+        _tracing_started = False
+
+    logger.info(
+        'UTCP startup summary: %s',
+        json.dumps(summary),
+        extra={'utcp_startup_summary': summary},
+    )
+
+
+def get_reports() -> dict[str, StartupReport]:
+    """Get the latest startup report of each service."""
+    return dict(_reports)
+
+
+def set_metric_meter(meter: MetricMeter | None) -> None:
+    """Set (or with None, clear) the meter startup reports are recorded to.
+
+    Args:
+        meter: Metric meter, e.g. the Temporal runtime's
+    """
+    _metrics.clear()
+    if meter is None:
+        return
+    _metrics['phase_duration'] = meter.create_histogram_float(
+        'utcp_startup_phase_duration', 'Duration of a UTCP service startup phase', 's'
+    )
+    _metrics['duration'] = meter.create_gauge_float(
+        'utcp_startup_duration', 'Total UTCP service initialization time', 's'
+    )
+    _metrics['tools'] = meter.create_gauge(
+        'utcp_startup_tools', 'Tools registered for a UTCP service'
+    )
+    _metrics['rss_delta'] = meter.create_gauge(
+        'utcp_startup_rss_delta', 'RSS growth during UTCP service initialization', 'By'
+    )
+
+
+def _record_metrics(report: StartupReport) -> None:
+    if not _metrics:
+        return
+    attributes = {'service': report.service_name}
+    for name, seconds in report.phases.items():
+        _metrics['phase_duration'].record(seconds, {**attributes, 'phase': name})
+    _metrics['duration'].set(report.total_seconds, attributes)
+    _metrics['tools'].set(report.tool_count, attributes)
+    if report.rss_delta_bytes is not None:
+        _metrics['rss_delta'].set(max(report.rss_delta_bytes, 0), attributes)
@@ -7,7 +7,9 @@ outside the workflow sandbox.
 Pattern follows the MCP integration in temporalio.contrib.openai_agents._mcp.
 """
 
+import asyncio
 import dataclasses
+import heapq
 import json
 import logging
 from collections.abc import Callable, Sequence
@@ -18,12 +20,35 @@ from agents import function_tool
 from temporalio import activity, workflow
 from temporalio.workflow import ActivityConfig
 
+from ein_agent_worker.utcp import memo, serialization
 from ein_agent_worker.utcp import registry as utcp_registry
 from ein_agent_worker.utcp.approval import create_approval_checker
+from ein_agent_worker.utcp.call_resolution import coerce_arguments, resolve_operation
+from ein_agent_worker.utcp.catalog import OperationCatalog, get_catalog
 from ein_agent_worker.utcp.config import UTCPServiceConfig
+from ein_agent_worker.utcp.facets import facet_tree, tool_tags
+from ein_agent_worker.utcp.kubernetes_pagination import (
+    FieldsNotFoundError,
+    paginate_list,
+    should_paginate,
+)
+from ein_agent_worker.utcp.projection import (
+    field_paths,
+    get_default_exclusions,
+    parse_fields,
+    project,
+)
+from ein_agent_worker.utcp.response_summary import fit_response, max_response_bytes
+from ein_agent_worker.utcp.service_context import get_service_type
 
 logger = logging.getLogger(__name__)
 
+# list_{service}_operations output modes
+LIST_MODES = ('compact', 'full', 'facets')
+DEFAULT_LIST_PAGE_SIZE = 100
+MAX_LIST_PAGE_SIZE = 200
+MAX_SEARCH_LIMIT = 50
+
 
 # =============================================================================
 # Activity Arguments
@@ -34,6 +59,10 @@ logger = logging.getLogger(__name__)
 class _ListOperationsArguments:
     service_name: str
     tag: str = ''
+    resource: str = ''
+    mode: str = 'compact'
+    page: int = 1
+    page_size: int = DEFAULT_LIST_PAGE_SIZE
 
 
 @dataclasses.dataclass
@@ -43,10 +72,29 @@ class _SearchOperationsArguments:
     limit: int = 20
 
 
+@dataclasses.dataclass
+class _SearchAllOperationsArguments:
+    query: str
+    limit: int = 20
+    services: list[str] = dataclasses.field(default_factory=list)  # empty: all
+
+
+@dataclasses.dataclass
+class _FindKubernetesOperationArguments:
+    service_name: str
+    kind: str
+    verb: str = 'list'
+    namespaced: bool | None = None
+    subresource: str = ''
+    group: str = ''  # empty: any
+    version: str = ''  # empty: any
+
+
 @dataclasses.dataclass
 class _GetOperationDetailsArguments:
     service_name: str
     tool_name: str
+    verbose: bool = False
 
 
 @dataclasses.dataclass
@@ -54,6 +102,8 @@ class _CallOperationArguments:
     service_name: str
     tool_name: str
     arguments: str  # JSON string
+    fields: str = ''  # comma-separated paths to keep; empty: all
+    top_by: str = ''  # field path ranking items when the response is summarized
 
 
 # =============================================================================
@@ -70,41 +120,66 @@ def get_utcp_activities() -> Sequence[Callable]:
 
     @activity.defn(name='utcp-list-operations')
     async def list_operations(args: _ListOperationsArguments) -> str:
-        """List all available API operations with optional tag filtering."""
+        """List API operations: a page of names or details, or facet counts."""
         client = utcp_registry.get_client(args.service_name)
         if not client:
             return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
+        if args.mode not in LIST_MODES:
+            error = f"Invalid mode '{args.mode}'. Use one of: {', '.join(LIST_MODES)}"
+            return json.dumps({'error': error})
 
         try:
-            # Fetch all tools using a broad search
-            all_tools = await client.search_tools(' ', limit=2000)
-
-            # Filter by tag if provided
-            if args.tag:
-                tag_lower = args.tag.lower()
-                filtered_tools = [
-                    t
-                    for t in all_tools
-                    if hasattr(t, 'tags') and any(tag_lower in str(tag).lower() for tag in t.tags)
-                ]
+            catalog = await get_catalog(args.service_name, client)
+            page_size = min(max(args.page_size, 1), MAX_LIST_PAGE_SIZE)
+            key = (
+                args.service_name,
+                catalog.version,
+                args.tag.lower(),
+                args.resource.lower(),
+                args.mode,
+                args.page,
+                page_size,
+            )
+            response = memo.operation_lists.get(key)
+            if response is not None:
+                return response
+
+            # Filter by tag and resource if provided
+            tag_lower = args.tag.lower()
+            resource_lower = args.resource.lower()
+            tools = []
+            resources = []
+            for tool, resource in zip(catalog.tools, catalog.resources, strict=True):
+                if tag_lower and not any(tag_lower in tag.lower() for tag in tool_tags(tool)):
+                    continue
+                if resource_lower and resource_lower != resource.lower():
+                    continue
+                tools.append(tool)
+                resources.append(resource)
+
+            if args.mode == 'facets':
+                result = {'total': len(tools), 'facets': facet_tree(tools, resources)}
             else:
-                filtered_tools = all_tools
-
-            result = [
-                {
-                    'name': tool.name,
-                    'tags': tool.tags if hasattr(tool, 'tags') else [],
-                    'description': tool.description,
+                pages = max((len(tools) + page_size - 1) // page_size, 1)
+                page = min(max(args.page, 1), pages)
+                page_tools = tools[(page - 1) * page_size : page * page_size]
+                result = {
+                    'total': len(tools),
+                    'page': page,
+                    'pages': pages,
+                    'operations': (
+                        [tool.name for tool in page_tools]
+                        if args.mode == 'compact'
+                        else [
+                            {'name': tool.name, 'tags': tool.tags, 'description': tool.description}
+                            for tool in page_tools
+                        ]
+                    ),
                 }
-                for tool in filtered_tools
-            ]
 
-            response = {
-                'total': len(result),
-                'operations': result,
-            }
-
-            return json.dumps(response, indent=2)
+            response = serialization.dumps(result)
+            memo.operation_lists.put(key, response)
+            return response
         except Exception as e:
             logger.error('Error listing %s operations: %s', args.service_name, e)
             return json.dumps({'error': str(e)})
@@ -117,43 +192,19 @@ def get_utcp_activities() -> Sequence[Callable]:
             return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
 
         try:
-            # Fetch all tools for client-side scoring
-            all_tools = await client.search_tools(' ', limit=2000)
-
-            query_lower = args.query.lower()
-            query_words = query_lower.split()
-
-            scored_tools = []
-            for tool in all_tools:
-                name_lower = tool.name.lower()
-                desc_lower = tool.description.lower() if tool.description else ''
-
-                score = 0
-
-                # Exact name match
-                if query_lower == name_lower.replace(f'{args.service_name}.', ''):
-                    score += 100
-
-                # Partial name match
-                if query_lower in name_lower:
-                    score += 50
-
-                # Word matches in name
-                matches_in_name = sum(1 for w in query_words if w in name_lower)
-                score += matches_in_name * 10
-
-                # Word matches in description
-                matches_in_desc = sum(1 for w in query_words if w in desc_lower)
-                score += matches_in_desc * 5
-
-                if score > 0:
-                    scored_tools.append((score, tool))
-
-            # Sort by score descending
-            scored_tools.sort(key=lambda x: x[0], reverse=True)
+            catalog = await get_catalog(args.service_name, client)
+            limit = min(max(args.limit, 1), MAX_SEARCH_LIMIT)
+            key = (
+                args.service_name,
+                catalog.version,
+                memo.normalize_query(args.query),
+                limit,
+            )
+            response = memo.search_results.get(key)
+            if response is not None:
+                return response
 
-            # Take top 'limit'
-            top_tools = [t[1] for t in scored_tools[: args.limit]]
+            top_tools = [tool for _, tool in catalog.search(args.query, limit)]
 
             result = [
                 {
@@ -164,7 +215,9 @@ def get_utcp_activities() -> Sequence[Callable]:
                 for tool in top_tools
             ]
 
-            return json.dumps(result, indent=2)
+            response = serialization.dumps(result)
+            memo.search_results.put(key, response)
+            return response
         except Exception as e:
             logger.error(
                 'Error searching %s operations: %s',
@@ -173,29 +226,143 @@ def get_utcp_activities() -> Sequence[Callable]:
             )
             return json.dumps({'error': str(e)})
 
-    @activity.defn(name='utcp-get-operation-details')
-    async def get_operation_details(args: _GetOperationDetailsArguments) -> str:
-        """Get detailed parameter schema for a specific operation."""
-        client = utcp_registry.get_client(args.service_name)
-        if not client:
-            return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
-
+    @activity.defn(name='utcp-search-all-operations')
+    async def search_all_operations(args: _SearchAllOperationsArguments) -> str:
+        """Search the operations of several services, merged into one ranking."""
         try:
-            tools = await client.search_tools(args.tool_name, limit=10)
+            services = args.services or utcp_registry.list_services()
+            limit = min(max(args.limit, 1), MAX_SEARCH_LIMIT)
+
+            async def catalog_of(service_name: str) -> OperationCatalog:
+                client = utcp_registry.get_client(service_name)
+                if not client:
+                    raise LookupError(f"UTCP service '{service_name}' not found")
+                return await get_catalog(service_name, client)
 
-            for tool in tools:
-                if tool.name == args.tool_name:
-                    schema = _serialize_schema(tool.inputs) if hasattr(tool, 'inputs') else {}
+            results = await asyncio.gather(
+                *(catalog_of(service_name) for service_name in services), return_exceptions=True
+            )
 
-                    response = {
+            catalogs = []
+            errors = {}
+            for service_name, result in zip(services, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error('Error searching %s operations: %s', service_name, result)
+                    errors[service_name] = str(result) or type(result).__name__
+                else:
+                    catalogs.append(result)
+
+            key = (
+                tuple((catalog.service_name, catalog.version) for catalog in catalogs),
+                memo.normalize_query(args.query),
+                limit,
+            )
+            if not errors:
+                response = memo.cross_service_search_results.get(key)
+                if response is not None:
+                    return response
+
+            matches = [
+                (matched, score, catalog.service_name, tool)
+                for catalog in catalogs
+                for matched, score, tool in catalog.match(args.query, limit)
+            ]
+
+            # Ranked by matched query terms, then by score scaled to the index size
+            top = heapq.nlargest(limit, matches, key=lambda match: match[:2])
+            response: dict[str, Any] = {
+                'operations': [
+                    {
                         'name': tool.name,
+                        'service': service_name,
+                        'tags': tool.tags if hasattr(tool, 'tags') else [],
                         'description': tool.description,
-                        'parameters': schema,
                     }
+                    for _, _, service_name, tool in top
+                ]
+            }
+            if errors:
+                response['errors'] = errors
+                return serialization.dumps(response)
+
+            memoized = serialization.dumps(response)
+            memo.cross_service_search_results.put(key, memoized)
+            return memoized
+        except Exception as e:
+            logger.error('Error searching operations of all services: %s', e)
+            return json.dumps({'error': str(e)})
+
+    @activity.defn(name='utcp-find-kubernetes-operation')
+    async def find_kubernetes_operation(args: _FindKubernetesOperationArguments) -> str:
+        """Find a Kubernetes operation by kind, verb, scope and subresource."""
+        client = utcp_registry.get_client(args.service_name)
+        if not client:
+            return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
+
+        try:
+            index = (await get_catalog(args.service_name, client)).kubernetes_operations
+            matches = index.find(
+                args.kind,
+                verb=args.verb,
+                namespaced=args.namespaced,
+                subresource=args.subresource,
+                group=args.group or None,
+                version=args.version,
+            )
+            if not matches:
+                response = {
+                    'error': f"No '{args.verb}' operation found for kind '{args.kind}' "
+                    'with these filters.',
+                    'available': index.describe(args.kind),
+                }
+                return serialization.dumps(response)
+
+            best = dataclasses.asdict(matches[0])
+            response = {
+                'operation': best.pop('name'),
+                **best,
+                'alternatives': [match.name for match in matches[1:]],
+            }
+            return serialization.dumps(response)
+        except Exception as e:
+            logger.error('Error finding %s operation: %s', args.service_name, e)
+            return json.dumps({'error': str(e)})
 
-                    return json.dumps(response, indent=2)
+    @activity.defn(name='utcp-get-operation-details')
+    async def get_operation_details(args: _GetOperationDetailsArguments) -> str:
+        """Get the parameters of a specific operation: a summary, or the full schema."""
+        client = utcp_registry.get_client(args.service_name)
+        if not client:
+            return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
 
-            return json.dumps({'error': f"Tool '{args.tool_name}' not found."})
+        try:
+            catalog = await get_catalog(args.service_name, client)
+            key = (args.service_name, catalog.version, args.tool_name, args.verbose)
+            response = memo.operation_details.get(key)
+            if response is not None:
+                return response
+
+            tool = catalog.get(args.tool_name)
+            if tool is None:
+                return json.dumps({'error': f"Tool '{args.tool_name}' not found."})
+
+            if args.verbose:
+                response = {
+                    'name': tool.name,
+                    'description': tool.description,
+                    'parameters': await catalog.parameters(tool),
+                }
+                memoized = serialization.dumps(response)
+            else:
+                response = {
+                    'name': tool.name,
+                    'description': tool.description,
+                    'method': getattr(tool.tool_call_template, 'http_method', None),
+                    'parameters': await catalog.parameter_summaries(tool),
+                }
+                memoized = serialization.dumps(response)
+            memo.operation_details.put(key, memoized)
+            return memoized
         except Exception as e:
             logger.error(
                 'Error getting %s operation details: %s',
@@ -211,11 +378,16 @@ def get_utcp_activities() -> Sequence[Callable]:
         if not client:
             return json.dumps({'error': f"UTCP service '{args.service_name}' not found"})
 
+        try:
+            fields = parse_fields(args.fields)
+        except ValueError as e:
+            return json.dumps({'error': str(e)})
+
         try:
             # Validate tool name belongs to this service
             expected_prefix = f'{args.service_name}.'
-            if not args.tool_name.startswith(expected_prefix):
-                tool_service = args.tool_name.split('.')[0]
+            tool_service = args.tool_name.split('.')[0]
+            if tool_service != args.service_name and tool_service in utcp_registry.list_services():
                 error_msg = (
                     f"Tool name mismatch: '{args.tool_name}' does not "
                     f"start with '{expected_prefix}'. "
@@ -227,14 +399,73 @@ def get_utcp_activities() -> Sequence[Callable]:
                 logger.error('[%s] %s', args.service_name, error_msg)
                 return json.dumps({'error': error_msg})
 
+            arguments = json.loads(args.arguments) if args.arguments else {}
+            if isinstance(arguments, str):
+                # Arguments encoded twice
+                arguments = json.loads(arguments)
+            if not isinstance(arguments, dict):
+                return json.dumps({'error': 'Arguments must be a JSON object'})
+
+            catalog = await get_catalog(args.service_name, client)
+            resolution = resolve_operation(catalog, args.tool_name, arguments)
+            if resolution.tool is None:
+                response = {
+                    'error': f"Tool '{args.tool_name}' not found. "
+                    f'Use search_{args.service_name}_operations to find the exact name.'
+                }
+                if resolution.candidates:
+                    response['did_you_mean'] = resolution.candidates
+                return json.dumps(response)
+
+            tool = resolution.tool
+            arguments, corrections = coerce_arguments(arguments, await catalog.parameters(tool))
+            corrections = resolution.corrections + corrections
+            if corrections:
+                logger.info(
+                    '[%s] Corrected call to %s: %s',
+                    args.service_name,
+                    tool.name,
+                    '; '.join(corrections),
+                )
+
             logger.debug(
                 '[%s] Calling tool: %s',
                 args.service_name,
-                args.tool_name,
+                tool.name,
             )
-            arguments = json.loads(args.arguments) if args.arguments else {}
-            result = await client.call_tool(args.tool_name, arguments)
-            return _serialize_result(result)
+            exclude = get_default_exclusions(args.service_name)
+            operation = (
+                catalog.kubernetes_operations.get(tool.name)
+                if get_service_type(args.service_name) == 'kubernetes'
+                else None
+            )
+            if operation and operation.verb == 'list' and should_paginate(arguments):
+                try:
+                    result = await paginate_list(
+                        lambda page: client.call_tool(tool.name, page), arguments, fields, exclude
+                    )
+                except FieldsNotFoundError as e:
+                    error = {
+                        'error': f'None of the fields {args.fields!r} are in the response',
+                        'available_fields': e.available_fields,
+                    }
+                    return json.dumps(error)
+            else:
+                result = await client.call_tool(tool.name, arguments)
+                if isinstance(result, dict | list):
+                    projected = project(result, fields, exclude)
+                    if projected is None:
+                        error = {
+                            'error': f'None of the fields {args.fields!r} are in the response',
+                            'available_fields': field_paths(result),
+                        }
+                        return json.dumps(error)
+                    result = projected
+            if corrections:
+                response = serialization.dumps({'corrections': corrections, 'result': result})
+            else:
+                response = _serialize_result(result)
+            return fit_response(result, response, max_response_bytes(), args.top_by, corrections)
         except json.JSONDecodeError as e:
             return json.dumps({'error': f'Invalid JSON arguments: {e}'})
         except Exception as e:
@@ -250,7 +481,14 @@ def get_utcp_activities() -> Sequence[Callable]:
             logger.error('Traceback: %s', traceback.format_exc())
             return json.dumps({'error': error_msg})
 
-    return (list_operations, search_operations, get_operation_details, call_operation)
+    return (
+        list_operations,
+        search_operations,
+        search_all_operations,
+        find_kubernetes_operation,
+        get_operation_details,
+        call_operation,
+    )
 
 
 # =============================================================================
@@ -293,23 +531,38 @@ def create_utcp_workflow_tools(
         )
 
     @function_tool(name_override=f'list_{service_name}_operations')
-    async def list_operations(tag: str = '') -> str:
-        """List all available API operations with optional tag filtering.
-
-        Use this to discover what operations are available without searching.
-        Returns ALL operations (no pagination).
+    async def list_operations(
+        tag: str = '',
+        resource: str = '',
+        mode: str = 'compact',
+        page: int = 1,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+    ) -> str:
+        """List available API operations, a page at a time.
+
+        Prefer search_{service}_operations when you know what you need.
+        To browse, start with mode="facets" to see operation counts per
+        tag and resource (e.g., core_v1 -> pods), then list one tag or
+        resource.
 
         Args:
             tag: Optional tag filter (e.g., "v1", "core", "apps").
                 Leave empty to list all.
+            resource: Optional resource filter (e.g., "pods", "dashboards"),
+                as shown by mode="facets"
+            mode: "compact" (operation names only, default), "full" (names,
+                tags and descriptions) or "facets" (counts per tag and
+                resource, no operations)
+            page: Page number starting from 1
+            page_size: Operations per page (default: 100, max: 200)
 
         Returns:
-            JSON list of available operations with their names, tags,
-            and descriptions.
+            JSON with the total, page, page count and operations, or in
+            facets mode, the total and tag -> resource counts.
         """
         return await workflow.execute_activity(
             'utcp-list-operations',
-            _ListOperationsArguments(service_name, tag),
+            _ListOperationsArguments(service_name, tag, resource, mode, page, page_size),
             result_type=str,
             **activity_config,
         )
@@ -321,7 +574,8 @@ def create_utcp_workflow_tools(
         Args:
             query: Natural language description of what you want to do
                    (e.g., "list pods", "get dashboard", "cluster status")
-            limit: Maximum number of operations to return (default: 20)
+            limit: Maximum number of operations to return
+                   (default: 20, max: 50)
 
         Returns:
             JSON list of available operations with their names and descriptions.
@@ -334,8 +588,8 @@ def create_utcp_workflow_tools(
         )
 
     @function_tool(name_override=f'get_{service_name}_operation_details')
-    async def get_operation_details(tool_name: str) -> str:
-        """Get detailed parameter schema for a specific operation.
+    async def get_operation_details(tool_name: str, verbose: bool = False) -> str:
+        """Get the parameters of a specific operation.
 
         Use this after finding an operation with search to know
         what parameters it requires.
@@ -343,13 +597,17 @@ def create_utcp_workflow_tools(
         Args:
             tool_name: The exact name of the tool
                 (e.g., "kubernetes.listCoreV1NamespacedPod")
+            verbose: Return the full JSON schema instead of the summary.
+                Only needed to build a complex request body.
 
         Returns:
-            JSON schema of the tool's parameters.
+            JSON summary of the tool's parameters: name, location (path,
+            query, header or body), type, whether required, enum values,
+            default and a short description, required parameters first.
         """
         return await workflow.execute_activity(
             'utcp-get-operation-details',
-            _GetOperationDetailsArguments(service_name, tool_name),
+            _GetOperationDetailsArguments(service_name, tool_name, verbose),
             result_type=str,
             **activity_config,
         )
@@ -358,7 +616,9 @@ def create_utcp_workflow_tools(
         name_override=f'call_{service_name}_operation',
         needs_approval=approval_checker if approval_checker else False,
     )
-    async def call_operation(tool_name: str, arguments: str = '{}') -> str:
+    async def call_operation(
+        tool_name: str, arguments: str = '{}', fields: str = '', top_by: str = ''
+    ) -> str:
         """Execute an API operation.
 
         IMPORTANT: This tool is ONLY for operations of this service.
@@ -370,18 +630,129 @@ def create_utcp_workflow_tools(
             tool_name: The exact tool name from search results
             arguments: JSON string of arguments matching the tool's
                 parameter schema
+            fields: Comma-separated response paths to keep, e.g.
+                "items.metadata.name,items.status.phase". Lists are
+                traversed implicitly; '*' matches any key. Use it for
+                large list responses. Empty: the whole response.
+            top_by: Numeric field path to rank items by if the response is
+                summarized, e.g. "status.containerStatuses.restartCount".
 
         Returns:
-            The result of the API call as JSON
+            The result of the API call as JSON. Near-miss tool names and
+            argument types are corrected when unambiguous; the result is
+            then wrapped as {"corrections": [...], "result": ...}.
+            Kubernetes lists are paged automatically up to a size budget;
+            their "pagination" field says whether they were truncated and
+            gives the "continue" argument for the rest. Responses still
+            too large are replaced by a summary ("summary": true) of their
+            items: count, value histograms per field, the top items by
+            top_by and a sample.
         """
         return await workflow.execute_activity(
             'utcp-call-operation',
-            _CallOperationArguments(service_name, tool_name, arguments),
+            _CallOperationArguments(service_name, tool_name, arguments, fields, top_by),
             result_type=str,
             **activity_config,
         )
 
-    return [list_operations, search_operations, get_operation_details, call_operation]
+    tools = [list_operations, search_operations, get_operation_details, call_operation]
+
+    service_type = (service_config.service_type if service_config else '') or service_name
+    if service_type == 'kubernetes':
+
+        @function_tool(name_override=f'find_{service_name}_operation')
+        async def find_operation(
+            kind: str,
+            verb: str = 'list',
+            namespaced: bool | None = None,
+            subresource: str = '',
+            group: str = '',
+            version: str = '',
+        ) -> str:
+            """Find the exact Kubernetes operation for a kind, without searching.
+
+            Examples: kind="Pod", verb="list", namespaced=true ->
+            listCoreV1NamespacedPod; kind="Pod", verb="read",
+            subresource="log" -> readCoreV1NamespacedPodLog.
+
+            Args:
+                kind: Resource kind or plural name (e.g., "Pod", "deployments")
+                verb: "list" (a collection), "read" (one object), "watch" or
+                    "connect"
+                namespaced: true for one namespace, false for cluster-scoped
+                    kinds or all namespaces, null for either
+                subresource: Subresource (e.g., "status", "log", "scale"),
+                    empty for the object itself
+                group: Optional API group (e.g., "apps", "core"); empty for any
+                version: Optional API version (e.g., "v1"); empty for the
+                    most stable
+
+            Returns:
+                JSON with the operation name and its group, version, kind,
+                scope and path, plus alternatives; or, if nothing matches,
+                what is available for the kind.
+            """
+            return await workflow.execute_activity(
+                'utcp-find-kubernetes-operation',
+                _FindKubernetesOperationArguments(
+                    service_name, kind, verb, namespaced, subresource, group, version
+                ),
+                result_type=str,
+                **activity_config,
+            )
+
+        tools.append(find_operation)
+
+    return tools
+
+
+def create_unified_search_tool(
+    service_names: Sequence[str] | None = None,
+    config: ActivityConfig | None = None,
+) -> Callable:
+    """Create a tool searching several UTCP services at once.
+
+    One tool call (and one activity) searches every service and returns a
+    single ranked list, instead of one search_{service}_operations call per
+    service.
+
+    Args:
+        service_names: Services to search (default: all registered services)
+        config: Optional activity configuration
+
+    Returns:
+        The search_operations function tool
+    """
+    activity_config = config or ActivityConfig(start_to_close_timeout=timedelta(seconds=60))
+    services = list(service_names or [])
+
+    @function_tool(name_override='search_operations')
+    async def search_operations(query: str, limit: int = 20) -> str:
+        """Search the API operations of all services at once.
+
+        Use this to find operations when the question spans services or you
+        are unsure which service has them. Then use the matching service's
+        tools, e.g. get_kubernetes_operation_details and
+        call_kubernetes_operation for a "kubernetes." operation.
+
+        Args:
+            query: Natural language description of what you want to do
+                   (e.g., "list pods", "get dashboard", "cluster status")
+            limit: Maximum number of operations to return
+                   (default: 20, max: 50)
+
+        Returns:
+            JSON with the best matching operations of all services (name,
+            service, tags, description), best first.
+        """
+        return await workflow.execute_activity(
+            'utcp-search-all-operations',
+            _SearchAllOperationsArguments(query, limit, services),
+            result_type=str,
+            **activity_config,
+        )
+
+    return search_operations
 
 
 # =============================================================================
@@ -391,18 +762,6 @@ def create_utcp_workflow_tools(
 
 def _serialize_result(result: Any) -> str:
     """Serialize a result to JSON string."""
-    if isinstance(result, (dict, list)):
-        return json.dumps(result, indent=2)
+    if isinstance(result, dict | list):
+        return serialization.dumps(result)
     return str(result)
-
-
-def _serialize_schema(obj: Any) -> dict:
-    """Recursively serialize JsonSchema objects to dicts."""
-    if hasattr(obj, 'model_dump'):
-        data = obj.model_dump()
-        return _serialize_schema(data)
-    elif isinstance(obj, dict):
-        return {k: _serialize_schema(v) for k, v in obj.items() if v is not None}
-    elif isinstance(obj, list):
-        return [_serialize_schema(item) for item in obj]
-    return obj
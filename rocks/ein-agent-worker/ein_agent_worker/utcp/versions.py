@@ -0,0 +1,26 @@
+"""Identities of the code a converted manual depends on.
+
+Cached manuals, compiled bundles and shared operation sets are only valid
+for the utcp-http converter and the OpenAPI handler that produced them, so
+their keys include both.
+"""
+
+import functools
+from importlib import metadata
+
+from ein_agent_worker.utcp.openapi_handlers import OpenApiHandler
+
+
+@functools.cache
+def utcp_http_version() -> str:
+    """Return the installed utcp-http version."""
+    try:
+        return metadata.version('utcp-http')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def handler_id(handler: OpenApiHandler) -> str:
+    """Return the qualified class name of an OpenAPI handler."""
+    handler_cls = type(handler)
+    return f'{handler_cls.__module__}.{handler_cls.__qualname__}'
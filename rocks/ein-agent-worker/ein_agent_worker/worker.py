@@ -1,34 +1,88 @@
-"""Temporal worker for Ein Agent."""
+"""Temporal worker for Ein Agent.
+
+Configuration:
+    TEMPORAL_HOST: Temporal server address (default: localhost:7233)
+    TEMPORAL_NAMESPACE: Temporal namespace (default: default)
+    TEMPORAL_QUEUE: Task queue to poll (default: ein-agent-queue)
+    EIN_AGENT_MODEL: LLM model to use
+    EIN_AGENT_METRICS_BIND_ADDRESS: Serve Temporal and worker metrics for
+        Prometheus on this address, e.g. '0.0.0.0:9000' (default: disabled)
+
+Startup imports are kept to what UTCP initialization needs. The agent
+stack (OpenAI Agents SDK, Temporal plugin, workflows), which takes seconds
+to import, is imported in a thread while the UTCP services initialize, and
+LiteLLM is imported in the background once the worker polls. Profile with
+`just profile-imports` and check for regressions with `just benchmark-startup`.
+"""
 
 import asyncio
+import importlib
 import logging
 import os
+import signal
 from datetime import timedelta
 
-from temporalio.client import Client
-from temporalio.common import RetryPolicy
-from temporalio.contrib.openai_agents import ModelActivityParameters, OpenAIAgentsPlugin
-from temporalio.worker import Worker
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 
-from ein_agent_worker.activities.alertmanager import fetch_alerts_activity
-from ein_agent_worker.activities.worker_config import load_utcp_config, load_worker_model
-from ein_agent_worker.models.gemini_litellm_provider import GeminiCompatibleLitellmProvider
 from ein_agent_worker.models.hitl import DEFAULT_MODEL
-from ein_agent_worker.utcp import registry as utcp_registry
+from ein_agent_worker.utcp import http_pool, memo, startup_report
 from ein_agent_worker.utcp.config import UTCPConfig
 from ein_agent_worker.utcp.loader import ToolLoader
-from ein_agent_worker.utcp.temporal_utcp import get_utcp_activities
-from ein_agent_worker.workflows.human_in_the_loop import HumanInTheLoopWorkflow
+from ein_agent_worker.utcp.reload import ServiceReloader, initialize_service, set_reloader
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Modules needed to connect and create the worker, but not to initialize
+# UTCP clients; imported off the event loop by _import_agent_stack()
+_AGENT_STACK_MODULES = (
+    'temporalio.client',
+    'temporalio.worker',
+    'temporalio.contrib.openai_agents',
+    'ein_agent_worker.activities.alertmanager',
+    'ein_agent_worker.activities.worker_config',
+    'ein_agent_worker.models.gemini_litellm_provider',
+    'ein_agent_worker.utcp.temporal_utcp',
+    'ein_agent_worker.workflows.human_in_the_loop',
+)
 
-async def initialize_utcp_clients() -> None:
+# Only needed by the first model call
+_MODEL_MODULE = 'ein_agent_worker.models.gemini_litellm_model'
+
+
+# Background initialization tasks for non-critical UTCP services.
+# Held here so the tasks are not garbage collected while still running.
+_utcp_background_tasks: set[asyncio.Task] = set()
+
+
+def _import_agent_stack() -> None:
+    """Import the modules the worker needs besides the UTCP clients."""
+    for module in _AGENT_STACK_MODULES:
+        importlib.import_module(module)
+
+
+async def _preload_model_module() -> None:
+    """Import LiteLLM ahead of the first model call, off the event loop."""
+    try:
+        await asyncio.to_thread(importlib.import_module, _MODEL_MODULE)
+    except Exception:
+        logger.exception('Failed to preload %s', _MODEL_MODULE)
+
+
+async def initialize_utcp_clients(loader: ToolLoader) -> None:
     """Initialize UTCP clients at worker startup.
 
     This runs outside the Temporal workflow sandbox, so network I/O is allowed.
     Clients are stored in the registry for workflows to access.
+
+    All services are initialized concurrently, each within its own
+    init_timeout. This returns once every critical service has finished
+    (successfully or not); non-critical services keep initializing in the
+    background and appear in the registry when ready, so only workflows
+    started after that point get their tools.
+
+    Args:
+        loader: The tool loader to create clients with.
     """
     config = UTCPConfig.from_env()
 
@@ -37,27 +91,25 @@ async def initialize_utcp_clients() -> None:
         return
 
     logger.info('Initializing %d UTCP service(s)', len(config.enabled_services))
-    loader = ToolLoader()
+    startup_report.start_tracing()
 
+    critical_tasks = []
     for svc in config.enabled_services:
-        try:
-            client = await loader.create_client(
-                service_name=svc.name,
-                openapi_url=svc.openapi_url,
-                auth_type=svc.auth_type,
-                token=svc.token,
-                insecure=svc.insecure,
-                version=svc.version,
-                spec_source=svc.spec_source,
-            )
-            # Register client along with its config (for approval policy)
-            utcp_registry.register_client(svc.name, client, config=svc)
-        except Exception as e:
-            logger.error(
-                'Failed to initialize UTCP client for %s: %s',
-                svc.name,
-                e,
-            )
+        task = asyncio.create_task(initialize_service(loader, svc), name=f'utcp-init-{svc.name}')
+        if svc.critical:
+            critical_tasks.append(task)
+        else:
+            _utcp_background_tasks.add(task)
+            task.add_done_callback(_utcp_background_tasks.discard)
+
+    await asyncio.gather(*critical_tasks)
+    startup_report.log_summary()
+
+    if _utcp_background_tasks:
+        logger.info(
+            'Critical UTCP services ready; %d service(s) still initializing in background',
+            len(_utcp_background_tasks),
+        )
 
 
 async def main():
@@ -70,9 +122,50 @@ async def main():
 
     logger.info('Using LLM model: %s', model)
 
+    # Serve metrics (Temporal's, the UTCP startup reports, memo hit rates and
+    # connection pool usage) if configured; the runtime must be set up before
+    # anything else uses it
+    metrics_address = os.getenv('EIN_AGENT_METRICS_BIND_ADDRESS', '')
+    if metrics_address:
+        runtime = Runtime(
+            telemetry=TelemetryConfig(metrics=PrometheusConfig(bind_address=metrics_address))
+        )
+        Runtime.set_default(runtime)
+        startup_report.set_metric_meter(runtime.metric_meter)
+        memo.set_metric_meter(runtime.metric_meter)
+        http_pool.set_metric_meter(runtime.metric_meter)
+        logger.info('Serving metrics on %s', metrics_address)
+
     # Initialize UTCP clients at startup (before workflows run)
-    # This allows network I/O outside the Temporal sandbox
-    await initialize_utcp_clients()
+    # This allows network I/O outside the Temporal sandbox.
+    # Runs concurrently with connecting to Temporal.
+    loader = ToolLoader()
+    utcp_init = asyncio.create_task(initialize_utcp_clients(loader))
+
+    # Reload UTCP services on SIGHUP, config file changes or the reload activity
+    reloader = ServiceReloader(loader)
+    set_reloader(reloader)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reloader.request_reload)
+    except (NotImplementedError, AttributeError):
+        logger.warning('SIGHUP reload is not supported on this platform')
+
+    # Import the agent stack while the UTCP services initialize
+    await asyncio.to_thread(_import_agent_stack)
+    from temporalio.client import Client
+    from temporalio.common import RetryPolicy
+    from temporalio.contrib.openai_agents import ModelActivityParameters, OpenAIAgentsPlugin
+    from temporalio.worker import Worker
+
+    from ein_agent_worker.activities.alertmanager import fetch_alerts_activity
+    from ein_agent_worker.activities.worker_config import (
+        load_utcp_config,
+        load_worker_model,
+        reload_utcp_services,
+    )
+    from ein_agent_worker.models.gemini_litellm_provider import GeminiCompatibleLitellmProvider
+    from ein_agent_worker.utcp.temporal_utcp import get_utcp_activities
+    from ein_agent_worker.workflows.human_in_the_loop import HumanInTheLoopWorkflow
 
     # Create Temporal client
     client = await Client.connect(
@@ -95,6 +188,10 @@ async def main():
         ],
     )
 
+    # Start polling only once the critical UTCP services are ready
+    await utcp_init
+    config_watch = asyncio.create_task(reloader.watch_config_file(), name='utcp-config-watch')
+
     # Create worker
     worker = Worker(
         client,
@@ -105,13 +202,22 @@ async def main():
         activities=[
             load_worker_model,
             load_utcp_config,
+            reload_utcp_services,
             fetch_alerts_activity,
             *get_utcp_activities(),
         ],
     )
 
     logger.info('Worker started successfully on queue: %s', queue)
-    await worker.run()
+    model_preload = asyncio.create_task(_preload_model_module(), name='model-preload')
+    try:
+        await worker.run()
+    finally:
+        config_watch.cancel()
+        model_preload.cancel()
+        logger.info('UTCP memo statistics: %s', memo.stats())
+        logger.info('UTCP connection pool statistics: %s', http_pool.stats())
+        await http_pool.close_all()
 
 
 if __name__ == '__main__':
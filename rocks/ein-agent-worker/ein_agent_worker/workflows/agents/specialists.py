@@ -55,11 +55,16 @@ You have access to tools for querying the Kubernetes API:
 - `list_kubernetes_operations` - List available K8s API operations \
 (with pagination and tag filtering)
 - `search_kubernetes_operations` - Search for K8s API operations by keyword
+- `find_kubernetes_operation` - Find the exact operation for a kind \
+(e.g., kind="Pod", verb="list", namespaced=true)
 - `get_kubernetes_operation_details` - Get parameter schema for a K8s operation
 - `call_kubernetes_operation` - Execute a K8s API operation
 
-TIP: Use `list_kubernetes_operations` to browse available tools efficiently. \
-Use `search_kubernetes_operations` when you know what you're looking for.
+TIP: Use `find_kubernetes_operation` when you know the resource kind. \
+Use `search_kubernetes_operations` when you know what you're looking for, \
+and `list_kubernetes_operations` with mode="facets" to browse. \
+For list calls, pass `fields` to keep only what you need \
+(e.g., fields="items.metadata.name,items.status.phase").
 
 Use Kubernetes tools to investigate:
 - Pod status, events, logs
@@ -125,6 +130,8 @@ You have access to tools for querying Ceph and Kubernetes APIs:
 List available API operations (with pagination and tag filtering)
 - `search_ceph_operations` / `search_kubernetes_operations` - \
 Search for API operations by keyword
+- `find_kubernetes_operation` - Find the exact Kubernetes operation for a kind \
+(e.g., kind="PersistentVolumeClaim", verb="list", namespaced=true)
 - `get_ceph_operation_details` / `get_kubernetes_operation_details` - Get parameter schema
 - `call_ceph_operation` / `call_kubernetes_operation` - Execute an API operation
 
@@ -201,11 +208,16 @@ You have access to tools for querying the Kubernetes API:
 - `list_kubernetes_operations` - List available K8s API operations \
 (with pagination and tag filtering)
 - `search_kubernetes_operations` - Search for K8s API operations by keyword
+- `find_kubernetes_operation` - Find the exact operation for a kind \
+(e.g., kind="Pod", verb="list", namespaced=true)
 - `get_kubernetes_operation_details` - Get parameter schema for an operation
 - `call_kubernetes_operation` - Execute a K8s API operation
 
-TIP: Use `list_kubernetes_operations` to browse available tools efficiently. \
-Use `search_kubernetes_operations` when you know what you're looking for.
+TIP: Use `find_kubernetes_operation` when you know the resource kind. \
+Use `search_kubernetes_operations` when you know what you're looking for, \
+and `list_kubernetes_operations` with mode="facets" to browse. \
+For list calls, pass `fields` to keep only what you need \
+(e.g., fields="items.metadata.name,items.status.phase").
 
 Use these tools to investigate:
 - Service endpoints and port mappings
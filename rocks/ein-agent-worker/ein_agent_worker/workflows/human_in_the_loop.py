@@ -30,7 +30,10 @@ with workflow.unsafe.imports_passed_through():
     from ein_agent_worker.activities.worker_config import load_worker_model
     from ein_agent_worker.models.gemini_litellm_provider import GeminiCompatibleLitellmProvider
     from ein_agent_worker.utcp import registry as utcp_registry
-    from ein_agent_worker.utcp.temporal_utcp import create_utcp_workflow_tools
+    from ein_agent_worker.utcp.temporal_utcp import (
+        create_unified_search_tool,
+        create_utcp_workflow_tools,
+    )
     from ein_agent_worker.workflows.agents.shared_context_tools import (
         create_shared_context_tools,
     )
@@ -50,7 +53,10 @@ You are the Investigation Assistant (The Orchestrator).
 ## Your Capabilities
 - **Fetch Alerts**: Use `fetch_alerts` to get current firing alerts.
 - **Direct Infrastructure Access**: You have UTCP tools to query infrastructure directly:
-  - **Kubernetes**: Use `search_kubernetes_operations`, \
+  - **All services**: Use `search_operations` to search the operations of every \
+service at once; results carry their service prefix (e.g., `kubernetes.`)
+  - **Kubernetes**: Use `find_kubernetes_operation` (by kind, e.g. kind="Pod", \
+verb="list") or `search_kubernetes_operations`, then \
 `get_kubernetes_operation_details`, `call_kubernetes_operation`
   - **Ceph** (if enabled): Use `search_ceph_operations`, \
 `get_ceph_operation_details`, `call_ceph_operation`
@@ -71,7 +77,7 @@ formatted summary of all investigation findings.
 1. **Analyze User Request**: Determine if the user wants to investigate a \
 specific alert or has a general infrastructure question.
 2. **Answer Simple Queries Directly**: For straightforward requests, use UTCP tools directly:
-   - "show kubernetes pods" -> Use `search_kubernetes_operations` + `call_kubernetes_operation`
+   - "show kubernetes pods" -> Use `find_kubernetes_operation` + `call_kubernetes_operation`
    - "check ceph health" -> Use `search_ceph_operations` + `call_ceph_operation`
 3. **Delegate Observability Queries**: For ANY Grafana, Prometheus, or Loki queries, \
 hand off to ObservabilitySpecialist:
@@ -88,6 +94,9 @@ to consolidate related findings.
 session unless the user explicitly asks to stop.
 
 ## CRITICAL RULES
+- **SEARCH ONCE ACROSS SERVICES**: When unsure which service has an operation, \
+or the question spans services, use `search_operations` instead of calling \
+each `search_*_operations` tool.
 - **USE UTCP TOOLS DIRECTLY**: For simple Kubernetes/Ceph queries (list, show, get), \
 use your UTCP tools directly. No need to delegate.
 - **ALWAYS DELEGATE OBSERVABILITY**: Grafana, Prometheus, and Loki queries must \
@@ -443,13 +452,15 @@ class HumanInTheLoopWorkflow:
             domain: The domain type
 
         Returns:
-            List of UTCP tools for the domain's services
+            List of UTCP tools for the domain's services, plus a
+            search_operations tool across them if there are several
         """
         tools = []
-        services = DOMAIN_UTCP_SERVICES.get(domain, set())
+        services = sorted(DOMAIN_UTCP_SERVICES.get(domain, set()) & self._utcp_tools.keys())
         for service in services:
-            if service in self._utcp_tools:
-                tools.extend(self._utcp_tools[service])
+            tools.extend(self._utcp_tools[service])
+        if len(services) > 1:
+            tools.append(create_unified_search_tool(services))
         return tools
 
     # =========================================================================
@@ -559,6 +570,9 @@ class HumanInTheLoopWorkflow:
         all_utcp_tools = []
         for service_name in self._utcp_tools:
             all_utcp_tools.extend(self._utcp_tools[service_name])
+        if self._utcp_tools:
+            # One search across all services, instead of one call per service
+            all_utcp_tools.append(create_unified_search_tool(list(self._utcp_tools)))
         workflow.logger.info(f'Investigation Agent has {len(all_utcp_tools)} UTCP tools')
 
         # Create tools for ComputeSpecialist (shared context + UTCP tools)
@@ -0,0 +1,99 @@
+"""Report where import time goes, like `python -X importtime` but readable.
+
+Imports a module in a fresh interpreter with -X importtime and prints the
+total, the slowest top-level packages and the modules with the most self
+time. Exits non-zero if the total exceeds --budget.
+
+Usage:
+    python scripts/profile_imports.py ein_agent_worker.worker --top 15 --budget 1.5
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportRecord:
+    """One line of -X importtime output (times in seconds)."""
+
+    name: str
+    depth: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+def profile(module: str) -> list[ImportRecord]:
+    """Import a module in a fresh interpreter and parse -X importtime output.
+
+    Args:
+        module: Dotted module name.
+
+    Returns:
+        One record per imported module, in import order.
+
+    Raises:
+        RuntimeError: If the import failed.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Importing {module} failed:\n{result.stderr[-2000:]}')
+
+    records = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|', 2)
+        records.append(
+            ImportRecord(
+                name=name.strip(),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+                self_seconds=int(self_us) / 1e6,
+                cumulative_seconds=int(cumulative_us) / 1e6,
+            )
+        )
+    return records
+
+
+def print_report(module: str, records: list[ImportRecord], top: int) -> float:
+    """Print the report and return the total import time in seconds."""
+    total = sum(r.cumulative_seconds for r in records if r.depth == 0)
+
+    by_package: dict[str, float] = {}
+    for record in records:
+        package = record.name.split('.')[0]
+        by_package[package] = by_package.get(package, 0.0) + record.self_seconds
+
+    print(f'Importing {module}: {total:.3f}s, {len(records)} modules')
+    print(f'\nSlowest packages (self time of all their modules, top {top}):')
+    for package, seconds in sorted(by_package.items(), key=lambda i: i[1], reverse=True)[:top]:
+        print(f'  {seconds:8.3f}s  {package}')
+    print(f'\nSlowest modules (self time, top {top}):')
+    for record in sorted(records, key=lambda r: r.self_seconds, reverse=True)[:top]:
+        print(f'  {record.self_seconds:8.3f}s  {record.name}')
+    return total
+
+
+def main() -> int:
+    """Run the profiler."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('module', nargs='?', default='ein_agent_worker.worker')
+    parser.add_argument('--top', type=int, default=15, help='Entries per section')
+    parser.add_argument('--budget', type=float, help='Fail if the import takes longer (seconds)')
+    args = parser.parse_args()
+
+    total = print_report(args.module, profile(args.module), args.top)
+    if args.budget is not None and total > args.budget:
+        print(f'\nFAIL: {total:.3f}s exceeds the {args.budget:.3f}s budget')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Compare the throughput of the UTCP result serializers.
+
+Serializes Kubernetes list responses with each available serializer (see
+ein_agent_worker/utcp/serialization.py), and with the previous
+pretty-printed stdlib json as the baseline, and reports the median
+throughput and output size of each. Record responses with e.g.:
+
+    kubectl get --raw '/api/v1/pods' > pods.json
+    kubectl get --raw '/apis/apps/v1/deployments' > deployments.json
+
+Without recorded responses, a synthetic PodList is generated.
+
+Usage:
+    python scripts/serialization_benchmark.py pods.json deployments.json --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from ein_agent_worker.utcp import serialization
+
+
+def baseline(value: Any) -> str:
+    """The previous serialization of UTCP results."""
+    return json.dumps(value, indent=2)
+
+
+def synthetic_pod_list(pods: int) -> dict[str, Any]:
+    """Generate a PodList shaped like a real one, managedFields included."""
+    items = []
+    for i in range(pods):
+        name = f'app-{i % 40}-{i:05d}'
+        item = {
+            'metadata': {
+                'name': name,
+                'namespace': f'namespace-{i % 12}',
+                'uid': f'{i:08x}-7c1e-4b4a-9d7e-0242ac120002',
+                'resourceVersion': str(100000 + i),
+                'creationTimestamp': '2026-01-01T00:00:00Z',
+                'labels': {'app': f'app-{i % 40}', 'pod-template-hash': f'{i % 997:x}'},
+                'ownerReferences': [
+                    {'apiVersion': 'apps/v1', 'kind': 'ReplicaSet', 'name': f'app-{i % 40}'}
+                ],
+                'managedFields': [
+                    {
+                        'manager': 'kube-controller-manager',
+                        'operation': 'Update',
+                        'apiVersion': 'v1',
+                        'fieldsType': 'FieldsV1',
+                        'fieldsV1': {'f:metadata': {'f:labels': {'.': {}, 'f:app': {}}}},
+                    }
+                ],
+            },
+            'spec': {
+                'nodeName': f'node-{i % 30}',
+                'containers': [
+                    {
+                        'name': 'app',
+                        'image': f'registry.example.com/app:{i % 5}',
+                        'resources': {'requests': {'cpu': '100m', 'memory': '128Mi'}},
+                        'env': [{'name': 'LOG_LEVEL', 'value': 'info'}],
+                    }
+                ],
+            },
+            'status': {
+                'phase': 'Running' if i % 50 else 'Pending',
+                'podIP': f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}',
+                'conditions': [
+                    {'type': 'Ready', 'status': 'True' if i % 50 else 'False'},
+                    {'type': 'ContainersReady', 'status': 'True'},
+                ],
+                'containerStatuses': [
+                    {'name': 'app', 'ready': bool(i % 50), 'restartCount': i % 7}
+                ],
+            },
+        }
+        items.append(item)
+    return {'kind': 'PodList', 'apiVersion': 'v1', 'metadata': {}, 'items': items}
+
+
+def measure(serialize, value: Any, runs: int) -> tuple[float, int]:
+    """Return the median seconds to serialize a value, and the output's size in bytes."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = serialize(value)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), len(output.encode())
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('responses', nargs='*', type=Path, help='Recorded JSON responses')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--pods', type=int, default=3000, help='Size of the synthetic PodList')
+    args = parser.parse_args()
+
+    responses = {path.name: json.loads(path.read_text()) for path in args.responses}
+    if not responses:
+        responses[f'synthetic {args.pods} pods'] = synthetic_pod_list(args.pods)
+
+    serializers = {'baseline (indent=2)': baseline}
+    serializers.update(
+        (name, serialization.get_serializer(name))
+        for name in serialization.available_serializers()
+        if name != 'pretty'
+    )
+
+    for response_name, value in responses.items():
+        print(response_name)
+        results = {
+            name: measure(serialize, value, args.runs) for name, serialize in serializers.items()
+        }
+        base_seconds, base_size = results['baseline (indent=2)']
+        for name, (seconds, size) in results.items():
+            print(
+                f'  {name:>20}: {size / seconds / 1e6:8.1f} MB/s {seconds * 1000:8.1f} ms '
+                f'{size / 1e6:7.2f} MB  x{base_seconds / seconds:4.1f} speed '
+                f'{size / base_size:4.0%} size'
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Fail if worker startup regresses.
+
+Measures, over several fresh processes (median):
+
+- import: importing ein_agent_worker.worker
+- first poll: starting `python -m ein_agent_worker.worker` until it logs
+  that it is about to poll its task queue
+
+The first-poll run needs a Temporal server. Without --temporal-host, a
+local dev server is started with temporalio.testing (which downloads the
+Temporal CLI on first use). UTCP services are whatever the environment
+configures; unset UTCP_SERVICES to measure the worker alone.
+
+Usage:
+    python scripts/startup_benchmark.py --runs 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Budgets in seconds, with headroom for slower CI machines
+IMPORT_BUDGET = 1.5
+FIRST_POLL_BUDGET = 10.0
+
+READY_MESSAGE = 'Worker started successfully on queue'
+
+
+def time_import(runs: int) -> float:
+    """Return the median time to import the worker module in a fresh process."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-c', 'import ein_agent_worker.worker'],
+            check=True,
+            capture_output=True,
+        )
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def _time_first_poll_once(env: dict[str, str], timeout: float) -> float:
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        '-m',
+        'ein_agent_worker.worker',
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            while line := await process.stderr.readline():
+                if READY_MESSAGE in line.decode(errors='replace'):
+                    return time.perf_counter() - start
+        raise RuntimeError(f'Worker exited with {await process.wait()} before polling')
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def time_first_poll(runs: int, temporal_host: str | None, timeout: float) -> float:
+    """Return the median time from worker start to polling."""
+    env = dict(os.environ)
+    if temporal_host:
+        env['TEMPORAL_HOST'] = temporal_host
+        return statistics.median([await _time_first_poll_once(env, timeout) for _ in range(runs)])
+
+    from temporalio.testing import WorkflowEnvironment
+
+    async with await WorkflowEnvironment.start_local() as server:
+        env['TEMPORAL_HOST'] = server.client.service_client.config.target_host
+        return statistics.median([await _time_first_poll_once(env, timeout) for _ in range(runs)])
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--temporal-host', help='Use this server instead of a local dev server')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET)
+    parser.add_argument('--first-poll-budget', type=float, default=FIRST_POLL_BUDGET)
+    parser.add_argument(
+        '--skip-first-poll', action='store_true', help='Only measure the import time'
+    )
+    args = parser.parse_args()
+
+    results = {'import': (time_import(args.runs), args.import_budget)}
+    if not args.skip_first_poll:
+        first_poll = asyncio.run(
+            time_first_poll(args.runs, args.temporal_host, timeout=args.first_poll_budget * 3)
+        )
+        results['first poll'] = (first_poll, args.first_poll_budget)
+
+    failed = False
+    for name, (seconds, budget) in results.items():
+        status = 'ok' if seconds <= budget else 'FAIL'
+        failed |= seconds > budget
+        print(f'{name:>10}: {seconds:6.3f}s (budget {budget:.3f}s) {status}')
+    if failed:
+        print('Startup regressed; see `just profile-imports` for where import time goes')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())